@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+from typing import Iterator
+
+import pytest
+
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeBackend
+from pyplantsim.backends import FakeModel
+
+from .models import NETWORK
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--com-latency",
+        type=float,
+        default=0.0,
+        help="Seconds every call of the simulated RemoteControl blocks (default: 0).",
+    )
+
+
+def pytest_benchmark_update_machine_info(
+    config: pytest.Config, machine_info: dict[str, Any]
+) -> None:
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version
+
+    try:
+        machine_info["pyplantsim"] = version("pyplantsim")
+    except PackageNotFoundError:
+        machine_info["pyplantsim"] = "unknown"
+    machine_info["com_latency"] = config.getoption("--com-latency")
+
+
+@pytest.fixture(scope="session")
+def com_latency(request: pytest.FixtureRequest) -> float:
+    return float(request.config.getoption("--com-latency"))
+
+
+@pytest.fixture(scope="session")
+def model_file(tmp_path_factory: pytest.TempPathFactory) -> str:
+    path = tmp_path_factory.mktemp("model") / "benchmark.spp"
+    path.touch()
+    return str(path)
+
+
+@pytest.fixture
+def make_plantsim(com_latency: float, model_file: str) -> Iterator[Callable[..., Plantsim]]:
+    instances: list[Plantsim] = []
+
+    def factory(model: FakeModel, event_polling_interval: float = 0.001) -> Plantsim:
+        backend = FakeBackend(model_factory=lambda _: model, latency=com_latency)
+        instance = Plantsim(backend=backend, event_polling_interval=event_polling_interval)
+        instance.load_model(model_file)
+        instance.set_network(NETWORK, set_event_controller=True)
+        instances.append(instance)
+        return instance
+
+    yield factory
+
+    for instance in instances:
+        instance.stop()
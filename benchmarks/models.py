@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from plantsimpath import PlantsimPath
+
+from pyplantsim.backends import FakeTable
+
+
+NETWORK = PlantsimPath(".Models.Model")
+
+
+def _cell(row: int, col: int, cols: int) -> int | float | str:
+    match col % 3:
+        case 0:
+            return row * cols + col
+        case 1:
+            return row + col / 10
+        case _:
+            return f"s{row % 7}"
+
+
+def make_table(rows: int, cols: int) -> FakeTable:
+    """
+    Create a table with a column index and alternating integer, real and string columns.
+    """
+    data = [[_cell(row, col, cols) for col in range(cols)] for row in range(rows)]
+    return FakeTable(data, columns=[f"c{col}" for col in range(cols)])
+
+
+def make_numeric_table(rows: int, cols: int) -> FakeTable:
+    """
+    Create a table with a column index and alternating integer and real columns.
+    """
+    data = [
+        [row * cols + col if col % 2 == 0 else row + col / 10 for col in range(cols)]
+        for row in range(rows)
+    ]
+    return FakeTable(data, columns=[f"c{col}" for col in range(cols)])
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyplantsim import CallCycle
+from pyplantsim import CallCycleTable
+from pyplantsim import Plantsim
+from pyplantsim import write_collapsed
+from pyplantsim import write_pstats
+from pyplantsim import write_speedscope
+from pyplantsim.backends import FakeModel
+
+
+def make_call_cycles(methods: int, callers: int) -> dict[str, Any]:
+    return {
+        "CallCycles": [
+            {
+                "Method": {
+                    "Method": f".Models.Model.Method{i}",
+                    "Called": 100 + i,
+                    "Self": i,
+                    "SelfTime": i * 0.001,
+                    "CalleesTime": i * 0.002,
+                },
+                "Callers": [
+                    {
+                        "Caller": f".Models.Model.Method{(i + j + 1) % methods}",
+                        "Called": j + 1,
+                        "SelfTime": j * 0.0001,
+                        "CalleesTime": j * 0.0002,
+                    }
+                    for j in range(callers)
+                ],
+            }
+            for i in range(methods)
+        ]
+    }
+
+
+@pytest.mark.parametrize("methods", [100, 1000, 10000])
+def test_read_call_cycles(
+    benchmark: BenchmarkFixture, make_plantsim: Callable[[FakeModel], Plantsim], methods: int
+) -> None:
+    plantsim = make_plantsim(FakeModel(call_cycles=make_call_cycles(methods, callers=5)))
+
+    call_cycles = benchmark(plantsim.read_call_cycles)
+
+    assert len(call_cycles) == methods
+
+
+@pytest.mark.parametrize("methods", [100, 1000, 10000])
+def test_read_call_cycle_table(
+    benchmark: BenchmarkFixture, make_plantsim: Callable[[FakeModel], Plantsim], methods: int
+) -> None:
+    plantsim = make_plantsim(FakeModel(call_cycles=make_call_cycles(methods, callers=5)))
+
+    table = benchmark(plantsim.read_call_cycle_table)
+
+    assert len(table) == methods
+    assert len(table.callers) == methods * 5
+
+
+def test_aggregate_call_cycles(benchmark: BenchmarkFixture) -> None:
+    # Hot spots over 20 replications of a model with 1000 methods
+    raw = json.dumps(make_call_cycles(1000, callers=5))
+    tables = [CallCycleTable.from_json(raw) for _ in range(20)]
+
+    def aggregate() -> pd.DataFrame:
+        return CallCycleTable.aggregate(tables, how="mean").hot_spots("total_time")
+
+    hot_spots = benchmark(aggregate)
+
+    assert hot_spots["method"].iloc[0] == ".Models.Model.Method999"
+
+
+@pytest.mark.parametrize("export", [write_pstats, write_speedscope, write_collapsed])
+def test_export_call_cycles(
+    benchmark: BenchmarkFixture, tmp_path: Path, export: Callable[[list[CallCycle], Path], None]
+) -> None:
+    call_cycles = [CallCycle.from_dict(cc) for cc in make_call_cycles(1000, 5)["CallCycles"]]
+    target = tmp_path / "profile"
+
+    benchmark(export, call_cycles, target)
+
+    assert target.stat().st_size > 0
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from plantsimpath import PlantsimPath
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeBackend
+from pyplantsim.backends import FakeModel
+from pyplantsim.instance_handler import BaseInstanceHandler
+from pyplantsim.instance_handler import DynamicInstanceHandler
+from pyplantsim.instance_handler import FixedInstanceHandler
+from pyplantsim.instance_handler import SimulationJob
+
+from .models import NETWORK
+
+
+WORKERS = [1, 2, 4, 8, 16, 32]
+JOBS_PER_WORKER = 4
+SIMULATION_DURATION = 0.01
+
+
+def run_jobs(handler: BaseInstanceHandler, model_file: str, amount: int) -> None:
+    def on_init(instance: Plantsim) -> None:
+        if not instance.model_loaded:
+            instance.load_model(model_file)
+            instance.set_network(NETWORK, set_event_controller=True)
+
+    def on_endsim(instance: Plantsim) -> None:
+        instance.get_value(PlantsimPath(NETWORK, "Result"))
+
+    for _ in range(amount):
+        handler.queue_job(SimulationJob(on_init=on_init, on_endsim=on_endsim))
+    handler.wait_all()
+
+
+def make_backend(com_latency: float) -> FakeBackend:
+    return FakeBackend(
+        model_factory=lambda _: FakeModel(
+            values={str(PlantsimPath(NETWORK, "Result")): 1},
+            simulation_duration=SIMULATION_DURATION,
+        ),
+        latency=com_latency,
+    )
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_fixed_handler_throughput(
+    benchmark: BenchmarkFixture, com_latency: float, model_file: str, workers: int
+) -> None:
+    jobs = workers * JOBS_PER_WORKER
+    benchmark.extra_info["jobs"] = jobs
+
+    with FixedInstanceHandler(
+        workers, backend=make_backend(com_latency), event_polling_interval=0.001
+    ) as handler:
+        benchmark.pedantic(run_jobs, args=(handler, model_file, jobs), rounds=3, iterations=1)
+
+    if benchmark.enabled:
+        benchmark.extra_info["jobs_per_second"] = jobs / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_dynamic_handler_throughput(
+    benchmark: BenchmarkFixture, com_latency: float, model_file: str, workers: int
+) -> None:
+    jobs = workers * JOBS_PER_WORKER
+    benchmark.extra_info["jobs"] = jobs
+
+    # Resource limits are lifted so that the handler runs at max_instances from the start
+    with DynamicInstanceHandler(
+        max_cpu=1.0,
+        max_memory=1.0,
+        min_instances=workers,
+        max_instances=workers,
+        scale_interval=0.5,
+        backend=make_backend(com_latency),
+        event_polling_interval=0.001,
+    ) as handler:
+        benchmark.pedantic(run_jobs, args=(handler, model_file, jobs), rounds=3, iterations=1)
+
+    if benchmark.enabled:
+        benchmark.extra_info["jobs_per_second"] = jobs / benchmark.stats["mean"]
+
+
+@pytest.mark.parametrize("workers", WORKERS)
+def test_fixed_handler_startup(
+    benchmark: BenchmarkFixture, com_latency: float, model_file: str, workers: int
+) -> None:
+    def start_pool() -> None:
+        handler = FixedInstanceHandler(
+            workers,
+            backend=make_backend(com_latency),
+            event_polling_interval=0.001,
+            worker_init=lambda instance: instance.load_model(model_file),
+        )
+        with handler:
+            handler.wait_until_ready()
+
+    benchmark.pedantic(start_pool, rounds=3, iterations=1)
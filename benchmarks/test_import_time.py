@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+
+HEAVY_MODULES = ("pandas", "numpy", "psutil", "packaging.version", "http.server", "win32com")
+
+STATEMENTS = {
+    "python": "pass",
+    "pyplantsim": "import pyplantsim",
+    "instance_handler": "import pyplantsim.instance_handler",
+    # What importing pyplantsim cost while pandas was imported eagerly
+    "pyplantsim_with_pandas": "import pyplantsim, pandas",
+}
+
+
+def run_python(statement: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", statement], check=True, capture_output=True, text=True
+    )
+    return result.stdout
+
+
+@pytest.mark.parametrize("name", list(STATEMENTS))
+def test_import_time(benchmark: BenchmarkFixture, name: str) -> None:
+    """
+    Wall-clock time of a fresh interpreter running the import statement.
+    """
+    benchmark.pedantic(run_python, args=(STATEMENTS[name],), rounds=10, iterations=1)
+
+
+@pytest.mark.parametrize("module", ["pyplantsim", "pyplantsim.instance_handler"])
+def test_heavy_dependencies_are_not_imported(module: str) -> None:
+    loaded = run_python(
+        f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    ).strip()
+
+    assert loaded == ""
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+from plantsimpath import PlantsimPath
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeModel
+
+
+SOURCE = "-> integer\n\nreturn 1"
+
+
+def test_execute_sim_talk(
+    benchmark: BenchmarkFixture, make_plantsim: Callable[[FakeModel], Plantsim]
+) -> None:
+    plantsim = make_plantsim(FakeModel())
+    plantsim.backend.register_simtalk(SOURCE, lambda rc: 1)  # type: ignore[attr-defined]
+
+    assert benchmark(plantsim.execute_sim_talk, SOURCE) == 1
+
+
+def test_execute_sim_talk_with_parameters(
+    benchmark: BenchmarkFixture, make_plantsim: Callable[[FakeModel], Plantsim]
+) -> None:
+    plantsim = make_plantsim(FakeModel())
+    plantsim.backend.register_simtalk(SOURCE, lambda rc, *args: len(args))  # type: ignore[attr-defined]
+
+    assert benchmark(plantsim.execute_sim_talk, SOURCE, 1, "a", 2.5) == 3
+
+
+def test_subscription_delivery(
+    benchmark: BenchmarkFixture, make_plantsim: Callable[[FakeModel], Plantsim]
+) -> None:
+    path = PlantsimPath(".Models.Model.Buffer", "NumMU")
+    plantsim = make_plantsim(FakeModel(values={str(path): 0}))
+    received: list[dict[str, Any]] = []
+    plantsim.subscribe([path], received.append)
+
+    # Every write of the attribute is pushed from the model as a change message
+    benchmark(plantsim.set_value, path, 1)
+
+    assert received[-1] == {str(path): 1}
+
+
+def test_message_channel(
+    benchmark: BenchmarkFixture, make_plantsim: Callable[[FakeModel], Plantsim]
+) -> None:
+    plantsim = make_plantsim(FakeModel())
+    channel = plantsim.open_message_channel(batch_size=1000)
+    model = plantsim._instance
+    benchmark.extra_info["messages"] = 10_000
+
+    def send_and_consume() -> int:
+        # The model sends a message per entity event, fired in batches of 1000
+        for i in range(10_000):
+            model.send_channel_message(f"entry;{i}")
+        return len(channel.drain())
+
+    assert benchmark(send_and_consume) == 10_000
+
+
+def test_trace_capture(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    tmp_path: Path,
+) -> None:
+    pytest.importorskip("pyarrow")
+    station = PlantsimPath(".Models.Model.Station")
+    plantsim = make_plantsim(FakeModel(values={str(PlantsimPath(station, "NumMU")): 0}))
+    plantsim.set_event_controller(PlantsimPath(".Models.Model.EventController"))
+    benchmark.extra_info["records"] = 10_000
+
+    def capture() -> int:
+        # Alternating entries and exits, fired by the model in batches of 1000 records
+        with plantsim.start_trace([station], tmp_path / "trace.parquet") as trace:
+            for i in range(10_000):
+                plantsim._instance._write(f"{station}.NumMU", i % 2)
+        return trace.records
+
+    assert benchmark(capture) == 10_000
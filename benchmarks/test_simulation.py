@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyplantsim import ConsoleTailer
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeModel
+
+
+@pytest.mark.parametrize("event_polling_interval", [0.001, 0.01, 0.05])
+def test_run_simulation_finish_latency(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[..., Plantsim],
+    event_polling_interval: float,
+) -> None:
+    """
+    Time from starting an instantly finishing simulation until run_simulation returns.
+    """
+    plantsim = make_plantsim(
+        FakeModel(simulation_duration=0.0), event_polling_interval=event_polling_interval
+    )
+
+    benchmark.pedantic(plantsim.run_simulation, rounds=20, iterations=1)
+
+
+def test_console_tailer(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    """
+    Parse and filter a console log of 100000 lines, 1 in 10 of them errors.
+    """
+    log = tmp_path / "console.log"
+    with open(log, "w") as f:
+        for i in range(100_000):
+            level = "Error" if i % 10 == 0 else "Info"
+            f.write(f"2024-05-17 08:15:02.{i % 1000:03d} {level} .Models.Model.Method: line {i}\n")
+    benchmark.extra_info["lines"] = 100_000
+
+    def tail() -> int:
+        return ConsoleTailer(log, capacity=0, levels=["ERROR"]).poll()
+
+    assert benchmark(tail) == 10_000
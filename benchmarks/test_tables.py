@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from plantsimpath import PlantsimPath
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeModel
+
+from .models import make_numeric_table
+from .models import make_table
+from .models import NETWORK
+
+
+TABLE = PlantsimPath(NETWORK, "Table")
+SIZES = [(10, 10), (100, 10), (1000, 10)]
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_get_table(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(rows, cols)}))
+    benchmark.extra_info["cells"] = rows * cols
+
+    df = benchmark(plantsim.get_table, TABLE)
+
+    assert df.shape == (rows, cols)
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_get_table_typed(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(rows, cols)}))
+    benchmark.extra_info["cells"] = rows * cols
+
+    df = benchmark(plantsim.get_table, TABLE, typed=True)
+
+    assert df.shape == (rows, cols)
+    benchmark.extra_info["memory_bytes"] = int(df.memory_usage(deep=True).sum())
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_get_table_numeric(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_numeric_table(rows, cols)}))
+    benchmark.extra_info["cells"] = rows * cols
+
+    df = benchmark(plantsim.get_table, TABLE, typed=True, fixed_width=True)
+
+    assert df.shape == (rows, cols)
+    assert list(df.dtypes.astype(str)) == ["int64", "float64"] * (cols // 2)
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_set_table(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(rows, cols)}))
+    df = plantsim.get_table(TABLE)
+    benchmark.extra_info["cells"] = rows * cols
+
+    benchmark(plantsim.set_table, TABLE, df)
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_iter_table(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(rows, cols)}))
+    benchmark.extra_info["cells"] = rows * cols
+
+    def read() -> int:
+        return sum(len(chunk) for chunk in plantsim.iter_table(TABLE, chunk_rows=100))
+
+    assert benchmark(read) == rows
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_get_table_pushdown(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(rows, cols)}))
+    benchmark.extra_info["cells"] = rows * cols
+
+    # Column c2 holds "s0" to "s6", so a seventh of the rows match
+    df = benchmark(plantsim.get_table, TABLE, columns=["c0", "c1"], where=("c2", "=", "s0"))
+
+    assert df.shape == ((rows + 6) // 7, 2)
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_aggregate_table(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(rows, cols)}))
+    benchmark.extra_info["cells"] = rows * cols
+
+    df = benchmark(
+        plantsim.aggregate_table, TABLE, aggs={"c0": ["sum", "max"], "c1": "mean"}, group_by="c2"
+    )
+
+    assert len(df) == min(rows, 7)
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_set_table_diff(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(rows, cols)}))
+    df = plantsim.get_table(TABLE)
+    plantsim.set_table(TABLE, df, diff=True)
+    benchmark.extra_info["cells"] = rows * cols
+
+    # Alternate between two versions that differ in a single cell per replication
+    changed = df.copy()
+    changed.iat[0, 0] = -1
+    versions = iter([changed, df] * 1_000_000)
+
+    benchmark(lambda: plantsim.set_table(TABLE, next(versions), diff=True))
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_get_tables(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    # Ten result tables, as read at the end of a replication
+    paths = [PlantsimPath(NETWORK, f"Result{i}") for i in range(10)]
+    plantsim = make_plantsim(FakeModel(tables={str(p): make_table(rows, cols) for p in paths}))
+    benchmark.extra_info["cells"] = len(paths) * rows * cols
+
+    tables = benchmark(plantsim.get_tables, paths)
+
+    assert all(df.shape == (rows, cols) for df in tables.values())
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_get_table_arrow(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    pytest.importorskip("pyarrow")
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(rows, cols)}))
+    benchmark.extra_info["cells"] = rows * cols
+
+    table = benchmark(plantsim.get_table_arrow, TABLE)
+
+    assert table.shape == (rows, cols)
+    benchmark.extra_info["memory_bytes"] = table.nbytes
+
+
+@pytest.mark.parametrize("rows,cols", SIZES, ids=lambda v: str(v))
+def test_table_view(
+    benchmark: BenchmarkFixture,
+    make_plantsim: Callable[[FakeModel], Plantsim],
+    rows: int,
+    cols: int,
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(rows, cols)}))
+    benchmark.extra_info["cells"] = rows * cols
+
+    def inspect() -> int:
+        # Open a view and look at the head and tail of the table
+        view = plantsim.table_view(TABLE, page_rows=100)
+        return len(view[:10]) + len(view[-10:])
+
+    assert benchmark(inspect) == 2 * min(rows, 10)
@@ -1,10 +1,26 @@
 from .call_cycle import CallCycle
 from .call_cycle import CallCycleMethod
+from .call_cycle import CallCycleTable
 from .call_cycle import CallerEntry
+from .console_tailer import ConsoleRecord
+from .console_tailer import ConsoleTailer
 from .exception import PlantsimException
 from .exception import SimulationException
+from .instrumentation import ComCallStats
+from .instrumentation import ComProfiler
 from .licenses import PlantsimLicense
+from .message_channel import MessageChannel
+from .metadata_cache import MetadataCache
+from .model_cache import ModelCache
 from .plantsim import Plantsim
+from .profile_export import write_collapsed
+from .profile_export import write_pstats
+from .profile_export import write_speedscope
+from .subscription import Subscription
+from .table_tail import TableTail
+from .table_view import TableView
+from .trace_capture import TraceCapture
+from .trace_capture import TraceSpec
 from .versions import PlantsimVersion
 
 
@@ -17,4 +33,20 @@ __all__ = [
     "CallCycle",
     "CallerEntry",
     "CallCycleMethod",
+    "CallCycleTable",
+    "ComProfiler",
+    "ComCallStats",
+    "ModelCache",
+    "MetadataCache",
+    "TableTail",
+    "TableView",
+    "Subscription",
+    "MessageChannel",
+    "TraceCapture",
+    "TraceSpec",
+    "ConsoleTailer",
+    "ConsoleRecord",
+    "write_pstats",
+    "write_speedscope",
+    "write_collapsed",
 ]
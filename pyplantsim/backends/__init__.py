@@ -0,0 +1,18 @@
+from .base import RemoteControlBackend
+from .com import ComBackend
+from .fake import FakeBackend
+from .fake import FakeComError
+from .fake import FakeModel
+from .fake import FakeRemoteControl
+from .fake import FakeTable
+
+
+__all__ = [
+    "RemoteControlBackend",
+    "ComBackend",
+    "FakeBackend",
+    "FakeComError",
+    "FakeModel",
+    "FakeRemoteControl",
+    "FakeTable",
+]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+
+
+class RemoteControlBackend(ABC):
+    """
+    Abstract backend that creates RemoteControl objects and drives their message loop.
+
+    A backend hides how a Plant Simulation RemoteControl is obtained, so that the Python side
+    of pyplantsim can run against the real COM server or against an in-process fake.
+    """
+
+    @abstractmethod
+    def dispatch(self, dispatch_id: str, event_class: type) -> Any:
+        """
+        Create a RemoteControl object with the given event class attached.
+
+        The returned object has to expose the methods of the RemoteControl interface
+        (``GetValue``, ``ExecuteSimTalk``, ...) and the methods of ``event_class``, which the
+        backend calls when the corresponding event occurs.
+
+        :param dispatch_id: COM dispatch identifier of the requested RemoteControl.
+        :type dispatch_id: str
+        :param event_class: Class handling the events of the RemoteControl.
+        :type event_class: type
+        :return: The RemoteControl object.
+        :rtype: Any
+        """
+
+    @abstractmethod
+    def initialize_thread(self) -> None:
+        """
+        Prepare the calling thread for using RemoteControl objects.
+        """
+
+    @abstractmethod
+    def uninitialize_thread(self) -> None:
+        """
+        Release the resources of the calling thread acquired by :meth:`initialize_thread`.
+        """
+
+    @abstractmethod
+    def pump_waiting_messages(self) -> None:
+        """
+        Deliver pending events of the calling thread.
+        """
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Any
+
+from .base import RemoteControlBackend
+
+
+class ComBackend(RemoteControlBackend):
+    """
+    Backend talking to the Plant Simulation RemoteControl COM server through pywin32.
+
+    ``pythoncom`` and ``win32com`` are only imported when the backend is used, so that
+    pyplantsim can be imported on platforms without pywin32.
+    """
+
+    def dispatch(self, dispatch_id: str, event_class: type) -> Any:
+        """
+        Dispatch the COM server with events.
+
+        :param dispatch_id: COM dispatch identifier of the requested RemoteControl.
+        :type dispatch_id: str
+        :param event_class: Class handling the COM events.
+        :type event_class: type
+        :return: The dispatched RemoteControl object.
+        :rtype: Any
+        """
+        import win32com.client
+
+        return win32com.client.DispatchWithEvents(dispatch_id, event_class)  # type: ignore[no-untyped-call]
+
+    def initialize_thread(self) -> None:
+        """
+        Initialize COM for the calling thread.
+        """
+        import pythoncom
+
+        pythoncom.CoInitialize()
+
+    def uninitialize_thread(self) -> None:
+        """
+        Uninitialize COM for the calling thread.
+        """
+        import pythoncom
+
+        pythoncom.CoUninitialize()
+
+    def pump_waiting_messages(self) -> None:
+        """
+        Pump all waiting COM messages of the calling thread.
+        """
+        import pythoncom
+
+        pythoncom.PumpWaitingMessages()
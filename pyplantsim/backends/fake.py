@@ -0,0 +1,973 @@
+from __future__ import annotations
+
+from datetime import datetime
+from datetime import timedelta
+import importlib.resources
+import json
+import numbers
+import operator
+import os
+import re
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import cast
+
+from ..tables import NUMERIC_TYPES
+from ..tables import simtalk_value
+from .base import RemoteControlBackend
+
+
+SimTalkHandler = Callable[..., Any]
+
+_DATETIME_FORMATS = {
+    0: "%d.%m.%Y %H:%M:%S.%f",
+    1: "%Y-%m-%d %H:%M:%S.%f",
+    3: "%Y/%m/%d %H:%M:%S.%f",
+}
+
+_CELL = re.compile(r"^\[(?P<col>[^,\]]+),(?P<row>[^\]]+)\]$")
+
+
+class FakeComError(Exception):
+    """
+    Raised by :class:`FakeRemoteControl` where the COM server would raise a ``com_error``.
+
+    The arguments mimic ``pywintypes.com_error``: an error code followed by the message.
+    """
+
+    def __init__(self, message: str) -> None:
+        super().__init__(-1, message)
+
+
+def _wait(seconds: float) -> None:
+    """
+    Block for the given time. Sleeps for the bulk and spins for the last millisecond to keep
+    sub-millisecond latencies accurate.
+
+    :param seconds: Time to block.
+    :type seconds: float
+    """
+    if seconds <= 0:
+        return
+    deadline = time.perf_counter() + seconds
+    if seconds > 1e-3:
+        time.sleep(seconds - 1e-3)
+    while time.perf_counter() < deadline:
+        pass
+
+
+class FakeTable:
+    """
+    In-memory stand-in for a Plant Simulation table.
+
+    Cells use the Plant Simulation addressing ``[column, row]`` starting at 1, column 0 and
+    row 0 hold the row and column index.
+
+    :param data: Rows of cell values.
+    :type data: list[list[Any]]
+    :param columns: Column index. Activates the column index if given.
+    :type columns: list[Any] | None
+    :param index: Row index. Activates the row index if given.
+    :type index: list[Any] | None
+    :param index_name: Content of cell ``[0,0]``.
+    :type index_name: Any
+    :param data_types: Plant Simulation data types of the columns. Inferred if not given.
+    :type data_types: list[str] | None
+    """
+
+    def __init__(
+        self,
+        data: list[list[Any]] | None = None,
+        columns: list[Any] | None = None,
+        index: list[Any] | None = None,
+        index_name: Any = None,
+        data_types: list[str] | None = None,
+    ) -> None:
+        """
+        Initialize the table.
+
+        :param data: Rows of cell values.
+        :type data: list[list[Any]]
+        :param columns: Column index. Activates the column index if given.
+        :type columns: list[Any] | None
+        :param index: Row index. Activates the row index if given.
+        :type index: list[Any] | None
+        :param index_name: Content of cell ``[0,0]``.
+        :type index_name: Any
+        :param data_types: Plant Simulation data types of the columns.
+        :type data_types: list[str] | None
+        """
+        self.rows: list[list[Any]] = [list(row) for row in data or []]
+        self.x_dim = max((len(row) for row in self.rows), default=len(columns or []))
+        self.column_index_active = columns is not None
+        self.row_index_active = index is not None
+        self.columns: list[Any] = list(columns or [None] * self.x_dim)
+        self.index: list[Any] = list(index or [None] * len(self.rows))
+        self.index_name = index_name
+        self._data_types = data_types
+
+    @property
+    def y_dim(self) -> int:
+        """
+        Number of rows.
+
+        :return: Number of rows.
+        :rtype: int
+        """
+        return len(self.rows)
+
+    def data_type(self, column: int) -> str:
+        """
+        Get the Plant Simulation data type of a column.
+
+        :param column: Column number, starting at 1. 0 is the row index.
+        :type column: int
+        :return: Data type name.
+        :rtype: str
+        """
+        if column == 0:
+            values = self.index
+        elif self._data_types:
+            return self._data_types[column - 1]
+        else:
+            values = [row[column - 1] if column <= len(row) else None for row in self.rows]
+
+        for value in values:
+            # NumPy scalars written from DataFrames count like their Python counterparts
+            if type(value).__name__ in ("bool", "bool_"):
+                return "boolean"
+            if isinstance(value, numbers.Integral):
+                return "integer"
+            if isinstance(value, numbers.Real):
+                return "real"
+            if value is not None:
+                return "string"
+        return "string"
+
+    def _resolve(self, key: str, headers: list[Any]) -> int:
+        """
+        Resolve a cell address part, either a number or a quoted index value.
+
+        :param key: Address part.
+        :type key: str
+        :param headers: Index values to look up quoted keys in.
+        :type headers: list[Any]
+        :return: Column or row number.
+        :rtype: int
+        """
+        key = key.strip()
+        if key.startswith('"'):
+            name = key.strip('"')
+            for i, header in enumerate(headers, 1):
+                if str(header) == name:
+                    return i
+            raise FakeComError(f"Index {name!r} does not exist.")
+        return int(key)
+
+    def _grow(self, col: int, row: int) -> None:
+        while self.y_dim < row:
+            self.rows.append([None] * self.x_dim)
+            self.index.append(None)
+        if col > self.x_dim:
+            for cells in self.rows:
+                cells.extend([None] * (col - self.x_dim))
+            self.columns.extend([None] * (col - self.x_dim))
+            self.x_dim = col
+
+    def get(self, col_key: str, row_key: str) -> Any:
+        """
+        Read a cell.
+
+        :param col_key: Column address part.
+        :type col_key: str
+        :param row_key: Row address part.
+        :type row_key: str
+        :return: The cell value.
+        :rtype: Any
+        """
+        col = self._resolve(col_key, self.columns)
+        row = self._resolve(row_key, self.index)
+        if col == 0 and row == 0:
+            return self.index_name
+        if row == 0:
+            return self.columns[col - 1]
+        if col == 0:
+            return self.index[row - 1]
+        if col > self.x_dim or row > self.y_dim:
+            raise FakeComError(f"Cell [{col},{row}] is outside of the table.")
+        return self.rows[row - 1][col - 1]
+
+    def set(self, col_key: str, row_key: str, value: Any) -> None:
+        """
+        Write a cell, growing the table if necessary.
+
+        :param col_key: Column address part.
+        :type col_key: str
+        :param row_key: Row address part.
+        :type row_key: str
+        :param value: The new value.
+        :type value: Any
+        """
+        col = self._resolve(col_key, self.columns)
+        row = self._resolve(row_key, self.index)
+        self._grow(col, row)
+        if col == 0 and row == 0:
+            self.index_name = value
+        elif row == 0:
+            self.columns[col - 1] = value
+        elif col == 0:
+            self.index[row - 1] = value
+        else:
+            self.rows[row - 1][col - 1] = value
+
+    def attribute(self, name: str) -> Any:
+        """
+        Read a table attribute.
+
+        :param name: Attribute name.
+        :type name: str
+        :return: Attribute value.
+        :rtype: Any
+        """
+        match name:
+            case "xDim":
+                return self.x_dim
+            case "yDim":
+                return self.y_dim
+            case "rowIndex":
+                return self.row_index_active
+            case "columnIndex":
+                return self.column_index_active
+        raise FakeComError(f"Unknown table attribute {name!r}.")
+
+
+class FakeModel:
+    """
+    In-memory stand-in for a loaded Plant Simulation model.
+
+    :param tables: Tables by their absolute path.
+    :type tables: dict[str, FakeTable] | None
+    :param values: Attribute values by their absolute path.
+    :type values: dict[str, Any] | None
+    :param language: Model language (0=German, 1=English, 3=Chinese).
+    :type language: int
+    :param simulation_duration: Wall-clock seconds a simulation run takes.
+    :type simulation_duration: float
+    :param start_date: Start date of the EventController.
+    :type start_date: datetime
+    :param end_time: Simulated end time of the EventController.
+    :type end_time: timedelta
+    :param call_cycles: Raw profiler output as returned by ``getProfileCallCycles``.
+    :type call_cycles: dict[str, Any] | None
+    """
+
+    def __init__(
+        self,
+        tables: dict[str, FakeTable] | None = None,
+        values: dict[str, Any] | None = None,
+        language: int = 1,
+        simulation_duration: float = 0.0,
+        start_date: datetime = datetime(2025, 1, 1),
+        end_time: timedelta = timedelta(days=1),
+        call_cycles: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Initialize the model.
+
+        :param tables: Tables by their absolute path.
+        :type tables: dict[str, FakeTable] | None
+        :param values: Attribute values by their absolute path.
+        :type values: dict[str, Any] | None
+        :param language: Model language (0=German, 1=English, 3=Chinese).
+        :type language: int
+        :param simulation_duration: Wall-clock seconds a simulation run takes.
+        :type simulation_duration: float
+        :param start_date: Start date of the EventController.
+        :type start_date: datetime
+        :param end_time: Simulated end time of the EventController.
+        :type end_time: timedelta
+        :param call_cycles: Raw profiler output as returned by ``getProfileCallCycles``.
+        :type call_cycles: dict[str, Any] | None
+        """
+        self.tables = tables if tables is not None else {}
+        self.values = values if values is not None else {}
+        self.language = language
+        self.simulation_duration = simulation_duration
+        self.start_date = start_date
+        self.end_time = end_time
+        self.call_cycles = call_cycles if call_cycles is not None else {"CallCycles": []}
+
+
+class FakeRemoteControl:
+    """
+    Pure-Python imitation of the Plant Simulation RemoteControl interface.
+
+    Supports tables, attributes, SimTalk through registered Python handlers, simulation runs
+    that take a configurable wall-clock time and the ``OnSimulationFinished`` and
+    ``OnSimTalkMessage`` events. Writing an observed attribute reports the change like the
+    observers of :meth:`Plantsim.subscribe`, writing ``NumMU`` of a traced object records an
+    entry or exit like :meth:`Plantsim.start_trace`. Every interface call blocks for the
+    configured latency to emulate the COM round trip.
+
+    :param backend: The backend that created the object.
+    :type backend: FakeBackend
+    """
+
+    def __init__(self, backend: FakeBackend) -> None:
+        """
+        Initialize the RemoteControl.
+
+        :param backend: The backend that created the object.
+        :type backend: FakeBackend
+        """
+        self._backend = backend
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+        self._simulation_started_at: float | None = None
+        self.model: FakeModel | None = None
+        self.path_context = ""
+        self.settings: dict[str, Any] = {}
+        self.call_counts: dict[str, int] = {}
+        self.console_log_file: str | None = None
+        self.observed: set[str] = set()
+        self.message_batch_size: int | None = None
+        self.message_buffer: list[str] = []
+        self.traced: set[str] = set()
+        self.trace_batch_size = 1
+        self.trace_buffer: list[str] = []
+        self.running = False
+        self.closed = False
+
+    def _call(self, name: str) -> None:
+        """
+        Account for an interface call and emulate its latency.
+
+        :param name: Name of the interface method.
+        :type name: str
+        """
+        if self.closed:
+            raise FakeComError("The RPC server is unavailable.")
+        with self._lock:
+            self.call_counts[name] = self.call_counts.get(name, 0) + 1
+        _wait(self._backend.latency)
+
+    def _require_model(self) -> FakeModel:
+        if self.model is None:
+            raise FakeComError("No model is loaded.")
+        return self.model
+
+    def _absolute(self, path: str) -> str:
+        path = str(path)
+        if path.startswith(".") or not self.path_context:
+            return path
+        return f"{self.path_context}.{path}"
+
+    def _find_table(self, path: str) -> tuple[FakeTable, str] | None:
+        """
+        Find the table a path points into.
+
+        :param path: Absolute path.
+        :type path: str
+        :return: The table and the remaining part of the path, or None.
+        :rtype: tuple[FakeTable, str] | None
+        """
+        model = self._require_model()
+        for name in sorted(model.tables, key=len, reverse=True):
+            if path == name or path.startswith((f"{name}[", f"{name}.")):
+                return model.tables[name], path[len(name) :]
+        return None
+
+    def _event_controller_value(self, path: str) -> Any:
+        """
+        Emulate the time attributes of an EventController.
+
+        :param path: Absolute path of the attribute.
+        :type path: str
+        :return: The attribute value.
+        :rtype: Any
+        """
+        model = self._require_model()
+        attribute = path.rsplit(".", 1)[-1]
+        fmt = _DATETIME_FORMATS[model.language]
+
+        match attribute:
+            case "StartDate" | "Date":
+                return model.start_date.strftime(fmt)
+            case "EndTime" | "End":
+                return model.end_time.total_seconds()
+            case "AbsSimTime":
+                return (model.start_date + self._sim_time()).strftime(fmt)
+            case "SimTime":
+                return self._sim_time().total_seconds()
+        raise FakeComError(f"Unknown object or attribute {path!r}.")
+
+    def _sim_time(self) -> timedelta:
+        """
+        Emulate the simulation time, advancing linearly with the wall-clock time of a run.
+
+        :return: Simulated time since the start date.
+        :rtype: timedelta
+        """
+        model = self._require_model()
+        progress = 1.0
+        if self.running and self._simulation_started_at is not None:
+            elapsed = time.perf_counter() - self._simulation_started_at
+            duration = model.simulation_duration
+            progress = min(1.0, elapsed / duration) if duration > 0 else 1.0
+        return model.end_time * progress
+
+    def _read(self, path: str) -> Any:
+        model = self._require_model()
+        if path in model.values:
+            return model.values[path]
+
+        found = self._find_table(path)
+        if found is not None:
+            table, rest = found
+            cell = _CELL.match(rest)
+            if cell:
+                return table.get(cell["col"], cell["row"])
+            if rest.startswith("."):
+                return table.attribute(rest[1:])
+
+        return self._event_controller_value(path)
+
+    def _write(self, path: str, value: Any) -> None:
+        model = self._require_model()
+        found = self._find_table(path)
+        if found is not None:
+            table, rest = found
+            cell = _CELL.match(rest)
+            if cell:
+                table.set(cell["col"], cell["row"], value)
+                return
+        old_value = model.values.get(path)
+        model.values[path] = value
+
+        obj, _, attribute = path.rpartition(".")
+        if attribute == "NumMU" and obj in self.traced:
+            event = "entry" if value > (old_value or 0) else "exit"
+            seconds = self._sim_time().total_seconds()
+            self.trace_buffer.append(chr(31).join((str(seconds), obj, event, str(value))))
+            if len(self.trace_buffer) >= self.trace_batch_size:
+                payload = chr(30).join(self.trace_buffer)
+                self.trace_buffer = []
+                self.fire_simtalk_message(chr(3) + payload)
+
+        if path in self.observed:
+            message = {"status": "change", "path": path, "value": value}
+            self.fire_simtalk_message(json.dumps(message, default=str))
+
+    # Settings
+    def SetVisible(self, visible: bool) -> None:
+        self._call("SetVisible")
+        self.settings["visible"] = visible
+
+    def SetLicenseType(self, license: str) -> None:
+        self._call("SetLicenseType")
+        self.settings["license"] = license
+
+    def SetTrustModels(self, trusted: bool) -> None:
+        self._call("SetTrustModels")
+        self.settings["trusted"] = trusted
+
+    def SetSuppressStartOf3D(self, suppress: bool) -> None:
+        self._call("SetSuppressStartOf3D")
+        self.settings["suppress_3d"] = suppress
+
+    def SetNoMessageBox(self, no_message_box: bool) -> None:
+        self._call("SetNoMessageBox")
+        self.settings["no_message_box"] = no_message_box
+
+    def SetPathContext(self, path: str) -> None:
+        self._call("SetPathContext")
+        self.path_context = str(path)
+
+    # Models
+    def LoadModel(self, filepath: str, password: str | None = None) -> None:
+        self._call("LoadModel")
+        if self.model is not None:
+            raise FakeComError("A model is already loaded.")
+        self.model = self._backend.model_factory(filepath)
+
+    def NewModel(self) -> None:
+        self._call("NewModel")
+        self.model = FakeModel()
+
+    def CloseModel(self) -> None:
+        self._call("CloseModel")
+        self._stop_timer()
+        self.model = None
+
+    def SaveModel(self, filepath: str) -> None:
+        self._call("SaveModel")
+        self._require_model()
+
+    # Values
+    def GetValue(self, path: str) -> Any:
+        self._call("GetValue")
+        return self._read(self._absolute(path))
+
+    def SetValue(self, path: str, value: Any) -> None:
+        self._call("SetValue")
+        self._write(self._absolute(path), value)
+
+    def ExecuteSimTalk(self, source_code: str, *parameters: Any) -> Any:
+        self._call("ExecuteSimTalk")
+        handler = self._backend.simtalk_handler(source_code)
+        if handler is None:
+            raise FakeComError("SimTalk source is not supported by the fake RemoteControl.")
+        return handler(self, *parameters)
+
+    # Simulation
+    def StartSimulation(self, event_controller: str, without_animation: bool = False) -> None:
+        self._call("StartSimulation")
+        model = self._require_model()
+        with self._lock:
+            self.running = True
+            self._simulation_started_at = time.perf_counter()
+            self._timer = threading.Timer(model.simulation_duration, self._finish_simulation)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _finish_simulation(self) -> None:
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            self._timer = None
+        self.fire_event("OnSimulationFinished")
+
+    def _stop_timer(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self.running = False
+
+    def StopSimulation(self, event_controller: str) -> None:
+        self._call("StopSimulation")
+        self._stop_timer()
+
+    def ResetSimulation(self, event_controller: str) -> None:
+        self._call("ResetSimulation")
+        self._stop_timer()
+
+    def IsSimulationRunning(self) -> bool:
+        self._call("IsSimulationRunning")
+        return self.running
+
+    # Instance
+    def OpenConsoleLogFile(self, filepath: str) -> None:
+        self._call("OpenConsoleLogFile")
+        self.console_log_file = filepath or None
+
+    def QuitAfterTime(self, seconds: int) -> None:
+        self._call("QuitAfterTime")
+        threading.Timer(seconds, self.Quit).start()
+
+    def GetCurrentProcessId(self) -> int:
+        self._call("GetCurrentProcessId")
+        return os.getpid()
+
+    def Quit(self) -> None:
+        self._call("Quit")
+        self._stop_timer()
+        self.closed = True
+
+    # Events
+    def fire_event(self, name: str, *args: Any) -> None:
+        """
+        Raise an event of the RemoteControl, as the COM server would.
+
+        :param name: Name of the event method, e.g. ``OnSimTalkMessage``.
+        :type name: str
+        :param args: Arguments of the event.
+        :type args: Any
+        """
+        handler = getattr(self, name, None)
+        if handler is not None:
+            handler(*args)
+
+    def send_channel_message(self, msg: str) -> None:
+        """
+        Emulate a ``.PyplantsimMessages(msg)`` call of the model, which buffers the message in
+        the channel installed by :meth:`Plantsim.open_message_channel` and fires full batches.
+        The time window of the channel is not emulated.
+
+        :param msg: The message.
+        :type msg: str
+        """
+        if self.message_batch_size is None:
+            raise FakeComError("No message channel is installed.")
+        self.message_buffer.append(msg)
+        if len(self.message_buffer) >= self.message_batch_size:
+            payload = chr(30).join(self.message_buffer)
+            self.message_buffer = []
+            self.fire_simtalk_message(chr(2) + payload)
+
+    def fire_simtalk_message(self, msg: str) -> None:
+        """
+        Emulate a ``fireSimTalkMessage`` call of the model.
+
+        :param msg: The message.
+        :type msg: str
+        """
+        self.fire_event("OnSimTalkMessage", msg)
+
+
+def _exists_path(rc: FakeRemoteControl, path: Any) -> bool:
+    absolute = rc._absolute(str(path))
+    model = rc._require_model()
+    if rc._find_table(absolute) is not None:
+        return True
+    # Frames and folders exist if any known object lies below them
+    return any(name.startswith(absolute) for name in (*model.tables, *model.values))
+
+
+def _table_column_data_type(rc: FakeRemoteControl, table: Any, column: int) -> str:
+    found = rc._find_table(rc._absolute(str(table)))
+    if found is None:
+        raise FakeComError(f"{table} is not a table.")
+    return found[0].data_type(int(column))
+
+
+def _table_column_data_types(rc: FakeRemoteControl, table: Any) -> str:
+    found = rc._find_table(rc._absolute(str(table)))
+    if found is None:
+        raise FakeComError(f"{table} is not a table.")
+    return ";".join(found[0].data_type(col) for col in range(1, found[0].x_dim + 1))
+
+
+def _table_rows(
+    rc: FakeRemoteControl, table: Any, first_row: int, last_row: int, first_col: int
+) -> str:
+    found = rc._find_table(rc._absolute(str(table)))
+    if found is None:
+        raise FakeComError(f"{table} is not a table.")
+    fake_table = found[0]
+    rows = []
+    for row in range(int(first_row), int(last_row) + 1):
+        cells = [
+            fake_table.get(str(col), str(row))
+            for col in range(int(first_col), fake_table.x_dim + 1)
+        ]
+        rows.append(chr(31).join(simtalk_value(cell) for cell in cells))
+    return chr(30).join(rows)
+
+
+def _table_columns(
+    rc: FakeRemoteControl, table: Any, first_row: int, last_row: int, first_col: int
+) -> str:
+    found = rc._find_table(rc._absolute(str(table)))
+    if found is None:
+        raise FakeComError(f"{table} is not a table.")
+    fake_table = found[0]
+    columns = []
+    for col in range(int(first_col), fake_table.x_dim + 1):
+        cells = [
+            fake_table.get(str(col), str(row)) for row in range(int(first_row), int(last_row) + 1)
+        ]
+        columns.append(chr(31).join(simtalk_value(cell) for cell in cells))
+    return chr(30).join(columns)
+
+
+def _table_numeric(rc: FakeRemoteControl, table: Any, with_index: bool) -> str:
+    found = rc._find_table(rc._absolute(str(table)))
+    if found is None:
+        raise FakeComError(f"{table} is not a table.")
+    fake_table = found[0]
+    rows = range(1, fake_table.y_dim + 1)
+
+    widths = []
+    blocks = []
+    for col in range(1, fake_table.x_dim + 1):
+        cells = [simtalk_value(fake_table.get(str(col), str(row))) for row in rows]
+        width = max((len(cell) for cell in cells), default=1) or 1
+        widths.append(str(width))
+        blocks.append("".join(cell.rjust(width) for cell in cells))
+
+    sections = [";".join(widths)]
+    if with_index:
+        sections.append(chr(31).join(simtalk_value(fake_table.get("0", str(row))) for row in rows))
+    sections.append("".join(blocks))
+    return chr(30).join(sections)
+
+
+def _tables(rc: FakeRemoteControl, paths: str) -> str:
+    tables = []
+    for path in paths.split(chr(30)):
+        found = rc._find_table(rc._absolute(path))
+        if found is None:
+            raise FakeComError(f"{path} is not a table.")
+        fake_table = found[0]
+        cols = range(fake_table.x_dim + 1)
+        rows = [
+            chr(31).join(
+                simtalk_value(v)
+                for v in (
+                    fake_table.x_dim,
+                    fake_table.y_dim,
+                    fake_table.row_index_active,
+                    fake_table.column_index_active,
+                    fake_table.data_type(0) if fake_table.row_index_active else "",
+                )
+            ),
+            chr(31).join(fake_table.data_type(col) for col in cols[1:]),
+        ]
+        for row in range(fake_table.y_dim + 1):
+            rows.append(
+                chr(31).join(simtalk_value(fake_table.get(str(col), str(row))) for col in cols)
+            )
+        tables.append(chr(30).join(rows))
+    return chr(29).join(tables)
+
+
+def _table_rows_where(
+    rc: FakeRemoteControl, table: Any, cols: str, filter_col: int, op: str, value: str
+) -> str:
+    found = rc._find_table(rc._absolute(str(table)))
+    if found is None:
+        raise FakeComError(f"{table} is not a table.")
+    fake_table = found[0]
+    selected = [col for col in range(1, fake_table.x_dim + 1) if f";{col};" in cols]
+    compare = {
+        "=": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+    }.get(op)
+
+    numeric = op != "" and fake_table.data_type(int(filter_col)) in NUMERIC_TYPES | {"time"}
+    rows = []
+    for row in range(1, fake_table.y_dim + 1):
+        if compare is not None:
+            cell = fake_table.get(str(filter_col), str(row))
+            if numeric:
+                matches = compare(float(cell), float(value))
+            else:
+                matches = compare(simtalk_value(cell), value)
+            if not matches:
+                continue
+        key = fake_table.get("0", str(row)) if fake_table.row_index_active else row
+        cells = [key, *(fake_table.get(str(col), str(row)) for col in selected)]
+        rows.append(chr(31).join(simtalk_value(cell) for cell in cells))
+    return chr(30).join(rows)
+
+
+def _aggregate_table(rc: FakeRemoteControl, table: Any, group_col: int, cols: str) -> str:
+    found = rc._find_table(rc._absolute(str(table)))
+    if found is None:
+        raise FakeComError(f"{table} is not a table.")
+    fake_table = found[0]
+    agg_cols = [col for col in range(1, fake_table.x_dim + 1) if f";{col};" in cols]
+
+    groups: dict[str, list[list[float]]] = {}
+    for row in range(1, fake_table.y_dim + 1):
+        key = simtalk_value(fake_table.get(str(group_col), str(row))) if group_col else ""
+        groups.setdefault(key, []).append(
+            [float(fake_table.get(str(col), str(row))) for col in agg_cols]
+        )
+
+    rows = []
+    for key, group in groups.items():
+        cells = [key, str(len(group))]
+        for column in zip(*group):
+            cells.extend(str(v) for v in (sum(column), min(column), max(column)))
+        rows.append(chr(31).join(cells))
+    return chr(30).join(rows)
+
+
+def _set_table_cells(rc: FakeRemoteControl, table: Any, cells: str) -> int:
+    found = rc._find_table(rc._absolute(str(table)))
+    if found is None:
+        raise FakeComError(f"{table} is not a table.")
+    fake_table = found[0]
+    written = 0
+    for item in cells.split(chr(30)) if cells else []:
+        col, row, text = item.split(chr(31), 2)
+        value: Any = text
+        match fake_table.data_type(int(col)):
+            case "boolean":
+                value = text == "true"
+            case "integer":
+                value = int(float(text))
+            case "real" | "time" | "length" | "weight" | "speed" | "acceleration":
+                value = float(text)
+        fake_table.set(col, row, value)
+        written += 1
+    return written
+
+
+def _observe(rc: FakeRemoteControl, attributes: str, observe: bool) -> int:
+    paths = [item.replace(chr(31), ".") for item in attributes.split(chr(30)) if item]
+    for path in paths:
+        if observe:
+            rc.observed.add(path)
+        else:
+            rc.observed.discard(path)
+    return len(paths)
+
+
+def _install_message_channel(
+    rc: FakeRemoteControl, batch_size: int, window: float, event_controller: str
+) -> bool:
+    rc.message_batch_size = int(batch_size)
+    rc.message_buffer = []
+    return True
+
+
+def _flush_message_channel(rc: FakeRemoteControl) -> str:
+    payload = chr(30).join(rc.message_buffer)
+    rc.message_buffer = []
+    return payload
+
+
+def _install_trace(
+    rc: FakeRemoteControl, objects: str, batch_size: int, event_controller: str
+) -> int:
+    rc.traced = set(objects.split(chr(30))) if objects else set()
+    rc.trace_batch_size = int(batch_size)
+    rc.trace_buffer = []
+    return len(rc.traced)
+
+
+def _flush_trace(rc: FakeRemoteControl, objects: str, stop: bool) -> str:
+    payload = chr(30).join(rc.trace_buffer)
+    rc.trace_buffer = []
+    if stop:
+        rc.traced -= set(objects.split(chr(30)))
+    return payload
+
+
+def _call_cycles(rc: FakeRemoteControl, max_num_cycles: int = -1) -> str:
+    data = rc._require_model().call_cycles
+    if max_num_cycles != -1:
+        data = {**data, "CallCycles": data.get("CallCycles", [])[:max_num_cycles]}
+    return json.dumps(data)
+
+
+_BUILTIN_SIMTALK: dict[str, SimTalkHandler] = {
+    "activate_profiler": lambda rc: None,
+    "aggregate_table": _aggregate_table,
+    "exists_path": _exists_path,
+    "flush_message_channel": _flush_message_channel,
+    "flush_trace": _flush_trace,
+    "get_call_cycles": _call_cycles,
+    "get_model_language": lambda rc: rc._require_model().language,
+    "get_table_column_data_type": _table_column_data_type,
+    "get_table_column_data_types": _table_column_data_types,
+    "get_table_columns": _table_columns,
+    "get_table_numeric": _table_numeric,
+    "get_table_rows": _table_rows,
+    "get_table_rows_where": _table_rows_where,
+    "get_tables": _tables,
+    "install_error_handler": lambda rc: True,
+    "install_message_channel": _install_message_channel,
+    "install_observers": lambda rc, attributes: _observe(rc, attributes, True),
+    "install_trace": _install_trace,
+    "remove_error_handler": lambda rc: True,
+    "remove_observers": lambda rc, attributes: _observe(rc, attributes, False),
+    "set_table_cells": _set_table_cells,
+}
+
+
+class FakeBackend(RemoteControlBackend):
+    """
+    Backend creating :class:`FakeRemoteControl` objects, for running and benchmarking
+    pyplantsim without Windows or Plant Simulation.
+
+    SimTalk cannot be interpreted, so ``ExecuteSimTalk`` dispatches the source code to a Python
+    handler. Handlers for the scripts shipped with pyplantsim are registered by default,
+    further ones can be added with :meth:`register_simtalk`.
+
+    :param model_factory: Creates the model for ``LoadModel`` from the file path.
+    :type model_factory: Callable[[str], FakeModel] | None
+    :param latency: Seconds every interface call blocks, emulating the COM round trip.
+    :type latency: float
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[[str], FakeModel] | None = None,
+        latency: float = 0.0,
+    ) -> None:
+        """
+        Initialize the backend.
+
+        :param model_factory: Creates the model for ``LoadModel`` from the file path.
+        :type model_factory: Callable[[str], FakeModel] | None
+        :param latency: Seconds every interface call blocks, emulating the COM round trip.
+        :type latency: float
+        """
+        self.model_factory: Callable[[str], FakeModel] = model_factory or (lambda _: FakeModel())
+        self.latency = latency
+        self.instances: list[FakeRemoteControl] = []
+        self._lock = threading.Lock()
+        self._simtalk: dict[str, SimTalkHandler] = {}
+
+        package = __package__.rsplit(".", 1)[0] if __package__ else "pyplantsim"
+        scripts = importlib.resources.files(package).joinpath("sim_talk_scripts")
+        for name, handler in _BUILTIN_SIMTALK.items():
+            self.register_simtalk(scripts.joinpath(f"{name}.st").read_text(), handler)
+
+    def register_simtalk(self, source_code: str, handler: SimTalkHandler) -> None:
+        """
+        Register a Python implementation of a SimTalk source.
+
+        :param source_code: The exact SimTalk source passed to ``ExecuteSimTalk``.
+        :type source_code: str
+        :param handler: Called with the RemoteControl and the SimTalk parameters.
+        :type handler: Callable[..., Any]
+        """
+        self._simtalk[source_code] = handler
+
+    def simtalk_handler(self, source_code: str) -> SimTalkHandler | None:
+        """
+        Get the Python implementation of a SimTalk source.
+
+        :param source_code: The SimTalk source.
+        :type source_code: str
+        :return: The handler or None if the source is unknown.
+        :rtype: Callable[..., Any] | None
+        """
+        return self._simtalk.get(source_code)
+
+    def dispatch(self, dispatch_id: str, event_class: type) -> Any:
+        """
+        Create a fake RemoteControl with the given event class mixed in, like
+        ``DispatchWithEvents`` does.
+
+        :param dispatch_id: Ignored.
+        :type dispatch_id: str
+        :param event_class: Class handling the events.
+        :type event_class: type
+        :return: The fake RemoteControl.
+        :rtype: Any
+        """
+        cls: Any = type(f"Fake{event_class.__name__}", (FakeRemoteControl, event_class), {})
+        rc = cls.__new__(cls)
+        cast(Any, event_class).__init__(rc)
+        FakeRemoteControl.__init__(rc, self)
+        with self._lock:
+            self.instances.append(rc)
+        return rc
+
+    def initialize_thread(self) -> None:
+        """
+        Nothing to initialize for the fake.
+        """
+
+    def uninitialize_thread(self) -> None:
+        """
+        Nothing to uninitialize for the fake.
+        """
+
+    def pump_waiting_messages(self) -> None:
+        """
+        Events of the fake are delivered directly from its timer threads.
+        """
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import json
+import re
 from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import Literal
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Whitespace and commas between the elements of the CallCycles array
+_SEPARATORS = re.compile(r"[\s,]*")
 
 
 class MissingMethodError(ValueError):
     """Raised when the 'Method' key is missing or invalid in a CallCycle mapping."""
 
 
-@dataclass
+@dataclass(slots=True)
 class CallerEntry:
     caller: str
     called: int
@@ -25,7 +39,7 @@ class CallerEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CallCycleMethod:
     method: str
     called: int
@@ -44,7 +58,7 @@ class CallCycleMethod:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CallCycle:
     method: CallCycleMethod
     callers: list[CallerEntry]
@@ -62,3 +76,334 @@ class CallCycle:
             method=CallCycleMethod.from_dict(method_dict),
             callers=[CallerEntry.from_dict(c) for c in d.get("Callers", [])],
         )
+
+
+def iter_call_cycle_dicts(raw: str) -> Iterator[dict[str, Any]]:
+    """
+    Decode the elements of the ``CallCycles`` array of the profiler output one by one, so only
+    one call cycle is decoded at a time instead of the whole document.
+
+    :param raw: JSON returned by ``getProfileCallCycles``.
+    :type raw: str
+    :return: Iterator over the call cycles as dicts.
+    :rtype: Iterator[dict[str, Any]]
+    :raises ValueError: If the JSON is invalid.
+    """
+    key = raw.find('"CallCycles"')
+    if key < 0:
+        return
+    start = raw.find("[", key)
+    if start < 0:
+        raise ValueError("'CallCycles' must be an array")
+
+    decoder = json.JSONDecoder()
+    pos = start + 1
+    while True:
+        pos = _SEPARATORS.match(raw, pos).end()  # type: ignore[union-attr]
+        if pos >= len(raw) or raw[pos] == "]":
+            return
+        call_cycle, pos = decoder.raw_decode(raw, pos)
+        yield call_cycle
+
+
+HotSpotKey = Literal["self_time", "total_time", "called"]
+
+
+class CallCycleTable:
+    """
+    Columnar representation of profiler call cycles, e.g. for large models profiled over long
+    runs.
+
+    ``methods`` holds one row per profiled method with the columns ``method``, ``called``,
+    ``self``, ``self_time``, ``callees_time`` and ``total_time``. ``callers`` holds one row
+    per caller edge with the columns ``method``, ``caller``, ``called``, ``self_time`` and
+    ``callees_time``. Method paths are stored as categoricals, so every path is held once::
+
+        table = plantsim.read_call_cycle_table()
+        table.hot_spots("total_time", n=10)
+
+    :param methods: One row per method.
+    :type methods: pd.DataFrame
+    :param callers: One row per caller edge.
+    :type callers: pd.DataFrame
+    :param runs: Number of runs the call cycles were aggregated from.
+    :type runs: int
+    """
+
+    METHOD_COLUMNS = ["method", "called", "self", "self_time", "callees_time", "total_time"]
+    CALLER_COLUMNS = ["method", "caller", "called", "self_time", "callees_time"]
+
+    def __init__(self, methods: pd.DataFrame, callers: pd.DataFrame, runs: int = 1) -> None:
+        """
+        Initialize the table.
+
+        :param methods: One row per method.
+        :type methods: pd.DataFrame
+        :param callers: One row per caller edge.
+        :type callers: pd.DataFrame
+        :param runs: Number of runs the call cycles were aggregated from.
+        :type runs: int
+        """
+        self.methods = methods
+        self.callers = callers
+        self.runs = runs
+
+    @classmethod
+    def from_dicts(cls, call_cycles: Iterable[dict[str, Any]]) -> "CallCycleTable":
+        """
+        Build the table from call cycles in the format of the profiler output, see
+        :func:`iter_call_cycle_dicts`. Only the columns are kept while iterating.
+
+        :param call_cycles: The call cycles.
+        :type call_cycles: Iterable[dict[str, Any]]
+        :return: The table.
+        :rtype: CallCycleTable
+        :raises MissingMethodError: If a call cycle has no valid 'Method'.
+        """
+        methods: tuple[list[Any], ...] = ([], [], [], [], [])
+        callers: tuple[list[Any], ...] = ([], [], [], [], [])
+        m_method, m_called, m_self, m_self_time, m_callees_time = (c.append for c in methods)
+        c_method, c_caller, c_called, c_self_time, c_callees_time = (c.append for c in callers)
+
+        for d in call_cycles:
+            method = d.get("Method")
+            if not isinstance(method, dict):
+                raise MissingMethodError("'Method' must be a dict")
+            path = method["Method"]
+            m_method(path)
+            m_called(method["Called"])
+            m_self(method["Self"])
+            m_self_time(method["SelfTime"])
+            m_callees_time(method["CalleesTime"])
+
+            for caller in d.get("Callers", []):
+                c_method(path)
+                c_caller(caller["Caller"])
+                c_called(caller["Called"])
+                c_self_time(caller["SelfTime"])
+                c_callees_time(caller["CalleesTime"])
+
+        return cls._from_columns(methods, callers)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CallCycleTable":
+        """
+        Build the table from the JSON returned by ``getProfileCallCycles``, decoding one call
+        cycle at a time.
+
+        :param raw: The profiler output.
+        :type raw: str
+        :return: The table.
+        :rtype: CallCycleTable
+        """
+        return cls.from_dicts(iter_call_cycle_dicts(raw))
+
+    @classmethod
+    def from_call_cycles(cls, call_cycles: Iterable[CallCycle]) -> "CallCycleTable":
+        """
+        Build the table from :class:`CallCycle` objects.
+
+        :param call_cycles: The call cycles.
+        :type call_cycles: Iterable[CallCycle]
+        :return: The table.
+        :rtype: CallCycleTable
+        """
+        methods: tuple[list[Any], ...] = ([], [], [], [], [])
+        callers: tuple[list[Any], ...] = ([], [], [], [], [])
+
+        for cc in call_cycles:
+            m = cc.method
+            for column, value in zip(
+                methods, (m.method, m.called, m.self_, m.self_time, m.callees_time)
+            ):
+                column.append(value)
+            for c in cc.callers:
+                for column, value in zip(
+                    callers, (m.method, c.caller, c.called, c.self_time, c.callees_time)
+                ):
+                    column.append(value)
+
+        return cls._from_columns(methods, callers)
+
+    @classmethod
+    def _from_columns(
+        cls, methods: tuple[list[Any], ...], callers: tuple[list[Any], ...]
+    ) -> "CallCycleTable":
+        """
+        Build the DataFrames from the collected columns.
+
+        :param methods: Method, called, self, self time and callees time of every method.
+        :type methods: tuple[list[Any], ...]
+        :param callers: Method, caller, called, self time and callees time of every edge.
+        :type callers: tuple[list[Any], ...]
+        :return: The table.
+        :rtype: CallCycleTable
+        """
+        import numpy as np
+        import pandas as pd
+
+        method_frame = pd.DataFrame(
+            {
+                "method": pd.Categorical(methods[0]),
+                "called": np.asarray(methods[1], dtype=np.int64),
+                "self": np.asarray(methods[2], dtype=np.int64),
+                "self_time": np.asarray(methods[3], dtype=np.float64),
+                "callees_time": np.asarray(methods[4], dtype=np.float64),
+            }
+        )
+        method_frame["total_time"] = method_frame["self_time"] + method_frame["callees_time"]
+
+        caller_frame = pd.DataFrame(
+            {
+                "method": pd.Categorical(callers[0]),
+                "caller": pd.Categorical(callers[1]),
+                "called": np.asarray(callers[2], dtype=np.int64),
+                "self_time": np.asarray(callers[3], dtype=np.float64),
+                "callees_time": np.asarray(callers[4], dtype=np.float64),
+            }
+        )
+        return cls(method_frame, caller_frame)
+
+    @classmethod
+    def aggregate(
+        cls, tables: Iterable["CallCycleTable"], how: Literal["sum", "mean"] = "sum"
+    ) -> "CallCycleTable":
+        """
+        Aggregate the call cycles of several runs, e.g. the replications of an experiment, per
+        method and per caller edge.
+
+        :param tables: The call cycles of every run.
+        :type tables: Iterable[CallCycleTable]
+        :param how: ``sum`` adds up the counts and times, ``mean`` averages them over all runs,
+            counting a method missing in a run as 0.
+        :type how: Literal["sum", "mean"]
+        :return: The aggregated table.
+        :rtype: CallCycleTable
+        :raises ValueError: If no tables are given or ``how`` is unknown.
+        """
+        import pandas as pd
+
+        if how not in ("sum", "mean"):
+            raise ValueError(f"Unknown aggregation: {how}")
+        tables = list(tables)
+        if not tables:
+            raise ValueError("At least one table is required.")
+
+        runs = sum(table.runs for table in tables)
+        methods = cls._sum_by(
+            pd.concat([table.methods for table in tables], ignore_index=True), ["method"]
+        )
+        callers = cls._sum_by(
+            pd.concat([table.callers for table in tables], ignore_index=True),
+            ["method", "caller"],
+        )
+        if how == "mean":
+            for frame in (methods, callers):
+                numeric = frame.columns.difference(["method", "caller"])
+                frame[numeric] = frame[numeric] / runs
+
+        return cls(methods, callers, runs=runs)
+
+    @staticmethod
+    def _sum_by(frame: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+        """
+        Add up the numeric columns of a frame per key, keeping the keys categorical.
+
+        :param frame: The frame.
+        :type frame: pd.DataFrame
+        :param keys: Columns to group by.
+        :type keys: list[str]
+        :return: One row per key.
+        :rtype: pd.DataFrame
+        """
+        frame = frame.astype({key: "str" for key in keys})
+        summed = frame.groupby(keys, sort=False).sum().reset_index()
+        return summed.astype({key: "category" for key in keys})
+
+    def hot_spots(self, by: HotSpotKey = "self_time", n: int | None = 10) -> pd.DataFrame:
+        """
+        Rank the methods by self time, total time or number of calls.
+
+        :param by: ``self_time``, ``total_time`` (self time and callees time) or ``called``.
+        :type by: Literal["self_time", "total_time", "called"]
+        :param n: Number of methods to return. All methods if None.
+        :type n: int | None
+        :return: The top methods, in descending order, with their share of the overall self
+            time in the column ``share``.
+        :rtype: pd.DataFrame
+        :raises ValueError: If ``by`` is unknown.
+        """
+        if by not in ("self_time", "total_time", "called"):
+            raise ValueError(f"Unknown ranking: {by}")
+
+        ranked = self.methods.sort_values(by, ascending=False, kind="stable")
+        if n is not None:
+            ranked = ranked.head(n)
+        ranked = ranked.reset_index(drop=True)
+
+        overall = self.methods["self_time"].sum()
+        ranked["share"] = ranked["self_time"] / overall if overall else 0.0
+        return ranked
+
+    def callers_of(self, method: str) -> pd.DataFrame:
+        """
+        Get the caller edges of a method, in descending order of their self time.
+
+        :param method: Path of the method.
+        :type method: str
+        :return: One row per caller.
+        :rtype: pd.DataFrame
+        """
+        edges = self.callers[self.callers["method"] == method]
+        return edges.sort_values("self_time", ascending=False, kind="stable").reset_index(
+            drop=True
+        )
+
+    def to_call_cycles(self) -> list[CallCycle]:
+        """
+        Convert the table back into :class:`CallCycle` objects, e.g. for the exporters in
+        :mod:`pyplantsim.profile_export`.
+
+        :return: One call cycle per method.
+        :rtype: list[CallCycle]
+        """
+        callers: dict[str, list[CallerEntry]] = {}
+        for method, caller, called, self_time, callees_time in self.callers[
+            self.CALLER_COLUMNS
+        ].itertuples(index=False):
+            callers.setdefault(method, []).append(
+                CallerEntry(caller, called, self_time, callees_time)
+            )
+
+        return [
+            CallCycle(
+                CallCycleMethod(method, called, self_, self_time, callees_time),
+                callers.get(method, []),
+            )
+            for method, called, self_, self_time, callees_time in self.methods[
+                self.METHOD_COLUMNS[:5]
+            ].itertuples(index=False)
+        ]
+
+    def __len__(self) -> int:
+        """
+        Number of methods.
+
+        :return: Number of methods.
+        :rtype: int
+        """
+        return len(self.methods)
+
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the table.
+
+        :return: String representation.
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"methods={len(self.methods)}, "
+            f"callers={len(self.callers)}, "
+            f"runs={self.runs})"
+        )
@@ -0,0 +1,434 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import os
+import queue
+import re
+import threading
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+
+
+logger = logging.getLogger(__name__)
+
+
+# Optional timestamp, level and source in front of the message, e.g.
+# "2024-05-17 08:15:02.120 Warning .Models.Model.Init: Buffer is full"
+CONSOLE_LINE_PATTERN = re.compile(
+    r"^(?:(?P<timestamp>\d{4}[-/.]\d{2}[-/.]\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?)\s+)?"
+    r"(?:\[?(?P<level>fatal|error|warning|info|debug)\]?:?\s+)?"
+    r"(?:(?P<source>\.[\w.]+(?:\[[^\]]*\])?):\s*)?"
+    r"(?P<message>.*)$",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class ConsoleRecord:
+    """
+    Line of the Plant Simulation console.
+
+    :ivar line: The complete line.
+    :vartype line: str
+    :ivar message: The line without timestamp, level and source.
+    :vartype message: str
+    :ivar timestamp: Timestamp in front of the line.
+    :vartype timestamp: datetime | None
+    :ivar level: Upper case level, e.g. ``ERROR`` or ``WARNING``.
+    :vartype level: str | None
+    :ivar source: Path of the object that wrote the line.
+    :vartype source: str | None
+    """
+
+    line: str
+    message: str
+    timestamp: datetime | None = None
+    level: str | None = None
+    source: str | None = None
+
+    @staticmethod
+    def parse(line: str, pattern: re.Pattern[str] = CONSOLE_LINE_PATTERN) -> "ConsoleRecord":
+        """
+        Parse a console line.
+
+        :param line: The line without line break.
+        :type line: str
+        :param pattern: Pattern with the optional named groups ``timestamp``, ``level``,
+            ``source`` and ``message``.
+        :type pattern: re.Pattern[str]
+        :return: The record. Only ``line`` and ``message`` are set if the pattern does not
+            match.
+        :rtype: ConsoleRecord
+        """
+        match = pattern.match(line)
+        if match is None:
+            return ConsoleRecord(line=line, message=line)
+
+        groups = match.groupdict()
+        timestamp = None
+        if groups.get("timestamp"):
+            text = groups["timestamp"]
+            date = text[:10].replace("/", "-").replace(".", "-")
+            try:
+                timestamp = datetime.fromisoformat(date + text[10:].replace(",", "."))
+            except ValueError:
+                pass
+        level = groups.get("level")
+
+        return ConsoleRecord(
+            line=line,
+            message=groups.get("message") or "",
+            timestamp=timestamp,
+            level=level.upper() if level else None,
+            source=groups.get("source") or None,
+        )
+
+
+class ConsoleTailer:
+    """
+    Follower of the console log file written after :meth:`Plantsim.open_console_log_file`,
+    created by :meth:`Plantsim.tail_console_log`.
+
+    A background thread reads the lines appended to the file every ``poll_interval`` seconds,
+    so the file is never loaded into memory. Every complete line is parsed into a
+    :class:`ConsoleRecord` and, if it passes the filters, passed to the callback and put into
+    a queue of at most ``capacity`` records, from which a consumer takes them::
+
+        with plantsim.tail_console_log("console.log", levels=["ERROR"]) as tailer:
+            plantsim.run_simulation()
+        for record in tailer:
+            print(record.source, record.message)
+
+    If the queue is full, the thread stops reading until a consumer took records, the file
+    keeps the lines in the meantime. Without a queue (``capacity=0``) the records are only
+    passed to the callback, which is called from the background thread.
+
+    A file that got shorter (e.g. truncated by a new routing) is read again from its start.
+
+    :param path: Path to the log file. It does not need to exist yet.
+    :type path: str | os.PathLike[str]
+    :param callback: Called with every record passing the filters.
+    :type callback: Callable[[ConsoleRecord], None] | None
+    :param capacity: Maximum number of queued records, 0 to not queue records.
+    :type capacity: int
+    :param levels: Only pass records with one of these levels. All records if None.
+    :type levels: Iterable[str] | None
+    :param match: Only pass records whose message matches this regular expression.
+    :type match: str | re.Pattern[str] | None
+    :param predicate: Only pass records for which this returns True.
+    :type predicate: Callable[[ConsoleRecord], bool] | None
+    :param pattern: Pattern splitting the lines, see :meth:`ConsoleRecord.parse`.
+    :type pattern: re.Pattern[str]
+    :param from_start: Read the lines already in the file, otherwise start at its end.
+    :type from_start: bool
+    :param poll_interval: Time in seconds between two reads of the file.
+    :type poll_interval: float
+    :param encoding: Encoding of the file.
+    :type encoding: str
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        callback: Callable[[ConsoleRecord], None] | None = None,
+        capacity: int = 10_000,
+        levels: Iterable[str] | None = None,
+        match: str | re.Pattern[str] | None = None,
+        predicate: Callable[[ConsoleRecord], bool] | None = None,
+        pattern: re.Pattern[str] = CONSOLE_LINE_PATTERN,
+        from_start: bool = True,
+        poll_interval: float = 0.1,
+        encoding: str = "utf-8",
+    ) -> None:
+        """
+        Initialize the tailer. It does not read the file before :meth:`start`.
+
+        :param path: Path to the log file. It does not need to exist yet.
+        :type path: str | os.PathLike[str]
+        :param callback: Called with every record passing the filters.
+        :type callback: Callable[[ConsoleRecord], None] | None
+        :param capacity: Maximum number of queued records, 0 to not queue records.
+        :type capacity: int
+        :param levels: Only pass records with one of these levels. All records if None.
+        :type levels: Iterable[str] | None
+        :param match: Only pass records whose message matches this regular expression.
+        :type match: str | re.Pattern[str] | None
+        :param predicate: Only pass records for which this returns True.
+        :type predicate: Callable[[ConsoleRecord], bool] | None
+        :param pattern: Pattern splitting the lines, see :meth:`ConsoleRecord.parse`.
+        :type pattern: re.Pattern[str]
+        :param from_start: Read the lines already in the file, otherwise start at its end.
+        :type from_start: bool
+        :param poll_interval: Time in seconds between two reads of the file.
+        :type poll_interval: float
+        :param encoding: Encoding of the file.
+        :type encoding: str
+        :raises ValueError: If the capacity is negative.
+        """
+        if capacity < 0:
+            raise ValueError("capacity must not be negative.")
+
+        self._path = path
+        self._callback = callback
+        self._levels = {level.upper() for level in levels} if levels is not None else None
+        self._match = re.compile(match) if isinstance(match, str) else match
+        self._predicate = predicate
+        self._pattern = pattern
+        self._from_start = from_start
+        self._poll_interval = poll_interval
+        self._encoding = encoding
+
+        self._queue: queue.Queue[ConsoleRecord] | None = (
+            queue.Queue(capacity) if capacity > 0 else None
+        )
+        self._offset = 0
+        self._partial = b""
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._lines = 0
+        self._records = 0
+        self._dropped = 0
+
+    def start(self) -> "ConsoleTailer":
+        """
+        Start following the file in a background thread.
+
+        :return: The tailer.
+        :rtype: ConsoleTailer
+        """
+        if self._thread is not None:
+            return self
+        if not self._from_start:
+            try:
+                self._offset = os.path.getsize(self._path)
+            except OSError:
+                self._offset = 0
+
+        self._thread = threading.Thread(target=self._follow, name="ConsoleTailer", daemon=True)
+        self._thread.start()
+        return self
+
+    def _follow(self) -> None:
+        """
+        Read the file until stopped, then read it a last time, including an unterminated last
+        line.
+        """
+        while not self._stop.wait(self._poll_interval):
+            self.poll()
+        self.poll()
+        if self._partial:
+            self._handle_line(self._partial)
+            self._partial = b""
+
+    def poll(self) -> int:
+        """
+        Read the lines appended since the last read. Called by the background thread, call it
+        directly only without :meth:`start`.
+
+        :return: Number of records passing the filters.
+        :rtype: int
+        """
+        try:
+            size = os.path.getsize(self._path)
+        except OSError:
+            return 0
+        if size < self._offset:
+            logger.info(f"{self._path} got shorter, reading it again from its start.")
+            self._offset = 0
+            self._partial = b""
+        if size == self._offset:
+            return 0
+
+        passed = 0
+        with open(self._path, "rb") as f:
+            f.seek(self._offset)
+            while chunk := f.read(1 << 16):
+                self._offset += len(chunk)
+                *lines, self._partial = (self._partial + chunk).split(b"\n")
+                for line in lines:
+                    passed += self._handle_line(line)
+        return passed
+
+    def _handle_line(self, raw: bytes) -> int:
+        """
+        Parse a line and pass it on if it passes the filters.
+
+        :param raw: The line without line break.
+        :type raw: bytes
+        :return: 1 if the line passed the filters, otherwise 0.
+        :rtype: int
+        """
+        self._lines += 1
+        record = ConsoleRecord.parse(
+            raw.rstrip(b"\r").decode(self._encoding, errors="replace"), self._pattern
+        )
+        if self._levels is not None and record.level not in self._levels:
+            return 0
+        if self._match is not None and self._match.search(record.message) is None:
+            return 0
+        if self._predicate is not None and not self._predicate(record):
+            return 0
+
+        self._records += 1
+        if self._callback is not None:
+            try:
+                self._callback(record)
+            except Exception:
+                logger.exception("Console callback failed.")
+        if self._queue is not None:
+            self._put(record)
+        return 1
+
+    def _put(self, record: ConsoleRecord) -> None:
+        """
+        Queue a record, waiting while the queue is full. Dropped once the tailer is stopped.
+
+        :param record: The record.
+        :type record: ConsoleRecord
+        """
+        assert self._queue is not None
+        while True:
+            stopped = self._stop.is_set()
+            try:
+                self._queue.put(record, block=not stopped, timeout=self._poll_interval)
+                return
+            except queue.Full:
+                if stopped:
+                    self._dropped += 1
+                    return
+
+    def get(self, timeout: float | None = None) -> ConsoleRecord | None:
+        """
+        Take the oldest queued record, waiting for one if the queue is empty.
+
+        :param timeout: Maximum time to wait in seconds. Waits until the tailer is stopped if
+            None.
+        :type timeout: float | None
+        :return: The record, or None if none arrived in time or the tailer is stopped.
+        :rtype: ConsoleRecord | None
+        """
+        if self._queue is None:
+            return None
+        waited = 0.0
+        while True:
+            try:
+                return self._queue.get(timeout=self._poll_interval)
+            except queue.Empty:
+                waited += self._poll_interval
+                if not self.running or (timeout is not None and waited >= timeout):
+                    try:
+                        return self._queue.get_nowait()
+                    except queue.Empty:
+                        return None
+
+    def drain(self) -> list[ConsoleRecord]:
+        """
+        Take all queued records without waiting.
+
+        :return: The records.
+        :rtype: list[ConsoleRecord]
+        """
+        records: list[ConsoleRecord] = []
+        if self._queue is None:
+            return records
+        while True:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                return records
+
+    def __iter__(self) -> Iterator[ConsoleRecord]:
+        """
+        Iterate over the records as they arrive until the tailer is stopped and the queue is
+        empty.
+
+        :return: Iterator over the records.
+        :rtype: Iterator[ConsoleRecord]
+        """
+        while (record := self.get()) is not None:
+            yield record
+
+    def close(self) -> None:
+        """
+        Read the lines written so far and stop following the file. Queued records can still be
+        taken.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ConsoleTailer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the background thread follows the file.
+
+        :return: True if running.
+        :rtype: bool
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def lines(self) -> int:
+        """
+        Number of lines read.
+
+        :return: Number of lines.
+        :rtype: int
+        """
+        return self._lines
+
+    @property
+    def records(self) -> int:
+        """
+        Number of records passing the filters.
+
+        :return: Number of records.
+        :rtype: int
+        """
+        return self._records
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of records not queued because the queue was still full when the tailer was
+        stopped.
+
+        :return: Number of records.
+        :rtype: int
+        """
+        return self._dropped
+
+    @property
+    def offset(self) -> int:
+        """
+        Position in the file up to which it has been read.
+
+        :return: Position in bytes.
+        :rtype: int
+        """
+        return self._offset
+
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the tailer.
+
+        :return: String representation.
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"path={str(self._path)!r}, "
+            f"lines={self._lines}, "
+            f"records={self._records}, "
+            f"running={self.running})"
+        )
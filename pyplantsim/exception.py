@@ -132,3 +132,15 @@ class SeedOutOfRangeException(PlantsimStateException):
 
 class UnknownSimulationErrorException(PlantsimStateException):
     """Raised when a simulation error event is set but carries no error detail."""
+
+
+class SubscriptionException(PlantsimStateException):
+    """Raised when the observers of an attribute subscription could not be installed."""
+
+
+class MessageChannelException(PlantsimStateException):
+    """Raised when the batched message channel could not be installed."""
+
+
+class TraceException(PlantsimStateException):
+    """Raised when the entity trace could not be installed."""
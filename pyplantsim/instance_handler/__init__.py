@@ -5,6 +5,12 @@ from .instance_handler import DynamicInstanceHandler
 from .instance_handler import FixedInstanceHandler
 from .job import Job
 from .job import SimulationJob
+from .metrics import HandlerMetrics
+from .metrics import JobTimings
+from .metrics import MetricsExporter
+from .metrics import MetricsSnapshot
+from .placement import CpuSlot
+from .placement import PlacementPolicy
 
 
 __all__ = [
@@ -15,4 +21,10 @@ __all__ = [
     "Job",
     "SimulationJob",
     "InstanceHandlerNotInitializedException",
+    "PlacementPolicy",
+    "CpuSlot",
+    "HandlerMetrics",
+    "JobTimings",
+    "MetricsExporter",
+    "MetricsSnapshot",
 ]
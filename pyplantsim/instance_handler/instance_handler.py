@@ -4,6 +4,7 @@ from abc import ABC
 from collections import deque
 import functools
 import gc
+import logging
 import queue
 import threading
 import time
@@ -13,17 +14,27 @@ from typing import Callable
 from typing import TypedDict
 from typing import Unpack
 
-import psutil
-import pythoncom
-
+from ..backends import ComBackend
+from ..backends import RemoteControlBackend
 from ..exception import SimulationException
+from ..instrumentation import ComProfiler
 from ..licenses import PlantsimLicense
+from ..model_cache import ModelCache
 from ..plantsim import Plantsim
+from ..trace_capture import TraceCapture
+from ..trace_capture import TraceSpec
 from ..versions import PlantsimVersion
 from .exception import InstanceHandlerNotInitializedException
 from .job import Job
 from .job import ShutdownWorkerJob
 from .job import SimulationJob
+from .metrics import HandlerMetrics
+from .metrics import MetricsExporter
+from .metrics import MetricsSnapshot
+from .placement import PlacementPolicy
+
+
+logger = logging.getLogger(__name__)
 
 
 def requires_initialized(method: Callable[..., Any]) -> Callable[..., Any]:
@@ -64,6 +75,22 @@ class BaseInstanceHandlerKwargs(TypedDict, total=False):
     :type fire_simtalk_msg_callback: Callable[[str], None] | None
     :key simulation_error_callback: Callback for simulation errors.
     :type simulation_error_callback: Callable[[SimulationException], None] | None
+    :key com_profiler: Profiler recording the COM calls of all instances.
+    :type com_profiler: ComProfiler | None
+    :key backend: Backend providing the RemoteControl objects.
+    :type backend: RemoteControlBackend | None
+    :key model_cache: Local cache all instances load their models from.
+    :type model_cache: ModelCache | None
+    :key cache_metadata: Cache model metadata in every instance.
+    :type cache_metadata: bool
+    :key placement: CPU placement policy for the instance processes.
+    :type placement: PlacementPolicy | None
+    :key metrics_port: Local port to serve Prometheus metrics on.
+    :type metrics_port: int | None
+    :key prepare: Preparation run once in the background while the instances start.
+    :type prepare: Callable[[], None] | None
+    :key worker_init: Initialization run by every worker on its instance before taking jobs.
+    :type worker_init: Callable[[Plantsim], None] | None
     """
 
     version: PlantsimVersion | str
@@ -77,6 +104,14 @@ class BaseInstanceHandlerKwargs(TypedDict, total=False):
     simtalk_msg_callback: Callable[[str], None] | None
     fire_simtalk_msg_callback: Callable[[str], None] | None
     simulation_error_callback: Callable[[SimulationException], None] | None
+    com_profiler: ComProfiler | None
+    backend: RemoteControlBackend | None
+    model_cache: ModelCache | None
+    cache_metadata: bool
+    placement: PlacementPolicy | None
+    metrics_port: int | None
+    prepare: Callable[[], None] | None
+    worker_init: Callable[[Plantsim], None] | None
 
 
 class BaseInstanceHandler(ABC):
@@ -105,6 +140,27 @@ class BaseInstanceHandler(ABC):
     :type fire_simtalk_msg_callback: Callable[[str], None] | None
     :param simulation_error_callback: Callback for simulation errors.
     :type simulation_error_callback: Callable[[SimulationException], None] | None
+    :param com_profiler: Profiler recording the COM calls of all instances.
+    :type com_profiler: ComProfiler | None
+    :param backend: Backend providing the RemoteControl objects. Defaults to COM.
+    :type backend: RemoteControlBackend | None
+    :param model_cache: Local cache all instances load their models from.
+    :type model_cache: ModelCache | None
+    :param cache_metadata: Cache model metadata in every instance.
+    :type cache_metadata: bool
+    :param placement: CPU placement policy for the instance processes.
+    :type placement: PlacementPolicy | None
+    :param metrics_port: Local port to serve Prometheus metrics on. Disabled if None.
+    :type metrics_port: int | None
+    :param prepare: Preparation (e.g. copying or generating the model file) run once in a
+        background thread while the instances start. Workers wait for it before ``worker_init``.
+        If it fails, workers skip ``worker_init`` and finish all jobs as failed without running
+        them.
+    :type prepare: Callable[[], None] | None
+    :param worker_init: Initialization (e.g. loading the model) run by every worker on its
+        instance before it takes jobs. All workers run it concurrently. A worker whose
+        initialization raises finishes the jobs it takes as failed without running them.
+    :type worker_init: Callable[[Plantsim], None] | None
     """
 
     def __init__(
@@ -120,6 +176,14 @@ class BaseInstanceHandler(ABC):
         simtalk_msg_callback: Callable[[str], None] | None = None,
         fire_simtalk_msg_callback: Callable[[str], None] | None = None,
         simulation_error_callback: Callable[[SimulationException], None] | None = None,
+        com_profiler: ComProfiler | None = None,
+        backend: RemoteControlBackend | None = None,
+        model_cache: ModelCache | None = None,
+        cache_metadata: bool = False,
+        placement: PlacementPolicy | None = None,
+        metrics_port: int | None = None,
+        prepare: Callable[[], None] | None = None,
+        worker_init: Callable[[Plantsim], None] | None = None,
     ):
         """
         Initialize the InstanceHandler with the given parameters.
@@ -146,6 +210,27 @@ class BaseInstanceHandler(ABC):
         :type fire_simtalk_msg_callback: Callable[[str], None] | None
         :param simulation_error_callback: Callback for simulation errors.
         :type simulation_error_callback: Callable[[SimulationException], None] | None
+        :param com_profiler: Profiler recording the COM calls of all instances.
+        :type com_profiler: ComProfiler | None
+        :param backend: Backend providing the RemoteControl objects. Defaults to COM.
+        :type backend: RemoteControlBackend | None
+        :param model_cache: Local cache all instances load their models from.
+        :type model_cache: ModelCache | None
+        :param cache_metadata: Cache model metadata in every instance.
+        :type cache_metadata: bool
+        :param placement: CPU placement policy for the instance processes.
+        :type placement: PlacementPolicy | None
+        :param metrics_port: Local port to serve Prometheus metrics on. Disabled if None.
+        :type metrics_port: int | None
+        :param prepare: Preparation (e.g. copying or generating the model file) run once in a
+            background thread while the instances start. Workers wait for it before
+            ``worker_init``. If it fails, workers skip ``worker_init`` and finish all jobs as
+            failed without running them.
+        :type prepare: Callable[[], None] | None
+        :param worker_init: Initialization (e.g. loading the model) run by every worker on its
+            instance before it takes jobs. All workers run it concurrently. A worker whose
+            initialization raises finishes the jobs it takes as failed without running them.
+        :type worker_init: Callable[[Plantsim], None] | None
         """
         self._job_queue: queue.Queue[Job] = queue.Queue()
         self._shutdown_event = threading.Event()
@@ -153,6 +238,22 @@ class BaseInstanceHandler(ABC):
         self._workers_lock = threading.Lock()
         self._results: dict[str, threading.Event] = {}
         self._cancel_flags: dict[str, threading.Event] = {}
+        self._placement = placement
+        self._metrics = HandlerMetrics()
+        self._metrics_exporter = (
+            MetricsExporter(self._metrics, metrics_port) if metrics_port is not None else None
+        )
+        self._worker_counter = 0
+
+        self._prepare = prepare
+        self._prepare_done = threading.Event()
+        self._prepare_error: BaseException | None = None
+        self._worker_init = worker_init
+        self._ready = threading.Condition()
+        self._workers_starting = 0
+        self._startup_timings: dict[str, dict[str, float]] = {}
+
+        self._backend: RemoteControlBackend = backend if backend is not None else ComBackend()
 
         self._plantsim_kwargs = dict(
             version=version,
@@ -166,6 +267,10 @@ class BaseInstanceHandler(ABC):
             simtalk_msg_callback=simtalk_msg_callback,
             fire_simtalk_msg_callback=fire_simtalk_msg_callback,
             simulation_error_callback=simulation_error_callback,
+            com_profiler=com_profiler,
+            backend=self._backend,
+            model_cache=model_cache,
+            cache_metadata=cache_metadata,
         )
 
         self._initialized = False
@@ -191,9 +296,37 @@ class BaseInstanceHandler(ABC):
         self.shutdown()
 
     def initialize(self) -> "BaseInstanceHandler":
+        if self._placement:
+            self._placement.apply_orchestrator()
+
+        if self._metrics_exporter:
+            self._metrics_exporter.start()
+
+        self._prepare_done.clear()
+        self._prepare_error = None
+        if self._prepare:
+            threading.Thread(
+                target=self._run_prepare, name="pyplantsim-prepare", daemon=True
+            ).start()
+        else:
+            self._prepare_done.set()
+
         self._initialized = True
         return self
 
+    def _run_prepare(self) -> None:
+        """
+        Run the preparation callable and release the waiting workers.
+        """
+        assert self._prepare is not None
+        try:
+            self._prepare()
+        except BaseException as e:
+            logger.exception("Preparation failed.")
+            self._prepare_error = e
+        finally:
+            self._prepare_done.set()
+
     @requires_initialized
     def _create_worker(self, **plantsim_kwargs: Unpack[BaseInstanceHandlerKwargs]) -> None:
         """
@@ -202,8 +335,17 @@ class BaseInstanceHandler(ABC):
         :param plantsim_kwargs: Keyword arguments for the Plantsim instance.
         :type plantsim_kwargs: BaseInstanceHandlerKwargs
         """
+        with self._ready:
+            self._workers_starting += 1
+
         with self._workers_lock:
-            t = threading.Thread(target=self._worker, args=(plantsim_kwargs,), daemon=True)
+            self._worker_counter += 1
+            t = threading.Thread(
+                target=self._worker,
+                args=(plantsim_kwargs,),
+                name=f"pyplantsim-worker-{self._worker_counter}",
+                daemon=True,
+            )
             t.start()
             self._workers.append(t)
 
@@ -229,6 +371,9 @@ class BaseInstanceHandler(ABC):
         for t in workers:
             t.join()
 
+        if self._metrics_exporter:
+            self._metrics_exporter.stop()
+
         self._initialized = False
 
     @requires_initialized
@@ -247,37 +392,202 @@ class BaseInstanceHandler(ABC):
 
         :param plantsim_args: Arguments for the Plantsim instance.
         """
-        pythoncom.CoInitialize()
+        worker_name = threading.current_thread().name
+        starting = True
+        self._backend.initialize_thread()
 
         try:
+            launched = time.perf_counter()
             with Plantsim(**plantsim_args) as instance:
-                while True:
-                    job = self._job_queue.get()
+                timings = {"launch": time.perf_counter() - launched}
+                pid = self._apply_placement(instance)
+                self._metrics.worker_started(worker_name)
+                try:
+                    init_timings = self._initialize_worker(instance)
+                    if init_timings is None:
+                        logger.error(f"{worker_name} takes no jobs, its initialization failed.")
+                        self._mark_ready(worker_name, None)
+                        starting = False
+                        self._reject_jobs()
+                        return
+                    timings.update(init_timings)
+                    timings.update(instance.startup_timings)
+                    self._mark_ready(worker_name, timings)
+                    starting = False
+                    self._process_jobs(instance)
+                finally:
+                    self._metrics.worker_stopped(worker_name)
+                    if self._placement and pid is not None:
+                        self._placement.release(pid)
+        finally:
+            if starting:
+                self._mark_ready(worker_name, None)
+            time.sleep(0.1)
+            self._backend.uninitialize_thread()
+            gc.collect()
+
+    def _initialize_worker(self, instance: Plantsim) -> dict[str, float] | None:
+        """
+        Wait for the preparation and run the worker initialization on the given instance. The
+        initialization is skipped if the preparation failed.
+
+        :param instance: The freshly started Plantsim instance.
+        :type instance: Plantsim
+        :return: Duration of the waiting and initialization phases in seconds, or None if the
+            preparation or the worker initialization failed.
+        :rtype: dict[str, float] | None
+        """
+        timings: dict[str, float] = {}
+
+        start = time.perf_counter()
+        self._prepare_done.wait()
+        timings["wait_prepare"] = time.perf_counter() - start
+
+        if self._prepare_error is not None:
+            return None
+
+        if self._worker_init:
+            start = time.perf_counter()
+            try:
+                self._worker_init(instance)
+            except Exception:
+                logger.exception(f"worker_init failed on {threading.current_thread().name}.")
+                return None
+            timings["worker_init"] = time.perf_counter() - start
+
+        return timings
+
+    def _mark_ready(self, worker_name: str, timings: dict[str, float] | None) -> None:
+        """
+        Mark a worker as done starting and notify the threads waiting for readiness.
+
+        :param worker_name: Name of the worker thread.
+        :type worker_name: str
+        :param timings: Startup timings of the worker or None if the startup failed.
+        :type timings: dict[str, float] | None
+        """
+        with self._ready:
+            self._workers_starting -= 1
+            if timings is not None:
+                self._startup_timings[worker_name] = timings
+                logger.debug(f"{worker_name} ready: {timings}")
+            self._ready.notify_all()
+
+    def _apply_placement(self, instance: Plantsim) -> int | None:
+        """
+        Pin the process of the given instance according to the placement policy.
+
+        :param instance: The freshly started Plantsim instance.
+        :type instance: Plantsim
+        :return: Process ID of the instance or None if no policy is set.
+        :rtype: int | None
+        """
+        if not self._placement:
+            return None
 
-                    if isinstance(job, ShutdownWorkerJob):
-                        self._finish_job(job)
-                        break
-                    elif not isinstance(job, SimulationJob):
-                        self._finish_job(job)
-                        raise TypeError(f"Unexpected job type: {type(job)}")
+        pid = instance.get_current_process_id()
+        self._placement.acquire(pid)
+        return pid
 
-                    cancel_event = self._cancel_flags.get(job.job_id)
+    def _process_jobs(self, instance: Plantsim) -> None:
+        """
+        Process jobs from the queue until a shutdown job is received.
 
+        :param instance: The Plantsim instance of the worker.
+        :type instance: Plantsim
+        """
+        while True:
+            job = self._job_queue.get()
+
+            if isinstance(job, ShutdownWorkerJob):
+                self._finish_job(job)
+                break
+            elif not isinstance(job, SimulationJob):
+                self._finish_job(job)
+                raise TypeError(f"Unexpected job type: {type(job)}")
+
+            cancel_event = self._cancel_flags.get(job.job_id)
+            timings = self._metrics.job_started(job.job_id, threading.current_thread().name)
+
+            on_init = timings.wrap_on_init(job.on_init)
+            traces: list[TraceCapture] = []
+            if job.trace is not None:
+                on_init = self._wrap_on_init_trace(on_init, job.trace, job.job_id, traces)
+
+            failed = True
+            try:
+                instance.run_simulation(
+                    without_animation=job.without_animation,
+                    on_progress=job.on_progress,
+                    on_endsim=timings.wrap_on_endsim(job.on_endsim),
+                    on_init=on_init,
+                    on_simulation_error=job.on_simulation_error,
+                    cancel_event=cancel_event,
+                )
+                failed = False
+            finally:
+                for trace in traces:
+                    # A failing close must not keep the job from finishing
                     try:
-                        instance.run_simulation(
-                            without_animation=job.without_animation,
-                            on_progress=job.on_progress,
-                            on_endsim=job.on_endsim,
-                            on_init=job.on_init,
-                            on_simulation_error=job.on_simulation_error,
-                            cancel_event=cancel_event,
-                        )
-                    finally:
-                        self._finish_job(job)
-        finally:
-            time.sleep(0.1)
-            pythoncom.CoUninitialize()
-            gc.collect()
+                        trace.close()
+                    except Exception:
+                        logger.exception(f"Could not finish the trace of job {job.job_id}.")
+                        failed = True
+                self._metrics.job_finished(job.job_id, failed=failed)
+                self._finish_job(job)
+
+    def _reject_jobs(self) -> None:
+        """
+        Finish jobs from the queue as failed without running them until a shutdown job is
+        received, used by workers whose preparation or worker_init failed.
+        """
+        worker_name = threading.current_thread().name
+        while True:
+            job = self._job_queue.get()
+
+            if isinstance(job, SimulationJob):
+                logger.error(f"Job {job.job_id} not run, the worker initialization failed.")
+                self._metrics.job_started(job.job_id, worker_name)
+                self._metrics.job_finished(job.job_id, failed=True)
+            self._finish_job(job)
+            if isinstance(job, ShutdownWorkerJob):
+                break
+
+    @staticmethod
+    def _wrap_on_init_trace(
+        on_init: Callable[[Plantsim], None] | None,
+        trace: TraceSpec,
+        job_id: str,
+        traces: list[TraceCapture],
+    ) -> Callable[[Plantsim], None]:
+        """
+        Start the trace of a job after its on_init callback, which typically loads the model.
+
+        :param on_init: The on_init callback of the job.
+        :type on_init: Callable[[Plantsim], None] | None
+        :param trace: The trace to capture.
+        :type trace: TraceSpec
+        :param job_id: Id of the job, naming the trace file.
+        :type job_id: str
+        :param traces: Receives the started capture.
+        :type traces: list[TraceCapture]
+        :return: The wrapped callback.
+        :rtype: Callable[[Plantsim], None]
+        """
+
+        def wrapped(instance: Plantsim) -> None:
+            if on_init is not None:
+                on_init(instance)
+            traces.append(
+                instance.start_trace(
+                    trace.objects,
+                    trace.target(job_id),
+                    file_format=trace.file_format,
+                    row_group_rows=trace.row_group_rows,
+                )
+            )
+
+        return wrapped
 
     @requires_initialized
     def _finish_job(self, job: Job) -> None:
@@ -312,6 +622,9 @@ class BaseInstanceHandler(ABC):
         cancel_event = threading.Event()
         self._cancel_flags[job.job_id] = cancel_event
 
+        if isinstance(job, SimulationJob):
+            self._metrics.job_queued(job.job_id)
+
         self._job_queue.put(job)
         return job
 
@@ -342,6 +655,8 @@ class BaseInstanceHandler(ABC):
         Remove all not-yet-started jobs from the queue.
         """
         with self._job_queue.mutex:
+            for job in self._job_queue.queue:
+                self._metrics.job_discarded(job.job_id)
             self._job_queue.queue.clear()
 
     @requires_initialized
@@ -362,6 +677,7 @@ class BaseInstanceHandler(ABC):
                 if queued_job is not None and queued_job.job_id == job.job_id:
                     removed = True
                     self._results.pop(job.job_id, None)
+                    self._metrics.job_discarded(job.job_id)
                 else:
                     new_queue.append(queued_job)
             self._job_queue.queue = new_queue
@@ -395,6 +711,56 @@ class BaseInstanceHandler(ABC):
                 count += 1
         return count
 
+    @requires_initialized
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        """
+        Block until all started workers have launched their instance and run ``worker_init``.
+
+        :param timeout: Maximum time to wait in seconds. Waits indefinitely if None.
+        :type timeout: float | None
+        :return: True if all workers finished starting, False on timeout.
+        :rtype: bool
+        :raises BaseException: The exception raised by ``prepare``, if it failed.
+        """
+        with self._ready:
+            finished = self._ready.wait_for(lambda: self._workers_starting == 0, timeout)
+
+        if self._prepare_error is not None:
+            raise self._prepare_error
+        return finished
+
+    @property
+    def startup_timings(self) -> dict[str, dict[str, float]]:
+        """
+        Startup phase durations in seconds of every worker that finished starting, by worker
+        name. Besides the phases of :attr:`Plantsim.startup_timings` these contain ``launch``
+        (the whole instance start), ``wait_prepare`` and ``worker_init``.
+
+        :return: Phase durations by worker name.
+        :rtype: dict[str, dict[str, float]]
+        """
+        with self._ready:
+            return {name: dict(timings) for name, timings in self._startup_timings.items()}
+
+    def metrics_snapshot(self) -> MetricsSnapshot:
+        """
+        Get a snapshot of the job timings, worker utilization, throughput and latencies.
+
+        :return: The current metrics.
+        :rtype: MetricsSnapshot
+        """
+        return self._metrics.snapshot()
+
+    @property
+    def metrics(self) -> HandlerMetrics:
+        """
+        The metrics collector of the handler.
+
+        :return: Metrics collector.
+        :rtype: HandlerMetrics
+        """
+        return self._metrics
+
     @property
     def number_instances(self) -> int:
         """
@@ -517,6 +883,8 @@ class DynamicInstanceHandler(BaseInstanceHandler):
         The scaler checks CPU and memory usage at regular intervals and
         increases or decreases the number of workers accordingly.
         """
+        import psutil
+
         psutil.cpu_percent()
         time.sleep(self.scale_interval)
         while self._active:
@@ -8,6 +8,7 @@ import uuid
 
 from ..exception import SimulationException
 from ..plantsim import Plantsim
+from ..trace_capture import TraceSpec
 
 
 @dataclass
@@ -43,6 +44,8 @@ class SimulationJob(Job):
     :vartype on_simulation_error: Callable[[Plantsim, SimulationException], None] | None = None
     :ivar on_progress: Callback to be called to report progress.
     :vartype on_progress: Callable[[Plantsim, float], None] | None = None
+    :ivar trace: Trace to capture during the run, into a file per job. Started after on_init.
+    :vartype trace: TraceSpec | None = None
     """
 
     without_animation: bool = True
@@ -50,6 +53,7 @@ class SimulationJob(Job):
     on_endsim: Callable[[Plantsim], None] | None = None
     on_simulation_error: Callable[[Plantsim, SimulationException], None] | None = None
     on_progress: Callable[[Plantsim, float], None] | None = None
+    trace: TraceSpec | None = None
 
 
 class ShutdownWorkerJob(Job):
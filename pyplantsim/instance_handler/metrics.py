@@ -0,0 +1,523 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+import logging
+import math
+import threading
+import time
+from typing import Callable
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+    from ..plantsim import Plantsim
+
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("queue_wait", "init", "simulate", "endsim", "total")
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _duration(start: float | None, end: float | None) -> float | None:
+    if start is None or end is None:
+        return None
+    return end - start
+
+
+@dataclass
+class JobTimings:
+    """
+    Timestamps (``time.time()``) of the phases of a single simulation job.
+
+    :ivar job_id: ID of the job.
+    :vartype job_id: str
+    :ivar queued_at: When the job was queued.
+    :vartype queued_at: float
+    :ivar worker: Name of the worker that processed the job.
+    :vartype worker: str | None
+    :ivar started_at: When a worker picked up the job.
+    :vartype started_at: float | None
+    :ivar init_finished_at: When ``on_init`` returned and the simulation was started.
+    :vartype init_finished_at: float | None
+    :ivar simulation_finished_at: When the simulation finished and ``on_endsim`` was called.
+    :vartype simulation_finished_at: float | None
+    :ivar finished_at: When the job was finished.
+    :vartype finished_at: float | None
+    :ivar failed: Whether the job raised an exception.
+    :vartype failed: bool
+    """
+
+    job_id: str
+    queued_at: float
+    worker: str | None = None
+    started_at: float | None = None
+    init_finished_at: float | None = None
+    simulation_finished_at: float | None = None
+    finished_at: float | None = None
+    failed: bool = False
+
+    def wrap_on_init(
+        self, callback: Callable[[Plantsim], None] | None
+    ) -> Callable[[Plantsim], None]:
+        """
+        Wrap an ``on_init`` callback so the end of the init phase gets recorded.
+
+        :param callback: The original callback.
+        :type callback: Callable[[Plantsim], None] | None
+        :return: The wrapped callback.
+        :rtype: Callable[[Plantsim], None]
+        """
+
+        def on_init(instance: Plantsim) -> None:
+            try:
+                if callback:
+                    callback(instance)
+            finally:
+                self.init_finished_at = time.time()
+
+        return on_init
+
+    def wrap_on_endsim(
+        self, callback: Callable[[Plantsim], None] | None
+    ) -> Callable[[Plantsim], None]:
+        """
+        Wrap an ``on_endsim`` callback so the end of the simulate phase gets recorded.
+
+        :param callback: The original callback.
+        :type callback: Callable[[Plantsim], None] | None
+        :return: The wrapped callback.
+        :rtype: Callable[[Plantsim], None]
+        """
+
+        def on_endsim(instance: Plantsim) -> None:
+            self.simulation_finished_at = time.time()
+            if callback:
+                callback(instance)
+
+        return on_endsim
+
+    def duration(self, phase: str) -> float | None:
+        """
+        Get the duration of a phase in seconds.
+
+        :param phase: One of ``queue_wait``, ``init``, ``simulate``, ``endsim`` or ``total``.
+        :type phase: str
+        :return: Duration or None if the phase has not been completed.
+        :rtype: float | None
+        """
+        match phase:
+            case "queue_wait":
+                return _duration(self.queued_at, self.started_at)
+            case "init":
+                return _duration(self.started_at, self.init_finished_at)
+            case "simulate":
+                return _duration(self.init_finished_at, self.simulation_finished_at)
+            case "endsim":
+                return _duration(self.simulation_finished_at, self.finished_at)
+            case "total":
+                return _duration(self.queued_at, self.finished_at)
+            case _:
+                raise ValueError(f"Unknown phase {phase!r}.")
+
+
+@dataclass
+class WorkerStats:
+    """
+    Utilization of a single worker.
+
+    :ivar name: Name of the worker thread.
+    :vartype name: str
+    :ivar started_at: When the worker was started.
+    :vartype started_at: float
+    :ivar stopped_at: When the worker was stopped.
+    :vartype stopped_at: float | None
+    :ivar jobs: Number of jobs processed.
+    :vartype jobs: int
+    :ivar busy_seconds: Seconds spent processing jobs.
+    :vartype busy_seconds: float
+    :ivar current_job_started_at: Start of the job currently being processed.
+    :vartype current_job_started_at: float | None
+    """
+
+    name: str
+    started_at: float
+    stopped_at: float | None = None
+    jobs: int = 0
+    busy_seconds: float = 0.0
+    current_job_started_at: float | None = None
+
+    def utilization(self, now: float) -> float:
+        """
+        Fraction of the worker's lifetime spent processing jobs.
+
+        :param now: The current time.
+        :type now: float
+        :return: Utilization between 0 and 1.
+        :rtype: float
+        """
+        end = self.stopped_at if self.stopped_at is not None else now
+        alive = end - self.started_at
+        if alive <= 0:
+            return 0.0
+
+        busy = self.busy_seconds
+        if self.current_job_started_at is not None:
+            busy += now - self.current_job_started_at
+        return min(1.0, busy / alive)
+
+
+@dataclass
+class MetricsSnapshot:
+    """
+    Point-in-time view of the handler metrics.
+
+    :ivar timestamp: When the snapshot was taken.
+    :vartype timestamp: float
+    :ivar jobs_queued: Jobs waiting in the queue.
+    :vartype jobs_queued: int
+    :ivar jobs_running: Jobs currently being processed.
+    :vartype jobs_running: int
+    :ivar jobs_completed: Jobs finished successfully since the handler started.
+    :vartype jobs_completed: int
+    :ivar jobs_failed: Jobs that raised an exception since the handler started.
+    :vartype jobs_failed: int
+    :ivar throughput: Finished jobs per second over the throughput window.
+    :vartype throughput: float
+    :ivar latencies: Quantiles of the phase durations of the recent jobs, by phase and quantile.
+    :vartype latencies: dict[str, dict[float, float]]
+    :ivar workers: Utilization of every worker by worker name.
+    :vartype workers: dict[str, float]
+    :ivar recent_jobs: Timings of the most recently finished jobs.
+    :vartype recent_jobs: list[JobTimings]
+    """
+
+    timestamp: float
+    jobs_queued: int
+    jobs_running: int
+    jobs_completed: int
+    jobs_failed: int
+    throughput: float
+    latencies: dict[str, dict[float, float]] = field(default_factory=dict)
+    workers: dict[str, float] = field(default_factory=dict)
+    recent_jobs: list[JobTimings] = field(default_factory=list)
+
+    def to_prometheus(self, prefix: str = "pyplantsim") -> str:
+        """
+        Render the snapshot in the Prometheus text exposition format.
+
+        :param prefix: Prefix of all metric names.
+        :type prefix: str
+        :return: The metrics as text.
+        :rtype: str
+        """
+        lines: list[str] = []
+
+        def metric(name: str, kind: str, help: str, samples: list[tuple[str, float]]) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {value}")
+
+        metric("jobs_queued", "gauge", "Jobs waiting in the queue.", [("", self.jobs_queued)])
+        metric("jobs_running", "gauge", "Jobs being processed.", [("", self.jobs_running)])
+        metric(
+            "jobs_completed_total",
+            "counter",
+            "Jobs finished successfully.",
+            [("", self.jobs_completed)],
+        )
+        metric("jobs_failed_total", "counter", "Jobs that failed.", [("", self.jobs_failed)])
+        metric(
+            "throughput_jobs_per_second",
+            "gauge",
+            "Finished jobs per second.",
+            [("", self.throughput)],
+        )
+        metric(
+            "job_phase_seconds",
+            "summary",
+            "Duration of the job phases of the recent jobs.",
+            [
+                (f'{{phase="{phase}",quantile="{q}"}}', value)
+                for phase, quantiles in self.latencies.items()
+                for q, value in quantiles.items()
+            ],
+        )
+        metric(
+            "worker_utilization",
+            "gauge",
+            "Fraction of the worker lifetime spent processing jobs.",
+            [(f'{{worker="{name}"}}', value) for name, value in self.workers.items()],
+        )
+
+        return "\n".join(lines) + "\n"
+
+
+def _quantile(values: list[float], q: float) -> float:
+    """
+    Nearest-rank quantile of sorted values.
+
+    :param values: Sorted values.
+    :type values: list[float]
+    :param q: Quantile between 0 and 1.
+    :type q: float
+    :return: The quantile.
+    :rtype: float
+    """
+    rank = max(1, math.ceil(q * len(values)))
+    return values[rank - 1]
+
+
+class HandlerMetrics:
+    """
+    Thread-safe collector of job timings and worker utilization of an instance handler.
+
+    :param window: Number of recently finished jobs used for the latency quantiles.
+    :type window: int
+    :param throughput_window: Seconds over which the throughput is averaged.
+    :type throughput_window: float
+    """
+
+    def __init__(self, window: int = 1000, throughput_window: float = 60.0) -> None:
+        """
+        Initialize the metrics collector.
+
+        :param window: Number of recently finished jobs used for the latency quantiles.
+        :type window: int
+        :param throughput_window: Seconds over which the throughput is averaged.
+        :type throughput_window: float
+        """
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._throughput_window = throughput_window
+        self._pending: dict[str, JobTimings] = {}
+        self._running: dict[str, JobTimings] = {}
+        self._recent: deque[JobTimings] = deque(maxlen=window)
+        self._finish_times: deque[float] = deque()
+        self._workers: dict[str, WorkerStats] = {}
+        self._completed = 0
+        self._failed = 0
+
+    def job_queued(self, job_id: str) -> None:
+        """
+        Record that a job has been queued.
+
+        :param job_id: ID of the job.
+        :type job_id: str
+        """
+        with self._lock:
+            self._pending[job_id] = JobTimings(job_id=job_id, queued_at=time.time())
+
+    def job_discarded(self, job_id: str) -> None:
+        """
+        Forget a job that was removed from the queue before it started.
+
+        :param job_id: ID of the job.
+        :type job_id: str
+        """
+        with self._lock:
+            self._pending.pop(job_id, None)
+
+    def job_started(self, job_id: str, worker: str) -> JobTimings:
+        """
+        Record that a worker picked up a job.
+
+        :param job_id: ID of the job.
+        :type job_id: str
+        :param worker: Name of the worker.
+        :type worker: str
+        :return: The timings of the job, to be filled in while it runs.
+        :rtype: JobTimings
+        """
+        now = time.time()
+        with self._lock:
+            timings = self._pending.pop(job_id, None) or JobTimings(job_id=job_id, queued_at=now)
+            timings.worker = worker
+            timings.started_at = now
+            self._running[job_id] = timings
+
+            stats = self._workers.get(worker)
+            if stats:
+                stats.current_job_started_at = now
+
+        return timings
+
+    def job_finished(self, job_id: str, failed: bool = False) -> None:
+        """
+        Record that a job has finished.
+
+        :param job_id: ID of the job.
+        :type job_id: str
+        :param failed: Whether the job raised an exception.
+        :type failed: bool
+        """
+        now = time.time()
+        with self._lock:
+            timings = self._running.pop(job_id, None)
+            if timings is None:
+                return
+
+            timings.finished_at = now
+            timings.failed = failed
+            if timings.init_finished_at is not None and timings.simulation_finished_at is None:
+                # The simulation was cancelled or crashed, so on_endsim was never called
+                timings.simulation_finished_at = now
+
+            self._recent.append(timings)
+            self._finish_times.append(now)
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+            stats = self._workers.get(timings.worker or "")
+            if stats and stats.current_job_started_at is not None:
+                stats.busy_seconds += now - stats.current_job_started_at
+                stats.current_job_started_at = None
+                stats.jobs += 1
+
+    def worker_started(self, worker: str) -> None:
+        """
+        Record that a worker has been started.
+
+        :param worker: Name of the worker.
+        :type worker: str
+        """
+        with self._lock:
+            self._workers[worker] = WorkerStats(name=worker, started_at=time.time())
+
+    def worker_stopped(self, worker: str) -> None:
+        """
+        Record that a worker has been stopped.
+
+        :param worker: Name of the worker.
+        :type worker: str
+        """
+        with self._lock:
+            stats = self._workers.get(worker)
+            if stats:
+                stats.stopped_at = time.time()
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        Take a consistent snapshot of the current metrics.
+
+        :return: The snapshot.
+        :rtype: MetricsSnapshot
+        """
+        now = time.time()
+        with self._lock:
+            while self._finish_times and self._finish_times[0] < now - self._throughput_window:
+                self._finish_times.popleft()
+
+            elapsed = min(self._throughput_window, now - self._started_at)
+            throughput = len(self._finish_times) / elapsed if elapsed > 0 else 0.0
+
+            recent = list(self._recent)
+            latencies: dict[str, dict[float, float]] = {}
+            for phase in PHASES:
+                values = sorted(
+                    d for d in (timings.duration(phase) for timings in recent) if d is not None
+                )
+                if values:
+                    latencies[phase] = {q: _quantile(values, q) for q in QUANTILES}
+
+            return MetricsSnapshot(
+                timestamp=now,
+                jobs_queued=len(self._pending),
+                jobs_running=len(self._running),
+                jobs_completed=self._completed,
+                jobs_failed=self._failed,
+                throughput=throughput,
+                latencies=latencies,
+                workers={
+                    name: stats.utilization(now)
+                    for name, stats in self._workers.items()
+                    if stats.stopped_at is None
+                },
+                recent_jobs=recent,
+            )
+
+
+class MetricsExporter:
+    """
+    Serves the metrics of a handler in the Prometheus text format over HTTP.
+
+    :param metrics: The metrics to export.
+    :type metrics: HandlerMetrics
+    :param port: Port to listen on.
+    :type port: int
+    :param host: Host to bind to. Defaults to the loopback interface.
+    :type host: str
+    """
+
+    def __init__(self, metrics: HandlerMetrics, port: int, host: str = "127.0.0.1") -> None:
+        """
+        Initialize the exporter without starting it.
+
+        :param metrics: The metrics to export.
+        :type metrics: HandlerMetrics
+        :param port: Port to listen on.
+        :type port: int
+        :param host: Host to bind to.
+        :type host: str
+        """
+        self._metrics = metrics
+        self._address = (host, port)
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """
+        Start serving the metrics in a background thread.
+        """
+        from http.server import BaseHTTPRequestHandler
+        from http.server import ThreadingHTTPServer
+
+        metrics = self._metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                body = metrics.snapshot().to_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug(format, *args)
+
+        self._server = ThreadingHTTPServer(self._address, Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Serving handler metrics on http://{self._address[0]}:{self.port}/.")
+
+    def stop(self) -> None:
+        """
+        Stop serving the metrics.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def port(self) -> int:
+        """
+        The port the exporter listens on.
+
+        :return: Port number.
+        :rtype: int
+        """
+        if self._server:
+            return int(self._server.server_address[1])
+        return self._address[1]
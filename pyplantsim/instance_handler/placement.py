@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+import sys
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PhysicalCore:
+    """
+    A physical CPU core and the logical CPUs (hyperthreads) that belong to it.
+
+    :ivar node: NUMA node the core belongs to.
+    :vartype node: int
+    :ivar cpus: Logical CPU ids of the core, the first one being the primary thread.
+    :vartype cpus: tuple[int, ...]
+    """
+
+    node: int
+    cpus: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class CpuSlot:
+    """
+    A set of logical CPUs a single Plant Simulation instance gets pinned to.
+
+    :ivar node: NUMA node all CPUs of the slot belong to.
+    :vartype node: int
+    :ivar cpus: Logical CPU ids of the slot.
+    :vartype cpus: tuple[int, ...]
+    """
+
+    node: int
+    cpus: tuple[int, ...]
+
+
+def _parse_cpu_list(cpu_list: str) -> list[int]:
+    """
+    Parse a Linux cpu list string such as ``0-3,8,10-11``.
+
+    :param cpu_list: The cpu list string.
+    :type cpu_list: str
+    :return: The logical CPU ids.
+    :rtype: list[int]
+    """
+    cpus: list[int] = []
+    for part in cpu_list.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            first, last = part.split("-")
+            cpus.extend(range(int(first), int(last) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def _detect_sysfs_topology() -> list[PhysicalCore] | None:
+    """
+    Read the core and NUMA topology from sysfs (Linux only).
+
+    :return: Physical cores or None if sysfs is not available.
+    :rtype: list[PhysicalCore] | None
+    """
+    cpu_root = Path("/sys/devices/system/cpu")
+    if not cpu_root.exists():
+        return None
+
+    node_of_cpu: dict[int, int] = {}
+    for node_dir in Path("/sys/devices/system/node").glob("node[0-9]*"):
+        node = int(node_dir.name[len("node") :])
+        for cpu in _parse_cpu_list((node_dir / "cpulist").read_text()):
+            node_of_cpu[cpu] = node
+
+    seen: set[tuple[int, ...]] = set()
+    cores: list[PhysicalCore] = []
+    for cpu in _parse_cpu_list((cpu_root / "online").read_text()):
+        siblings_file = cpu_root / f"cpu{cpu}" / "topology" / "thread_siblings_list"
+        if not siblings_file.exists():
+            return None
+        siblings = tuple(sorted(_parse_cpu_list(siblings_file.read_text())))
+        if siblings in seen:
+            continue
+        seen.add(siblings)
+        cores.append(PhysicalCore(node=node_of_cpu.get(siblings[0], 0), cpus=siblings))
+
+    return cores
+
+
+def detect_topology() -> list[PhysicalCore]:
+    """
+    Detect the physical cores of the machine.
+
+    On Linux the topology is read from sysfs, including NUMA nodes. On other platforms
+    psutil only reports core counts, so hyperthreads are assumed to be enumerated next to
+    each other (as Windows does) and all cores are put on NUMA node 0.
+
+    :return: Physical cores ordered by their first logical CPU.
+    :rtype: list[PhysicalCore]
+    """
+    if sys.platform.startswith("linux"):
+        cores = _detect_sysfs_topology()
+        if cores:
+            return sorted(cores, key=lambda core: core.cpus[0])
+
+    import psutil
+
+    logical = psutil.cpu_count(logical=True) or 1
+    physical = psutil.cpu_count(logical=False) or logical
+    threads_per_core = max(1, logical // physical)
+
+    return [
+        PhysicalCore(
+            node=0,
+            cpus=tuple(range(i * threads_per_core, (i + 1) * threads_per_core)),
+        )
+        for i in range(logical // threads_per_core)
+    ]
+
+
+class PlacementPolicy:
+    """
+    Opt-in CPU placement policy for the Plant Simulation processes of an instance handler.
+
+    Every instance is pinned to its own set of physical cores. Hyperthread siblings are left
+    idle by default, slots never span NUMA nodes and consecutive slots alternate between nodes
+    so the instances are spread evenly across the memory controllers. The first
+    ``reserved_cores`` cores are kept free for the Python orchestrator process.
+
+    :param cores_per_instance: Number of physical cores per instance.
+    :type cores_per_instance: int
+    :param reserved_cores: Number of physical cores reserved for the orchestrator.
+    :type reserved_cores: int
+    :param skip_smt_siblings: Only use the primary thread of every physical core.
+    :type skip_smt_siblings: bool
+    :param numa_aware: Alternate slots between NUMA nodes.
+    :type numa_aware: bool
+    :param lower_priority: Lower the scheduling priority of the worker processes.
+    :type lower_priority: bool
+    :param pin_orchestrator: Pin the orchestrator process to the reserved cores.
+    :type pin_orchestrator: bool
+    :param topology: Physical cores to plan with. Detected automatically if not given.
+    :type topology: list[PhysicalCore] | None
+    """
+
+    def __init__(
+        self,
+        cores_per_instance: int = 1,
+        reserved_cores: int = 1,
+        skip_smt_siblings: bool = True,
+        numa_aware: bool = True,
+        lower_priority: bool = False,
+        pin_orchestrator: bool = False,
+        topology: list[PhysicalCore] | None = None,
+    ) -> None:
+        """
+        Initialize the placement policy and plan the CPU slots.
+
+        :param cores_per_instance: Number of physical cores per instance.
+        :type cores_per_instance: int
+        :param reserved_cores: Number of physical cores reserved for the orchestrator.
+        :type reserved_cores: int
+        :param skip_smt_siblings: Only use the primary thread of every physical core.
+        :type skip_smt_siblings: bool
+        :param numa_aware: Alternate slots between NUMA nodes.
+        :type numa_aware: bool
+        :param lower_priority: Lower the scheduling priority of the worker processes.
+        :type lower_priority: bool
+        :param pin_orchestrator: Pin the orchestrator process to the reserved cores.
+        :type pin_orchestrator: bool
+        :param topology: Physical cores to plan with. Detected automatically if not given.
+        :type topology: list[PhysicalCore] | None
+        :raises ValueError: If the core counts are invalid.
+        """
+        if cores_per_instance < 1:
+            raise ValueError("cores_per_instance must be at least 1.")
+        if reserved_cores < 0:
+            raise ValueError("reserved_cores must not be negative.")
+
+        self.cores_per_instance = cores_per_instance
+        self.reserved_cores = reserved_cores
+        self.skip_smt_siblings = skip_smt_siblings
+        self.numa_aware = numa_aware
+        self.lower_priority = lower_priority
+        self.pin_orchestrator = pin_orchestrator
+
+        self._lock = threading.Lock()
+        self._assigned: dict[int, CpuSlot] = {}
+
+        cores = topology if topology is not None else detect_topology()
+        self._reserved_cpus, self._slots = self._plan(cores)
+
+    def _cpus_of(self, cores: list[PhysicalCore]) -> tuple[int, ...]:
+        """
+        Get the logical CPUs to use of the given cores.
+
+        :param cores: Physical cores.
+        :type cores: list[PhysicalCore]
+        :return: Logical CPU ids.
+        :rtype: tuple[int, ...]
+        """
+        if self.skip_smt_siblings:
+            return tuple(core.cpus[0] for core in cores)
+        return tuple(cpu for core in cores for cpu in core.cpus)
+
+    def _plan(self, cores: list[PhysicalCore]) -> tuple[tuple[int, ...], list[CpuSlot]]:
+        """
+        Split the cores into the orchestrator reservation and the instance slots.
+
+        :param cores: Physical cores of the machine.
+        :type cores: list[PhysicalCore]
+        :return: Reserved logical CPUs and the ordered instance slots.
+        :rtype: tuple[tuple[int, ...], list[CpuSlot]]
+        """
+        ordered = sorted(cores, key=lambda core: (core.node, core.cpus[0]))
+        reserved = ordered[: self.reserved_cores]
+        available = ordered[self.reserved_cores :]
+
+        # Reserved cores keep all their threads, the orchestrator benefits from them
+        reserved_cpus = tuple(cpu for core in reserved for cpu in core.cpus)
+
+        slots_per_node: dict[int, list[CpuSlot]] = {}
+        for node in sorted({core.node for core in available}):
+            node_cores = [core for core in available if core.node == node]
+            size = self.cores_per_instance
+            for i in range(0, len(node_cores) - size + 1, size):
+                group = node_cores[i : i + size]
+                slots_per_node.setdefault(node, []).append(
+                    CpuSlot(node=node, cpus=self._cpus_of(group))
+                )
+
+        if not self.numa_aware:
+            return reserved_cpus, [slot for slots in slots_per_node.values() for slot in slots]
+
+        # Interleave the nodes so that consecutive instances land on different nodes
+        slots: list[CpuSlot] = []
+        queues = list(slots_per_node.values())
+        while any(queues):
+            for node_slots in queues:
+                if node_slots:
+                    slots.append(node_slots.pop(0))
+
+        return reserved_cpus, slots
+
+    def apply_orchestrator(self) -> None:
+        """
+        Report the reserved cores and pin the orchestrator process to them if requested.
+        """
+        logger.info(f"CPUs reserved for the orchestrator: {list(self._reserved_cpus)}.")
+
+        if not self.pin_orchestrator or not self._reserved_cpus:
+            return
+
+        import psutil
+
+        process = psutil.Process(os.getpid())
+        if not hasattr(process, "cpu_affinity"):
+            logger.warning("CPU affinity is not supported on this platform.")
+            return
+
+        try:
+            process.cpu_affinity(list(self._reserved_cpus))
+        except (psutil.Error, OSError, ValueError) as e:
+            logger.warning(f"Could not pin the orchestrator process: {e}")
+
+    def acquire(self, pid: int) -> CpuSlot | None:
+        """
+        Assign the next free slot to the given process and apply affinity and priority.
+
+        :param pid: Process ID of the Plant Simulation instance.
+        :type pid: int
+        :return: The assigned slot or None if all slots are taken.
+        :rtype: CpuSlot | None
+        """
+        with self._lock:
+            taken = set(self._assigned.values())
+            slot = next((s for s in self._slots if s not in taken), None)
+            if slot is not None:
+                self._assigned[pid] = slot
+
+        import psutil
+
+        try:
+            process = psutil.Process(pid)
+
+            if self.lower_priority:
+                if sys.platform == "win32":
+                    process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+                else:
+                    process.nice(10)
+
+            if slot is None:
+                logger.warning(f"No free CPU slot left, instance {pid} stays unpinned.")
+                return None
+
+            if not hasattr(process, "cpu_affinity"):
+                logger.warning("CPU affinity is not supported on this platform.")
+                return slot
+
+            process.cpu_affinity(list(slot.cpus))
+            logger.info(f"Pinned instance {pid} to CPUs {list(slot.cpus)} (node {slot.node}).")
+        except (psutil.Error, OSError, ValueError) as e:
+            logger.warning(f"Could not apply placement to instance {pid}: {e}")
+
+        return slot
+
+    def release(self, pid: int) -> None:
+        """
+        Free the slot of the given process.
+
+        :param pid: Process ID of the Plant Simulation instance.
+        :type pid: int
+        """
+        with self._lock:
+            self._assigned.pop(pid, None)
+
+    @property
+    def reserved_cpus(self) -> tuple[int, ...]:
+        """
+        Logical CPUs reserved for the orchestrator process.
+
+        :return: Logical CPU ids.
+        :rtype: tuple[int, ...]
+        """
+        return self._reserved_cpus
+
+    @property
+    def slots(self) -> list[CpuSlot]:
+        """
+        All planned instance slots in assignment order.
+
+        :return: Instance slots.
+        :rtype: list[CpuSlot]
+        """
+        return list(self._slots)
+
+    @property
+    def assignments(self) -> dict[int, CpuSlot]:
+        """
+        Currently assigned slots by process ID.
+
+        :return: Mapping of process ID to slot.
+        :rtype: dict[int, CpuSlot]
+        """
+        with self._lock:
+            return dict(self._assigned)
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+import math
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Any
+
+
+# Upper bounds (in seconds) of the latency histogram buckets
+BUCKETS: tuple[float, ...] = (
+    1e-5,
+    5e-5,
+    1e-4,
+    5e-4,
+    1e-3,
+    5e-3,
+    1e-2,
+    5e-2,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    math.inf,
+)
+
+# Modules whose functions count as the calling pyplantsim API
+_API_MODULES = frozenset({"pyplantsim.plantsim"})
+
+
+@dataclass
+class ComCallStats:
+    """
+    Call count and latency histogram of a single COM method.
+
+    :ivar count: Number of calls.
+    :vartype count: int
+    :ivar total_seconds: Summed latency of all calls.
+    :vartype total_seconds: float
+    :ivar min_seconds: Fastest call.
+    :vartype min_seconds: float
+    :ivar max_seconds: Slowest call.
+    :vartype max_seconds: float
+    :ivar buckets: Number of calls per latency bucket, see :data:`BUCKETS`.
+    :vartype buckets: list[int]
+    """
+
+    count: int = 0
+    total_seconds: float = 0.0
+    min_seconds: float = math.inf
+    max_seconds: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(BUCKETS))
+
+    def record(self, seconds: float) -> None:
+        """
+        Add a call to the statistics.
+
+        :param seconds: Latency of the call.
+        :type seconds: float
+        """
+        self.count += 1
+        self.total_seconds += seconds
+        self.min_seconds = min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a latency quantile from the histogram (upper bucket bound).
+
+        :param q: Quantile between 0 and 1.
+        :type q: float
+        :return: Estimated latency in seconds.
+        :rtype: float
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, amount in zip(BUCKETS, self.buckets):
+            seen += amount
+            if seen >= rank:
+                return min(bound, self.max_seconds)
+        return self.max_seconds
+
+    @property
+    def mean_seconds(self) -> float:
+        """
+        Mean latency of the calls.
+
+        :return: Mean latency in seconds.
+        :rtype: float
+        """
+        return self.total_seconds / self.count if self.count else 0.0
+
+
+def _calling_api(frame: FrameType | None) -> str:
+    """
+    Find the outermost pyplantsim API method of the contiguous pyplantsim frames.
+
+    :param frame: The frame to start searching from.
+    :type frame: FrameType | None
+    :return: Qualified name of the API method or ``<external>``.
+    :rtype: str
+    """
+    api = "<external>"
+    while frame is not None:
+        if frame.f_globals.get("__name__") in _API_MODULES:
+            api = frame.f_code.co_qualname
+        elif api != "<external>":
+            break
+        frame = frame.f_back
+    return api
+
+
+class ComProfiler:
+    """
+    Thread-safe collector of COM call statistics, grouped by COM method and calling API.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty profiler.
+        """
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], ComCallStats] = {}
+
+    def record(self, method: str, api: str, seconds: float) -> None:
+        """
+        Record a single COM call.
+
+        :param method: Name of the COM method, e.g. ``GetValue``.
+        :type method: str
+        :param api: The pyplantsim API that issued the call.
+        :type api: str
+        :param seconds: Latency of the call.
+        :type seconds: float
+        """
+        with self._lock:
+            stats = self._stats.get((method, api))
+            if stats is None:
+                stats = self._stats[(method, api)] = ComCallStats()
+            stats.record(seconds)
+
+    def reset(self) -> None:
+        """
+        Discard all recorded calls.
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def by_method(self) -> dict[str, ComCallStats]:
+        """
+        Statistics per COM method, summed over all calling APIs.
+
+        :return: Statistics by COM method.
+        :rtype: dict[str, ComCallStats]
+        """
+        result: dict[str, ComCallStats] = {}
+        for (method, _), stats in self.by_method_and_api().items():
+            merged = result.setdefault(method, ComCallStats())
+            merged.count += stats.count
+            merged.total_seconds += stats.total_seconds
+            merged.min_seconds = min(merged.min_seconds, stats.min_seconds)
+            merged.max_seconds = max(merged.max_seconds, stats.max_seconds)
+            merged.buckets = [a + b for a, b in zip(merged.buckets, stats.buckets)]
+        return result
+
+    def by_method_and_api(self) -> dict[tuple[str, str], ComCallStats]:
+        """
+        Statistics per COM method and calling pyplantsim API.
+
+        :return: Copies of the statistics by (COM method, API).
+        :rtype: dict[tuple[str, str], ComCallStats]
+        """
+        with self._lock:
+            return {
+                key: ComCallStats(
+                    count=stats.count,
+                    total_seconds=stats.total_seconds,
+                    min_seconds=stats.min_seconds,
+                    max_seconds=stats.max_seconds,
+                    buckets=list(stats.buckets),
+                )
+                for key, stats in self._stats.items()
+            }
+
+    @property
+    def total_calls(self) -> int:
+        """
+        Number of recorded COM calls.
+
+        :return: Number of calls.
+        :rtype: int
+        """
+        with self._lock:
+            return sum(stats.count for stats in self._stats.values())
+
+    def report(self) -> str:
+        """
+        Render a text report of all calls, sorted by total latency.
+
+        :return: The report.
+        :rtype: str
+        """
+        rows = sorted(
+            self.by_method_and_api().items(), key=lambda item: item[1].total_seconds, reverse=True
+        )
+
+        header = (
+            f"{'COM method':<22} {'pyplantsim API':<36} {'calls':>9} "
+            f"{'total [s]':>11} {'mean [ms]':>10} {'p99 [ms]':>10} {'max [ms]':>10}"
+        )
+        lines = [header, "-" * len(header)]
+        for (method, api), stats in rows:
+            lines.append(
+                f"{method:<22} {api:<36} {stats.count:>9} {stats.total_seconds:>11.4f} "
+                f"{stats.mean_seconds * 1e3:>10.3f} {stats.quantile(0.99) * 1e3:>10.3f} "
+                f"{stats.max_seconds * 1e3:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+class InstrumentedDispatch:
+    """
+    Proxy around the RemoteControl dispatch object that times every method call.
+
+    Attribute assignments and reads of non-callable attributes are passed through unchanged.
+
+    :param dispatch: The dispatch object to wrap.
+    :type dispatch: Any
+    :param profiler: The profiler to record the calls in.
+    :type profiler: ComProfiler
+    """
+
+    def __init__(self, dispatch: Any, profiler: ComProfiler) -> None:
+        """
+        Wrap the given dispatch object.
+
+        :param dispatch: The dispatch object to wrap.
+        :type dispatch: Any
+        :param profiler: The profiler to record the calls in.
+        :type profiler: ComProfiler
+        """
+        object.__setattr__(self, "_dispatch", dispatch)
+        object.__setattr__(self, "_profiler", profiler)
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._dispatch, name)
+        if not callable(attribute) or name.startswith("_"):
+            return attribute
+
+        profiler: ComProfiler = self._profiler
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                profiler.record(name, _calling_api(sys._getframe(1)), time.perf_counter() - start)
+
+        return timed
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._dispatch, name, value)
+
+    def __bool__(self) -> bool:
+        return bool(self._dispatch)
+
+    @property
+    def wrapped(self) -> Any:
+        """
+        The wrapped dispatch object.
+
+        :return: Dispatch object.
+        :rtype: Any
+        """
+        return self._dispatch
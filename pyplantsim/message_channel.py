@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from collections import deque
+import threading
+import time
+from typing import Iterator
+from typing import Literal
+from typing import TYPE_CHECKING
+
+from .tables import ROW_SEPARATOR
+
+
+if TYPE_CHECKING:
+    from .plantsim import Plantsim
+
+
+# First character of a batched payload fired by install_message_channel.st
+BATCH_PREFIX = chr(2)
+
+OverflowPolicy = Literal["drop_oldest", "drop_newest", "block"]
+
+
+class MessageChannel:
+    """
+    Batched, bounded channel for high volumes of SimTalk messages, created by
+    :meth:`Plantsim.open_message_channel`.
+
+    Models send messages with ``.PyplantsimMessages(msg)`` instead of ``fireSimTalkMessage``.
+    The model buffers them and fires a single payload per ``batch_size`` messages or
+    ``window`` simulated seconds, so the COM event and the Python event handling are paid per
+    batch instead of per message. The messages are put into a ring buffer of ``capacity``
+    messages, from which a consumer takes them::
+
+        channel = plantsim.open_message_channel(batch_size=1000)
+        plantsim.run_simulation()
+        for msg in channel.drain():
+            handle(msg)
+
+    If the buffer is full, ``drop_oldest`` discards the oldest and ``drop_newest`` the
+    incoming messages, ``block`` makes the event thread wait for the consumer, which also
+    pauses the delivery of further events. ``block`` only works with events delivered on
+    another thread than the one that opened the channel and a consumer on yet another thread.
+    Events arriving on the opening thread or on a consumer thread, :meth:`flush` and
+    :meth:`close` never wait and drop the incoming messages instead, counted in
+    :attr:`dropped`.
+
+    :param plantsim: The instance the channel belongs to.
+    :type plantsim: Plantsim
+    :param capacity: Maximum number of buffered messages.
+    :type capacity: int
+    :param policy: What to do with messages arriving while the buffer is full.
+    :type policy: Literal["drop_oldest", "drop_newest", "block"]
+    """
+
+    def __init__(
+        self, plantsim: Plantsim, capacity: int = 100_000, policy: OverflowPolicy = "drop_oldest"
+    ) -> None:
+        """
+        Initialize an empty channel.
+
+        :param plantsim: The instance the channel belongs to.
+        :type plantsim: Plantsim
+        :param capacity: Maximum number of buffered messages.
+        :type capacity: int
+        :param policy: What to do with messages arriving while the buffer is full.
+        :type policy: Literal["drop_oldest", "drop_newest", "block"]
+        :raises ValueError: If the capacity is not positive or the policy is unknown.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        if policy not in ("drop_oldest", "drop_newest", "block"):
+            raise ValueError(f"Unknown overflow policy: {policy}")
+
+        self._plantsim = plantsim
+        self._capacity = capacity
+        self._policy = policy
+        self._buffer: deque[str] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._closed = False
+        # Threads on which waiting for a consumer could never end: the thread that opened the
+        # channel, which receives the events of its own calls, and the consumer threads
+        self._no_wait_threads = {threading.get_ident()}
+
+        self._opened_at = time.perf_counter()
+        self._batches = 0
+        self._received = 0
+        self._consumed = 0
+        self._dropped = 0
+
+    def _put_payload(self, payload: str, block: bool = True) -> None:
+        """
+        Split a payload fired by the model into its messages and buffer them.
+
+        :param payload: Messages separated by :data:`ROW_SEPARATOR`.
+        :type payload: str
+        :param block: Whether the ``block`` policy may wait for a consumer. It never waits on
+            the thread that opened the channel, on a consumer thread or after the channel was
+            closed.
+        :type block: bool
+        """
+        if not payload:
+            return
+        messages = payload.split(ROW_SEPARATOR)
+
+        with self._not_empty:
+            self._batches += 1
+            self._received += len(messages)
+            wait = block and threading.get_ident() not in self._no_wait_threads
+
+            for msg in messages:
+                if len(self._buffer) >= self._capacity:
+                    if self._policy == "drop_oldest":
+                        self._buffer.popleft()
+                        self._dropped += 1
+                    else:
+                        if self._policy == "block" and wait:
+                            self._not_full.wait_for(
+                                lambda: len(self._buffer) < self._capacity or self._closed
+                            )
+                        if len(self._buffer) >= self._capacity:
+                            self._dropped += 1
+                            continue
+                self._buffer.append(msg)
+            self._not_empty.notify_all()
+
+    def flush(self) -> None:
+        """
+        Take the messages still buffered in the model, e.g. after a run. Never waits for a
+        consumer, messages not fitting into the buffer are dropped.
+        """
+        simtalk = self._plantsim._load_simtalk_script("flush_message_channel")
+        self._put_payload(str(self._plantsim.execute_sim_talk(simtalk) or ""), block=False)
+
+    def get(self, timeout: float | None = None) -> str | None:
+        """
+        Take the oldest message, waiting for one if the buffer is empty.
+
+        :param timeout: Maximum time to wait in seconds. Waits until the channel is closed if
+            None.
+        :type timeout: float | None
+        :return: The message, or None if none arrived in time or the channel is closed.
+        :rtype: str | None
+        """
+        batch = self.get_batch(1, timeout)
+        return batch[0] if batch else None
+
+    def get_batch(
+        self, max_messages: int | None = None, timeout: float | None = None
+    ) -> list[str]:
+        """
+        Take up to ``max_messages`` of the oldest messages, waiting for at least one if the
+        buffer is empty.
+
+        :param max_messages: Maximum number of messages. All buffered messages if None.
+        :type max_messages: int | None
+        :param timeout: Maximum time to wait in seconds. Waits until the channel is closed if
+            None.
+        :type timeout: float | None
+        :return: The messages, empty if none arrived in time or the channel is closed.
+        :rtype: list[str]
+        """
+        with self._not_empty:
+            self._no_wait_threads.add(threading.get_ident())
+            self._not_empty.wait_for(lambda: self._buffer or self._closed, timeout)
+            count = len(self._buffer) if max_messages is None else max_messages
+            batch = [self._buffer.popleft() for _ in range(min(count, len(self._buffer)))]
+            self._consumed += len(batch)
+            if batch:
+                self._not_full.notify_all()
+            return batch
+
+    def drain(self) -> list[str]:
+        """
+        Take all buffered messages without waiting.
+
+        :return: The messages.
+        :rtype: list[str]
+        """
+        return self.get_batch(timeout=0)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the messages as they arrive until the channel is closed and empty.
+
+        :return: Iterator over the messages.
+        :rtype: Iterator[str]
+        """
+        while True:
+            batch = self.get_batch()
+            if not batch:
+                return
+            yield from batch
+
+    def close(self) -> None:
+        """
+        Stop waiting for consumers and take the messages still buffered in the model. Waiting
+        consumers and producers are woken up, buffered messages can still be taken.
+        """
+        if self._closed:
+            return
+        with self._not_empty:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        try:
+            if self._plantsim.model_loaded:
+                self.flush()
+        finally:
+            self._plantsim._close_message_channel(self)
+
+    def __enter__(self) -> "MessageChannel":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Number of buffered messages.
+
+        :return: Number of messages.
+        :rtype: int
+        """
+        return len(self._buffer)
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the channel was closed.
+
+        :return: True if closed.
+        :rtype: bool
+        """
+        return self._closed
+
+    @property
+    def batches(self) -> int:
+        """
+        Number of payloads received from the model.
+
+        :return: Number of payloads.
+        :rtype: int
+        """
+        return self._batches
+
+    @property
+    def received(self) -> int:
+        """
+        Number of messages received from the model.
+
+        :return: Number of messages.
+        :rtype: int
+        """
+        return self._received
+
+    @property
+    def consumed(self) -> int:
+        """
+        Number of messages taken by consumers.
+
+        :return: Number of messages.
+        :rtype: int
+        """
+        return self._consumed
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of messages dropped because the buffer was full.
+
+        :return: Number of messages.
+        :rtype: int
+        """
+        return self._dropped
+
+    @property
+    def throughput(self) -> float:
+        """
+        Received messages per second since the channel was opened.
+
+        :return: Messages per second.
+        :rtype: float
+        """
+        elapsed = time.perf_counter() - self._opened_at
+        return self._received / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the channel.
+
+        :return: String representation.
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"capacity={self._capacity}, "
+            f"policy={self._policy!r}, "
+            f"buffered={len(self._buffer)}, "
+            f"received={self._received}, "
+            f"dropped={self._dropped})"
+        )
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+
+
+class MetadataCache:
+    """
+    Cache of model metadata that does not change between replications, such as the model
+    language, EventController attributes, table schemas and path existence.
+
+    Entries are grouped by kind (e.g. ``value`` or ``exists``) and keyed by a string, usually
+    the object path, so that all entries below a path can be invalidated at once.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty cache.
+        """
+        self._entries: dict[tuple[str, str], Any] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, kind: str, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Get a cached entry, loading and storing it on a miss.
+
+        :param kind: Kind of the entry.
+        :type kind: str
+        :param key: Key of the entry within its kind.
+        :type key: str
+        :param load: Loads the value on a miss.
+        :type load: Callable[[], Any]
+        :return: The cached or loaded value.
+        :rtype: Any
+        """
+        try:
+            value = self._entries[(kind, key)]
+        except KeyError:
+            self._misses += 1
+            value = self._entries[(kind, key)] = load()
+            return value
+
+        self._hits += 1
+        return value
+
+    def invalidate(self, path: str | None = None, kind: str | None = None) -> None:
+        """
+        Remove entries from the cache.
+
+        :param path: Only remove entries of this object path and the paths below it.
+        :type path: str | None
+        :param kind: Only remove entries of this kind.
+        :type kind: str | None
+        """
+
+        def matches(entry_kind: str, key: str) -> bool:
+            if kind is not None and entry_kind != kind:
+                return False
+            return path is None or key == path or key.startswith((f"{path}.", f"{path}["))
+
+        for entry in [entry for entry in self._entries if matches(*entry)]:
+            del self._entries[entry]
+
+    def reset_stats(self) -> None:
+        """
+        Reset the hit and miss counters.
+        """
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of lookups served from the cache.
+
+        :return: Number of hits.
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of lookups that had to query the model.
+
+        :return: Number of misses.
+        :rtype: int
+        """
+        return self._misses
+
+    def __len__(self) -> int:
+        """
+        Number of cached entries.
+
+        :return: Number of entries.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the cache.
+
+        :return: String representation.
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"entries={len(self._entries)}, "
+            f"hits={self._hits}, "
+            f"misses={self._misses})"
+        )
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+import shutil
+import threading
+from typing import Literal
+
+
+logger = logging.getLogger(__name__)
+
+# Read size when hashing model files
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ModelCache:
+    """
+    Local cache of model files, e.g. to avoid that every worker pulls the same model from a
+    network share.
+
+    A model is copied once into the cache directory and the copy is shared by all instances
+    using the same cache, also across processes. Before every load the source is checked again
+    so a changed model is copied anew. Cached files are evicted least recently used first once
+    the cache exceeds ``max_size_bytes``.
+
+    :param directory: Local directory holding the cached copies. Created if missing.
+    :type directory: str | os.PathLike[str]
+    :param max_size_bytes: Maximum total size of the cache. Unlimited if None.
+    :type max_size_bytes: int | None
+    :param key: How cached copies are keyed. ``mtime`` uses path, size and modification time of
+        the source and only needs a ``stat`` per check. ``hash`` uses the SHA-256 of the
+        content, which reads the whole source on every check but shares identical models
+        stored under different paths.
+    :type key: Literal["mtime", "hash"]
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        max_size_bytes: int | None = None,
+        key: Literal["mtime", "hash"] = "mtime",
+    ) -> None:
+        """
+        Initialize the cache and create its directory.
+
+        :param directory: Local directory holding the cached copies. Created if missing.
+        :type directory: str | os.PathLike[str]
+        :param max_size_bytes: Maximum total size of the cache. Unlimited if None.
+        :type max_size_bytes: int | None
+        :param key: How cached copies are keyed, ``mtime`` or ``hash``.
+        :type key: Literal["mtime", "hash"]
+        :raises ValueError: If the key or the maximum size is invalid.
+        """
+        if key not in ("mtime", "hash"):
+            raise ValueError(f"Unknown cache key: {key}")
+        if max_size_bytes is not None and max_size_bytes < 0:
+            raise ValueError("max_size_bytes must not be negative.")
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_bytes
+        self._key = key
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _cache_key(self, source: Path) -> str:
+        """
+        Compute the key of the current state of the source file.
+
+        :param source: The source model file.
+        :type source: Path
+        :return: Hex digest identifying the source state.
+        :rtype: str
+        """
+        if self._key == "mtime":
+            stat = source.stat()
+            state = f"{source.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+            return hashlib.sha256(state.encode()).hexdigest()
+
+        digest = hashlib.sha256()
+        with source.open("rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, source: str | os.PathLike[str]) -> str:
+        """
+        Get a fresh local copy of the given model file, copying it if necessary.
+
+        :param source: Path of the model file.
+        :type source: str | os.PathLike[str]
+        :return: Path of the cached copy.
+        :rtype: str
+        """
+        source_path = Path(source)
+        key = self._cache_key(source_path)
+        target = self._directory / f"{source_path.stem}-{key[:16]}{source_path.suffix}"
+
+        with self._lock:
+            if target.exists() and target.stat().st_size == source_path.stat().st_size:
+                self._hits += 1
+                # The modification time of the copies tracks their last use for the LRU order
+                os.utime(target)
+                return str(target)
+
+            self._misses += 1
+            logger.info(f"Caching {source_path} as {target}.")
+
+            # Copy to a unique temporary file first so that concurrent processes never see a
+            # partially written model
+            tmp = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                shutil.copyfile(source_path, tmp)
+                os.replace(tmp, target)
+            finally:
+                tmp.unlink(missing_ok=True)
+
+            self._evict(keep=target)
+
+        return str(target)
+
+    def _entries(self) -> list[Path]:
+        """
+        List the cached copies, least recently used first.
+
+        :return: Cached files.
+        :rtype: list[Path]
+        """
+        entries = [p for p in self._directory.iterdir() if p.is_file() and p.suffix != ".tmp"]
+        return sorted(entries, key=lambda p: p.stat().st_mtime)
+
+    def _evict(self, keep: Path) -> None:
+        """
+        Remove least recently used copies until the cache fits its maximum size.
+
+        :param keep: Copy that must not be evicted.
+        :type keep: Path
+        """
+        if self._max_size_bytes is None:
+            return
+
+        entries = self._entries()
+        size = sum(p.stat().st_size for p in entries)
+        for entry in entries:
+            if size <= self._max_size_bytes:
+                break
+            if entry == keep:
+                continue
+            try:
+                entry_size = entry.stat().st_size
+                entry.unlink()
+            except OSError as e:
+                # Copies still opened by an instance cannot be removed on Windows
+                logger.debug(f"Could not evict {entry}: {e}")
+                continue
+            size -= entry_size
+            logger.info(f"Evicted {entry} from the model cache.")
+
+    def clear(self) -> None:
+        """
+        Remove all cached copies.
+        """
+        with self._lock:
+            for entry in self._entries():
+                try:
+                    entry.unlink()
+                except OSError as e:
+                    logger.debug(f"Could not remove {entry}: {e}")
+
+    @property
+    def directory(self) -> Path:
+        """
+        The cache directory.
+
+        :return: Cache directory.
+        :rtype: Path
+        """
+        return self._directory
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        Total size of the cached copies.
+
+        :return: Size in bytes.
+        :rtype: int
+        """
+        return sum(p.stat().st_size for p in self._entries())
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of loads served by an existing copy.
+
+        :return: Number of cache hits.
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of loads that had to copy the model.
+
+        :return: Number of cache misses.
+        :rtype: int
+        """
+        return self._misses
+
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the cache.
+
+        :return: String representation.
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"directory={str(self._directory)!r}, "
+            f"max_size_bytes={self._max_size_bytes!r}, "
+            f"key={self._key!r}, "
+            f"hits={self._hits}, "
+            f"misses={self._misses})"
+        )
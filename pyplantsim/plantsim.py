@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from datetime import datetime
 from datetime import timedelta
 import importlib.resources
@@ -7,25 +8,35 @@ import json
 import logging
 import os
 from pathlib import Path
+import re
 import threading
 import time
 from types import TracebackType
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Iterable
+from typing import Iterator
+from typing import Literal
+from typing import Mapping
+from typing import Sequence
+from typing import TYPE_CHECKING
 
-from packaging.version import Version
-import pandas as pd
 from plantsimpath import PlantsimPath
-import pythoncom
-import win32com.client
 
+from .backends import ComBackend
+from .backends import RemoteControlBackend
 from .call_cycle import CallCycle
+from .call_cycle import CallCycleTable
+from .call_cycle import iter_call_cycle_dicts
+from .console_tailer import ConsoleRecord
+from .console_tailer import ConsoleTailer
 from .events import ErrorEvent
 from .events import PlantSimEvents
 from .exception import DatetimeFormatNotSetException
 from .exception import ErrorHandlerException
 from .exception import EventControllerNotSetException
+from .exception import MessageChannelException
 from .exception import ModelAlreadyLoadedException
 from .exception import ModelNotFoundException
 from .exception import ModelNotLoadedException
@@ -34,11 +45,51 @@ from .exception import PlantsimException
 from .exception import PlantsimNotRunningException
 from .exception import SeedOutOfRangeException
 from .exception import SimulationException
+from .exception import SubscriptionException
+from .exception import TraceException
 from .exception import UnknownSimulationErrorException
+from .instrumentation import ComProfiler
+from .instrumentation import InstrumentedDispatch
 from .licenses import PlantsimLicense
+from .message_channel import BATCH_PREFIX
+from .message_channel import MessageChannel
+from .message_channel import OverflowPolicy
+from .metadata_cache import MetadataCache
+from .model_cache import ModelCache
+from .subscription import Subscription
+from .table_tail import TableTail
+from .table_view import TableView
+from .tables import AGGREGATIONS
+from .tables import arrow_batch
+from .tables import CELL_SEPARATOR
+from .tables import changed_cells
+from .tables import column_number
+from .tables import import_pyarrow
+from .tables import numeric_frame
+from .tables import NUMERIC_TYPES
+from .tables import parse_cell
+from .tables import parse_index
+from .tables import parse_rows
+from .tables import partition_path
+from .tables import ROW_SEPARATOR
+from .tables import same_layout
+from .tables import simtalk_value
+from .tables import TABLE_SEPARATOR
+from .tables import TableLayout
+from .tables import typed_frame
+from .tables import WHERE_OPERATORS
+from .tables import write_batches
+from .tables import write_chunks
+from .trace_capture import TRACE_PREFIX
+from .trace_capture import TraceCapture
 from .versions import PlantsimVersion
 
 
+if TYPE_CHECKING:
+    from packaging.version import Version
+    import pandas as pd
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +142,18 @@ class Plantsim:
     :vartype _user_fire_simtalk_msg_cb: Callable[[str], None] | None
     :ivar _user_simulation_error_cb: Callback for simulation errors.
     :vartype _user_simulation_error_cb: Callable[[SimulationException], None] | None
+    :ivar _com_profiler: Profiler recording all COM calls of the instance.
+    :vartype _com_profiler: ComProfiler | None
+    :ivar _backend: Backend providing the RemoteControl object.
+    :vartype _backend: RemoteControlBackend
+    :ivar _startup_timings: Duration of the startup and model loading phases in seconds.
+    :vartype _startup_timings: dict[str, float]
+    :ivar _model_cache: Local cache the models are loaded from.
+    :vartype _model_cache: ModelCache | None
+    :ivar _metadata_cache: Cache of model metadata, None if disabled.
+    :vartype _metadata_cache: MetadataCache | None
+    :ivar _table_snapshots: Last DataFrame written in diff mode by table path.
+    :vartype _table_snapshots: dict[str, pd.DataFrame]
     """
 
     # Defaults
@@ -109,6 +172,10 @@ class Plantsim:
         simtalk_msg_callback: Callable[[str], None] | None = None,
         fire_simtalk_msg_callback: Callable[[str], None] | None = None,
         simulation_error_callback: Callable[[SimulationException], None] | None = None,
+        com_profiler: ComProfiler | None = None,
+        backend: RemoteControlBackend | None = None,
+        model_cache: ModelCache | None = None,
+        cache_metadata: bool = False,
     ) -> None:
         """
         Initialize the Siemens Tecnomatix Plant Simulation instance.
@@ -139,6 +206,15 @@ class Plantsim:
         :type simulation_error_callback: Callable[[SimulationException], None], optional
         :param event_polling_interval: Interval (in seconds) for polling events.
         :type event_polling_interval: float, optional
+        :param com_profiler: Record all COM calls of the instance in this profiler.
+        :type com_profiler: ComProfiler, optional
+        :param backend: Backend providing the RemoteControl. Defaults to the COM server.
+        :type backend: RemoteControlBackend, optional
+        :param model_cache: Load models from a local copy in this cache.
+        :type model_cache: ModelCache, optional
+        :param cache_metadata: Cache the model language, EventController start and end, table
+            schemas and path existence instead of querying them on every call.
+        :type cache_metadata: bool, optional
         """
         self._dispatch_id: str = self._DISPATCH_ID
         self._event_controller: PlantsimPath | None = None
@@ -155,6 +231,15 @@ class Plantsim:
         self._user_simtalk_msg_cb: Callable[[str], None] | None = None
         self._user_fire_simtalk_msg_cb: Callable[[str], None] | None = None
         self._user_simulation_error_cb: Callable[[SimulationException], None] | None = None
+        self._com_profiler = com_profiler
+        self._backend: RemoteControlBackend = backend if backend is not None else ComBackend()
+        self._startup_timings: dict[str, float] = {}
+        self._model_cache = model_cache
+        self._metadata_cache = MetadataCache() if cache_metadata else None
+        self._table_snapshots: dict[str, pd.DataFrame] = {}
+        self._subscriptions: list[Subscription] = []
+        self._message_channel: MessageChannel | None = None
+        self._trace: TraceCapture | None = None
 
         # Inits
         self.set_version(version)
@@ -181,8 +266,13 @@ class Plantsim:
         :param version: Plant Simulation version or string.
         :type version: PlantsimVersion | str
         """
+        from packaging.version import Version
+
         self._version = Version(version.value if isinstance(version, PlantsimVersion) else version)
 
+        # The EventController attributes were renamed in 25.4
+        self._legacy_event_controller = self._version < Version(PlantsimVersion.V_MJ_25_MI_4.value)
+
     def __enter__(self) -> "Plantsim":
         """
         Enter the runtime context for the PlantSim instance.
@@ -234,44 +324,71 @@ class Plantsim:
             on_fire_simtalk_message=self._user_fire_simtalk_msg_cb,
         )
 
+        self._startup_timings = {}
+
         # Dispatch the Instance
         try:
-            self._instance = cast(
-                Any,
-                win32com.client.DispatchWithEvents(self._dispatch_id, type(self._event_handler)),  # type: ignore[no-untyped-call]
-            )
+            with self._timed_phase("dispatch"):
+                self._instance = cast(
+                    Any, self._backend.dispatch(self._dispatch_id, type(self._event_handler))
+                )
             self._running = True
         except Exception as e:
             raise PlantsimException(e)
 
+        if self._com_profiler:
+            self._instance = InstrumentedDispatch(self._instance, self._com_profiler)
+
         self._instance.on_simulation_finished = self._internal_simulation_finished
         self._instance.on_simtalk_message = self._internal_on_simtalk_message
         self._instance.on_fire_simtalk_message = self._user_fire_simtalk_msg_cb
 
         # Initialize Event Listening
-        self._start_event_thread()
+        with self._timed_phase("start_event_thread"):
+            self._start_event_thread()
 
         # Should the instance window be visible on screen
-        self.set_visible(self._visible, force=True)
+        with self._timed_phase("set_visible"):
+            self.set_visible(self._visible, force=True)
 
         # Set license
         try:
-            self.set_license(self._license, force=True)
+            with self._timed_phase("set_license"):
+                self.set_license(self._license, force=True)
         except Exception as e:
             self.quit()
             raise PlantsimException(e)
 
         # Should the instance have access to the computer or not
-        self.set_trust_models(self._trusted, force=True)
+        with self._timed_phase("set_trust_models"):
+            self.set_trust_models(self._trusted, force=True)
 
         # Should the instance suppress the start of 3D
-        self.set_suppress_start_of_3d(self._suppress_3d, force=True)
+        with self._timed_phase("set_suppress_start_of_3d"):
+            self.set_suppress_start_of_3d(self._suppress_3d, force=True)
 
         # Should the instance show a message box
-        self.set_show_message_box(self._show_msg_box, force=True)
+        with self._timed_phase("set_show_message_box"):
+            self.set_show_message_box(self._show_msg_box, force=True)
+
+        logger.debug(f"Startup timings: {self._startup_timings}")
 
         return self
 
+    @contextmanager
+    def _timed_phase(self, phase: str) -> Iterator[None]:
+        """
+        Measure the duration of a startup phase and store it in the startup timings.
+
+        :param phase: Name of the phase.
+        :type phase: str
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._startup_timings[phase] = time.perf_counter() - start
+
     def __exit__(
         self,
         exc_type: type[BaseException] | None,
@@ -285,8 +402,10 @@ class Plantsim:
 
     def stop(self) -> None:
         """
-        Stop the Plant Simulation instance and clean up resources.
+        Stop the Plant Simulation instance and clean up resources. Open message channels,
+        trace captures and subscriptions are closed first.
         """
+        self._close_model_resources()
         self._running = False
         self._close_event_thread()
 
@@ -419,6 +538,13 @@ class Plantsim:
         :param msg: SimTalk message.
         :type msg: str
         """
+        if self._message_channel is not None and msg.startswith(BATCH_PREFIX):
+            self._message_channel._put_payload(msg[1:])
+            return
+        if self._trace is not None and msg.startswith(TRACE_PREFIX):
+            self._trace._put_payload(msg[1:])
+            return
+
         if self._is_json(msg):
             self._handle_simtalk_message(msg)
 
@@ -443,6 +569,10 @@ class Plantsim:
 
             if self._user_simulation_error_cb:
                 self._user_simulation_error_cb(exception)
+        elif payload["status"] == "change":
+            for subscription in list(self._subscriptions):
+                if payload["path"] in subscription._paths:
+                    subscription._on_change(payload["path"], payload.get("value"))
         else:
             if self._user_simtalk_msg_cb:
                 self._user_simtalk_msg_cb(msg)
@@ -504,13 +634,13 @@ class Plantsim:
         """
         Listen to events and handle COM messages.
         """
-        pythoncom.CoInitialize()
+        self._backend.initialize_thread()
         try:
             while self._running:
-                pythoncom.PumpWaitingMessages()
+                self._backend.pump_waiting_messages()
                 time.sleep(self._event_polling_interval)
         finally:
-            pythoncom.CoUninitialize()
+            self._backend.uninitialize_thread()
 
     def quit(self) -> None:
         """
@@ -535,10 +665,30 @@ class Plantsim:
         Close the active model.
         """
         logger.info("Closing model.")
+        self._close_model_resources()
         self._instance.CloseModel()
 
         self._model_loaded = False
         self._model_path = None
+        self.invalidate_metadata_cache()
+
+    def _close_model_resources(self) -> None:
+        """
+        Close the message channel, the trace capture and the subscriptions, which take their
+        remaining data from the model. A failing close is logged, so the others are still
+        closed and the trace file is still finished.
+        """
+        resources: list[MessageChannel | TraceCapture | Subscription] = list(self._subscriptions)
+        if self._message_channel is not None:
+            resources.append(self._message_channel)
+        if self._trace is not None:
+            resources.append(self._trace)
+
+        for resource in resources:
+            try:
+                resource.close()
+            except Exception:
+                logger.exception(f"Could not close {resource!r}.")
 
     def set_event_controller(self, path: PlantsimPath | None = None) -> None:
         """
@@ -568,6 +718,31 @@ class Plantsim:
 
         return self._instance.ExecuteSimTalk(source_code)
 
+    @contextmanager
+    def profile_com(self, profiler: ComProfiler | None = None) -> Iterator[ComProfiler]:
+        """
+        Record count and latency of every COM call made within the context.
+
+        Example::
+
+            with plantsim.profile_com() as profiler:
+                plantsim.get_table(PlantsimPath(".Models.Model.Results"))
+            print(profiler.report())
+
+        :param profiler: Profiler to record the calls in. A new one is created if not given.
+        :type profiler: ComProfiler, optional
+        :return: The profiler.
+        :rtype: Iterator[ComProfiler]
+        """
+        profiler = profiler if profiler is not None else ComProfiler()
+        previous = self._instance
+        self._instance = InstrumentedDispatch(previous, profiler)
+        try:
+            yield profiler
+        finally:
+            if self._instance is not None:
+                self._instance = previous
+
     def get_value(self, path: PlantsimPath) -> Any:
         """
         Get the value of an attribute of a Plant Simulation object.
@@ -581,35 +756,127 @@ class Plantsim:
 
         return value
 
-    def get_table(self, path: PlantsimPath) -> pd.DataFrame:
+    def _get_metadata_value(self, path: PlantsimPath) -> Any:
+        """
+        Get the value of an attribute that does not change between replications, served from
+        the metadata cache if enabled.
+
+        :param path: Path to the attribute.
+        :type path: PlantsimPath
+        :return: Attribute value.
+        :rtype: Any
+        """
+        if self._metadata_cache is None:
+            return self.get_value(path)
+
+        return self._metadata_cache.get("value", str(path), lambda: self.get_value(path))
+
+    def invalidate_metadata_cache(self, path: PlantsimPath | str | None = None) -> None:
+        """
+        Discard cached metadata and the tables remembered by :meth:`set_table` in diff mode,
+        e.g. after changing the model with SimTalk.
+
+        :param path: Only discard the state of this object and the objects below it.
+            Discards everything except the model languages if not given.
+        :type path: PlantsimPath | str, optional
+        """
+        if path is None:
+            self._table_snapshots.clear()
+        else:
+            self._table_snapshots.pop(str(path), None)
+
+        if self._metadata_cache is None:
+            return
+
+        if path is not None:
+            self._metadata_cache.invalidate(str(path))
+            return
+
+        # Model languages are keyed by file and modification time and therefore stay valid
+        self._metadata_cache.invalidate(kind="value")
+        self._metadata_cache.invalidate(kind="exists")
+
+    def get_table(
+        self,
+        path: PlantsimPath,
+        typed: bool = False,
+        downcast: bool = False,
+        columns: Sequence[str | int] | None = None,
+        where: tuple[str | int, str, Any] | None = None,
+        fixed_width: bool = False,
+    ) -> pd.DataFrame:
         """
         Get a DataFrame based on a Plant Simulation table object.
 
+        With ``columns`` or ``where`` given, the selection is evaluated inside Plant Simulation
+        and only the selected cells are transferred, in a single SimTalk call.
+
+        With ``fixed_width``, tables with only numeric columns are transferred as fixed-width
+        column blocks in a single SimTalk call and decoded vectorized, see
+        :func:`pyplantsim.tables.numeric_frame`. This needs an extra call for the data types and
+        pads every cell to the widest cell of its column, so it pays off for large tables with
+        evenly wide numbers. Other tables are read cell by cell as without it.
+
+        Example::
+
+            late = plantsim.get_table(
+                PlantsimPath(".Models.Model.Orders"),
+                columns=["OrderId", "Due"],
+                where=("Status", "=", "late"),
+            )
+
         :param path: Path to the table.
         :type path: str
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types
+            instead of ``object``, see :func:`pyplantsim.tables.typed_series`.
+        :type typed: bool, optional
+        :param downcast: Downcast numeric columns to the smallest fitting dtype. Requires typed.
+        :type downcast: bool, optional
+        :param columns: Columns to read, by name or by column number starting at 1, in this
+            order. Repeated columns are read once.
+        :type columns: Sequence[str | int], optional
+        :param where: Only read the rows matching ``(column, operator, value)``. Operators are
+            ``=``, ``!=``, ``<``, ``<=``, ``>`` and ``>=``. Numeric (integer, real, length,
+            weight, speed, acceleration) and time columns are compared as numbers (times in
+            seconds), all other columns as strings.
+        :type where: tuple[str | int, str, Any], optional
+        :param fixed_width: Transfer tables with only numeric columns as fixed-width column
+            blocks. Ignored with ``columns`` or ``where``.
+        :type fixed_width: bool, optional
         :return: DataFrame representing the table.
         :rtype: pd.DataFrame
         """
-        # Get data dimensions
+        import pandas as pd
+
+        if columns is not None or where is not None:
+            return self._select_table(path, columns, where, typed, downcast)
+
+        data_types: list[str] | None = None
+        if fixed_width:
+            data_types = self.get_table_column_data_types(path)
+            if data_types and all(data_type in NUMERIC_TYPES for data_type in data_types):
+                return self._read_numeric_table(path, data_types, typed, downcast)
+
+        # Get data dimensions. The number of rows is never cached, as tables grow during runs
         y_dim = self.get_value(PlantsimPath(path, "yDim"))
-        x_dim = self.get_value(PlantsimPath(path, "xDim"))
+        x_dim = self._get_metadata_value(PlantsimPath(path, "xDim"))
 
         # Check if indexes are active
-        row_index_active = self.get_value(PlantsimPath(path, "rowIndex"))
+        row_index_active = self._get_metadata_value(PlantsimPath(path, "rowIndex"))
         index: list[Any] | None = None
         if row_index_active:
             index = [
                 self.get_value(PlantsimPath(path, f"[0,{row}]")) for row in range(1, y_dim + 1)
             ]
 
-        col_index_active = self.get_value(PlantsimPath(path, "columnIndex"))
-        columns: list[str] | None = None
+        col_index_active = self._get_metadata_value(PlantsimPath(path, "columnIndex"))
+        header: list[str] | None = None
         index_name: str | None = None
         if col_index_active:
             if row_index_active:
                 index_name = self.get_value(PlantsimPath(path, "[0,0]"))
 
-            columns = [
+            header = [
                 self.get_value(PlantsimPath(path, f"[{col},0]")) for col in range(1, x_dim + 1)
             ]
 
@@ -621,11 +888,732 @@ class Plantsim:
                 row_data.append(cell_value)
             data.append(row_data)
 
-        df = pd.DataFrame(data, columns=columns, index=index)
+        if typed:
+            if data_types is None:
+                data_types = self.get_table_column_data_types(path)
+            df = typed_frame(
+                data,
+                data_types,
+                columns=header,
+                index=index,
+                datetime_format=self._datetime_format,
+                downcast=downcast,
+            )
+        else:
+            df = pd.DataFrame(data, columns=header, index=index)
+        if index_name is not None:
+            df.index.name = index_name
+        return df
+
+    def _read_numeric_table(
+        self, path: PlantsimPath, data_types: list[str], typed: bool, downcast: bool
+    ) -> pd.DataFrame:
+        """
+        Read a table with only numeric columns as fixed-width column blocks in a single
+        SimTalk call, see :func:`pyplantsim.tables.numeric_frame`.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param data_types: Data types of all columns.
+        :type data_types: list[str]
+        :param typed: Keep nullable dtypes for columns with empty cells.
+        :type typed: bool
+        :param downcast: Downcast numeric columns to the smallest fitting dtype.
+        :type downcast: bool
+        :return: DataFrame representing the table.
+        :rtype: pd.DataFrame
+        """
+        layout = self._table_header(path)
+
+        simtalk = self._load_simtalk_script("get_table_numeric")
+        text = str(self.execute_sim_talk(simtalk, path, layout.row_index))
+
+        df = numeric_frame(
+            text,
+            data_types,
+            columns=layout.columns,
+            with_index=layout.row_index,
+            index_type=layout.index_type,
+            typed=typed,
+            downcast=downcast and typed,
+        )
+        if layout.index_name is not None:
+            df.index.name = layout.index_name
+        return df
+
+    def _table_header(self, path: PlantsimPath) -> TableLayout:
+        """
+        Read the layout of a table.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :return: Number of columns, whether the row index is active, the column names (None
+            without column index), the name and the data type of the row index.
+        :rtype: TableLayout
+        """
+        x_dim = self._get_metadata_value(PlantsimPath(path, "xDim"))
+        row_index_active = bool(self._get_metadata_value(PlantsimPath(path, "rowIndex")))
+        col_index_active = self._get_metadata_value(PlantsimPath(path, "columnIndex"))
+
+        headers: list[Any] | None = None
+        index_name: Any = None
+        if col_index_active:
+            if row_index_active:
+                index_name = self.get_value(PlantsimPath(path, "[0,0]"))
+            headers = [
+                self.get_value(PlantsimPath(path, f"[{col},0]")) for col in range(1, x_dim + 1)
+            ]
+
+        index_type: str | None = None
+        if row_index_active:
+            if self._metadata_cache is None:
+                index_type = self.get_table_column_data_type(path, 0)
+            else:
+                index_type = self._metadata_cache.get(
+                    "value",
+                    str(PlantsimPath(path, "indexDataType")),
+                    lambda: self.get_table_column_data_type(path, 0),
+                )
+        return TableLayout(x_dim, row_index_active, headers, index_name, index_type)
+
+    def aggregate_table(
+        self,
+        path: PlantsimPath,
+        aggs: Mapping[str | int, str | Sequence[str]],
+        group_by: str | int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Aggregate table columns inside Plant Simulation and only transfer the result.
+
+        The rows are grouped by sorting them inside Plant Simulation, which takes
+        ``O(rows * log(rows))`` steps for any number of groups, e.g. also when grouping by an id
+        column. The result holds one row per group.
+
+        Example::
+
+            summary = plantsim.aggregate_table(
+                PlantsimPath(".Models.Model.Orders"),
+                aggs={"Lateness": ["mean", "max"], "Quantity": "sum"},
+                group_by="Product",
+            )
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param aggs: Aggregations (``count``, ``sum``, ``mean``, ``min``, ``max``) by column name
+            or number. The columns must be numeric, times are aggregated in seconds.
+        :type aggs: Mapping[str | int, str | Sequence[str]]
+        :param group_by: Column to group the rows by. Aggregates all rows if not given.
+        :type group_by: str | int, optional
+        :return: One row per group and a ``(column, aggregation)`` column per aggregation,
+            like ``DataFrame.groupby(...).agg(...)``.
+        :rtype: pd.DataFrame
+        :raises ValueError: If a column or an aggregation is unknown or an aggregated column is
+            not numeric.
+        """
+        import pandas as pd
+
+        x_dim, _, headers, _, _ = self._table_header(path)
+
+        requested: dict[int, list[str]] = {}
+        for column, names in aggs.items():
+            names = [names] if isinstance(names, str) else list(names)
+            for name in names:
+                if name not in AGGREGATIONS:
+                    raise ValueError(f"Unknown aggregation: {name!r}")
+            requested.setdefault(column_number(column, x_dim, headers), []).extend(names)
+
+        group_col = column_number(group_by, x_dim, headers) if group_by is not None else 0
+        agg_cols = sorted(requested)
+
+        data_types = self.get_table_column_data_types(path)
+        for col in agg_cols:
+            if data_types[col - 1] not in NUMERIC_TYPES and data_types[col - 1] != "time":
+                label = headers[col - 1] if headers is not None else col
+                raise ValueError(
+                    f"Column {label!r} has data type {data_types[col - 1]!r}, only numeric and "
+                    "time columns can be aggregated."
+                )
+
+        simtalk = self._load_simtalk_script("aggregate_table")
+        cells = parse_rows(
+            str(
+                self.execute_sim_talk(
+                    simtalk, path, group_col, f";{';'.join(map(str, agg_cols))};"
+                )
+            )
+        )
+
+        keys: list[Any] = []
+        records: list[list[Any]] = []
+        for row in cells:
+            keys.append(parse_cell(row[0], data_types[group_col - 1]) if group_col else None)
+            count = int(row[1])
+            record: list[Any] = []
+            for i, col in enumerate(agg_cols):
+                total, low, high = (float(text) for text in row[2 + 3 * i : 5 + 3 * i])
+                if data_types[col - 1] == "integer":
+                    total, low, high = int(total), int(low), int(high)
+                values = {
+                    "count": count,
+                    "sum": total,
+                    "mean": total / count,
+                    "min": low,
+                    "max": high,
+                }
+                record.extend(values[name] for name in requested[col])
+            records.append(record)
+
+        labels = [
+            (headers[col - 1] if headers is not None else col, name)
+            for col in agg_cols
+            for name in requested[col]
+        ]
+        df = pd.DataFrame(
+            records,
+            columns=pd.MultiIndex.from_tuples(labels),
+            index=keys if group_col else None,
+        )
+        if group_col:
+            df.index.name = headers[group_col - 1] if headers is not None else group_col
+        return df
+
+    def _select_table(
+        self,
+        path: PlantsimPath,
+        columns: Sequence[str | int] | None,
+        where: tuple[str | int, str, Any] | None,
+        typed: bool,
+        downcast: bool,
+    ) -> pd.DataFrame:
+        """
+        Read the selected columns of the rows matching a predicate, evaluated in SimTalk.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param columns: Columns to read by name or number. All columns if None.
+        :type columns: Sequence[str | int] | None
+        :param where: Predicate ``(column, operator, value)``. All rows if None.
+        :type where: tuple[str | int, str, Any] | None
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+        :type typed: bool
+        :param downcast: Downcast numeric columns to the smallest fitting dtype.
+        :type downcast: bool
+        :return: DataFrame of the selection.
+        :rtype: pd.DataFrame
+        :raises ValueError: If a column or the operator is unknown.
+        """
+        import pandas as pd
+
+        x_dim, row_index_active, headers, index_name, index_type = self._table_header(path)
+
+        def resolve(column: str | int) -> int:
+            return column_number(column, x_dim, headers)
+
+        # The script returns the columns in table order, they are reordered afterwards
+        selected = (
+            list(dict.fromkeys(resolve(column) for column in columns))
+            if columns is not None
+            else list(range(1, x_dim + 1))
+        )
+        transferred = sorted(selected)
+        positions = [1 + transferred.index(col) for col in selected]
+
+        filter_col, op, value = 0, "", ""
+        if where is not None:
+            column, op, raw_value = where
+            op = "=" if op == "==" else op
+            if op not in WHERE_OPERATORS:
+                raise ValueError(f"Unknown operator: {op!r}")
+            filter_col, value = resolve(column), simtalk_value(raw_value)
+
+        simtalk = self._load_simtalk_script("get_table_rows_where")
+        cells = parse_rows(
+            str(
+                self.execute_sim_talk(
+                    simtalk, path, f";{';'.join(map(str, transferred))};", filter_col, op, value
+                )
+            )
+        )
+
+        all_types = self.get_table_column_data_types(path)
+        data_types = [all_types[col - 1] for col in selected]
+        names = [headers[col - 1] for col in selected] if headers is not None else selected
+        keys = [row[0] for row in cells]
+        index = (
+            parse_index(keys, index_type) if row_index_active else [int(key) - 1 for key in keys]
+        )
+        rows = [
+            [parse_cell(row[i], data_type) for i, data_type in zip(positions, data_types)]
+            for row in cells
+        ]
+
+        if typed:
+            df = typed_frame(
+                rows,
+                data_types,
+                columns=names,
+                index=index,
+                datetime_format=self._datetime_format,
+                downcast=downcast,
+            )
+        else:
+            df = pd.DataFrame(rows, columns=names, index=index)
         if index_name is not None:
             df.index.name = index_name
         return df
 
+    def _read_table_range(
+        self,
+        path: PlantsimPath,
+        first_row: int,
+        last_row: int,
+        header: TableLayout,
+        data_types: list[str],
+        typed: bool = False,
+        downcast: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Read a range of table rows into a DataFrame in a single SimTalk call.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param first_row: First row to read, starting at 1.
+        :type first_row: int
+        :param last_row: Last row to read (inclusive).
+        :type last_row: int
+        :param header: Table layout as returned by :meth:`_table_header`.
+        :type header: TableLayout
+        :param data_types: Data types of all columns.
+        :type data_types: list[str]
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+        :type typed: bool
+        :param downcast: Downcast numeric columns to the smallest fitting dtype.
+        :type downcast: bool
+        :return: The rows. Without row index, the index holds the row positions from 0.
+        :rtype: pd.DataFrame
+        """
+        _, row_index_active, columns, index_name, index_type = header
+        first_col = 0 if row_index_active else 1
+        cells = self._read_table_rows(path, first_row, last_row, first_col)
+
+        index = (
+            parse_index((row[0] for row in cells), index_type)
+            if row_index_active
+            else list(range(first_row - 1, last_row))
+        )
+        rows = [row[1 - first_col :] for row in cells]
+        return self._cells_frame(rows, data_types, columns, index, index_name, typed, downcast)
+
+    def _cells_frame(
+        self,
+        rows: list[list[str]],
+        data_types: list[str],
+        columns: list[Any] | None,
+        index: list[Any] | None,
+        index_name: Any,
+        typed: bool,
+        downcast: bool,
+    ) -> pd.DataFrame:
+        """
+        Build a DataFrame from transferred cell texts.
+
+        :param rows: Cell texts by row.
+        :type rows: list[list[str]]
+        :param data_types: Data types of all columns.
+        :type data_types: list[str]
+        :param columns: Column names, None without column index.
+        :type columns: list[Any] | None
+        :param index: Row index, numbered from 0 if None.
+        :type index: list[Any] | None
+        :param index_name: Name of the row index.
+        :type index_name: Any
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+        :type typed: bool
+        :param downcast: Downcast numeric columns to the smallest fitting dtype.
+        :type downcast: bool
+        :return: The DataFrame.
+        :rtype: pd.DataFrame
+        """
+        import pandas as pd
+
+        values = [
+            [parse_cell(text, data_type) for text, data_type in zip(row, data_types)]
+            for row in rows
+        ]
+
+        if typed:
+            df = typed_frame(
+                values,
+                data_types,
+                columns=columns,
+                index=index,
+                datetime_format=self._datetime_format,
+                downcast=downcast,
+            )
+        else:
+            df = pd.DataFrame(values, columns=columns, index=index)
+        if index_name is not None:
+            df.index.name = index_name
+        return df
+
+    def get_tables(
+        self,
+        paths: Sequence[PlantsimPath],
+        typed: bool = False,
+        downcast: bool = False,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Get DataFrames of several tables with a single SimTalk call, e.g. to collect the result
+        tables at the end of a run.
+
+        Layout, data types and cells of all tables are transferred at once, instead of probing
+        dimensions and indexes of every table separately.
+
+        :param paths: Paths to the tables.
+        :type paths: Sequence[PlantsimPath]
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types,
+            see :meth:`get_table`.
+        :type typed: bool, optional
+        :param downcast: Downcast numeric columns to the smallest fitting dtype. Requires typed.
+        :type downcast: bool, optional
+        :return: DataFrame of every table by its path.
+        :rtype: dict[str, pd.DataFrame]
+        """
+        if not paths:
+            return {}
+
+        simtalk = self._load_simtalk_script("get_tables")
+        text = str(self.execute_sim_talk(simtalk, ROW_SEPARATOR.join(str(path) for path in paths)))
+
+        tables: dict[str, pd.DataFrame] = {}
+        for path, table_text in zip(paths, text.split(TABLE_SEPARATOR)):
+            layout, data_types, header, *rows = parse_rows(table_text)
+            row_index_active = layout[2] == "true"
+            col_index_active = layout[3] == "true"
+            if not int(layout[0]):
+                data_types = []
+
+            columns = header[1:] if col_index_active else None
+            index_name = (header[0] or None) if row_index_active and col_index_active else None
+            index = parse_index((row[0] for row in rows), layout[4]) if row_index_active else None
+            tables[str(path)] = self._cells_frame(
+                [row[1:] for row in rows],
+                data_types,
+                columns,
+                index,
+                index_name,
+                typed,
+                downcast,
+            )
+        return tables
+
+    def _read_table_rows(
+        self, path: PlantsimPath, first_row: int, last_row: int, first_col: int = 1
+    ) -> list[list[str]]:
+        """
+        Read a range of table rows as cell texts in a single SimTalk call.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param first_row: First row to read, starting at 1.
+        :type first_row: int
+        :param last_row: Last row to read (inclusive).
+        :type last_row: int
+        :param first_col: First column to read. 0 includes the row index.
+        :type first_col: int
+        :return: Cell texts by row.
+        :rtype: list[list[str]]
+        """
+        simtalk = self._load_simtalk_script("get_table_rows")
+        return parse_rows(
+            str(self.execute_sim_talk(simtalk, path, first_row, last_row, first_col))
+        )
+
+    def iter_table(
+        self,
+        path: PlantsimPath,
+        chunk_rows: int = 10_000,
+        typed: bool = False,
+        downcast: bool = False,
+        batch_format: Literal["pandas", "arrow"] = "pandas",
+    ) -> Iterator[Any]:
+        """
+        Read a table in chunks of rows, transferring every chunk with a single SimTalk call.
+
+        Only one chunk is held in memory at a time, which keeps the memory usage constant
+        for arbitrarily large tables. Rows appended while iterating are not read.
+
+        Example::
+
+            for chunk in plantsim.iter_table(PlantsimPath(".Models.Model.EventLog")):
+                process(chunk)
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param chunk_rows: Number of rows per chunk.
+        :type chunk_rows: int, optional
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+        :type typed: bool, optional
+        :param downcast: Downcast numeric columns to the smallest fitting dtype. Requires typed.
+        :type downcast: bool, optional
+        :param batch_format: Yield ``pandas`` DataFrames or ``arrow`` RecordBatches. Arrow
+            requires pyarrow. RecordBatches are built column by column straight from the
+            transferred text and are always typed, see :func:`pyplantsim.tables.arrow_column`.
+        :type batch_format: Literal["pandas", "arrow"], optional
+        :return: Iterator over the chunks.
+        :rtype: Iterator[pd.DataFrame | pyarrow.RecordBatch]
+        :raises ValueError: If chunk_rows is not positive.
+        :raises ImportError: If batch_format is ``arrow`` and pyarrow is not installed.
+        """
+        # Validated here, as the generator would only raise on the first chunk
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1.")
+
+        if batch_format == "arrow":
+            import_pyarrow()
+
+        return self._iter_table(path, chunk_rows, typed, downcast, batch_format)
+
+    def _iter_table(
+        self,
+        path: PlantsimPath,
+        chunk_rows: int,
+        typed: bool,
+        downcast: bool,
+        batch_format: Literal["pandas", "arrow"],
+    ) -> Iterator[Any]:
+        """
+        Read a table in chunks of rows, see :meth:`iter_table`.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param chunk_rows: Number of rows per chunk.
+        :type chunk_rows: int
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+        :type typed: bool
+        :param downcast: Downcast numeric columns to the smallest fitting dtype.
+        :type downcast: bool
+        :param batch_format: Yield ``pandas`` DataFrames or ``arrow`` RecordBatches.
+        :type batch_format: Literal["pandas", "arrow"]
+        :return: Iterator over the chunks.
+        :rtype: Iterator[pd.DataFrame | pyarrow.RecordBatch]
+        """
+        y_dim = self.get_value(PlantsimPath(path, "yDim"))
+        header = self._table_header(path)
+        data_types = self.get_table_column_data_types(path)
+
+        for first_row in range(1, y_dim + 1, chunk_rows):
+            last_row = min(first_row + chunk_rows - 1, y_dim)
+            if batch_format == "arrow":
+                yield self._read_arrow_range(path, first_row, last_row, header, data_types)
+            else:
+                yield self._read_table_range(
+                    path, first_row, last_row, header, data_types, typed, downcast
+                )
+
+    def _read_arrow_range(
+        self,
+        path: PlantsimPath,
+        first_row: int,
+        last_row: int,
+        header: TableLayout,
+        data_types: list[str],
+    ) -> Any:
+        """
+        Read a range of table rows into an Arrow RecordBatch in a single SimTalk call, see
+        :func:`pyplantsim.tables.arrow_batch`.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param first_row: First row to read, starting at 1.
+        :type first_row: int
+        :param last_row: Last row to read (inclusive).
+        :type last_row: int
+        :param header: Table layout as returned by :meth:`_table_header`.
+        :type header: TableLayout
+        :param data_types: Data types of all columns.
+        :type data_types: list[str]
+        :return: The rows. The row index, if active, is the first column.
+        :rtype: pyarrow.RecordBatch
+        """
+        _, row_index_active, columns, index_name, index_type = header
+        simtalk = self._load_simtalk_script("get_table_columns")
+        text = str(
+            self.execute_sim_talk(simtalk, path, first_row, last_row, 0 if row_index_active else 1)
+        )
+        return arrow_batch(
+            text,
+            last_row - first_row + 1,
+            data_types,
+            columns=columns,
+            index_name=index_name,
+            with_index=row_index_active,
+            datetime_format=self._datetime_format,
+            index_type=index_type,
+        )
+
+    def get_table_arrow(self, path: PlantsimPath) -> Any:
+        """
+        Get an Arrow Table based on a Plant Simulation table object in a single SimTalk call.
+
+        The columns are built one by one straight from the transferred text, without an
+        intermediate DataFrame, see :func:`pyplantsim.tables.arrow_column`. Requires pyarrow.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :return: The table. The row index, if active, is the first column.
+        :rtype: pyarrow.Table
+        """
+        pa = import_pyarrow()[0]
+
+        y_dim = self.get_value(PlantsimPath(path, "yDim"))
+        batch = self._read_arrow_range(
+            path, 1, y_dim, self._table_header(path), self.get_table_column_data_types(path)
+        )
+        return pa.Table.from_batches([batch])
+
+    def table_view(
+        self,
+        path: PlantsimPath,
+        page_rows: int = 1000,
+        max_pages: int = 16,
+        max_bytes: int | None = None,
+        typed: bool = False,
+    ) -> TableView:
+        """
+        Create a lazy view of a table reading rows in pages on demand, see :class:`TableView`.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param page_rows: Number of rows read per page.
+        :type page_rows: int, optional
+        :param max_pages: Maximum number of cached pages.
+        :type max_pages: int, optional
+        :param max_bytes: Maximum memory usage of the cached pages. Unlimited if None.
+        :type max_bytes: int, optional
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+        :type typed: bool, optional
+        :return: The view.
+        :rtype: TableView
+        """
+        return TableView(
+            self,
+            path,
+            page_rows=page_rows,
+            max_pages=max_pages,
+            max_bytes=max_bytes,
+            typed=typed,
+        )
+
+    def tail_table(
+        self,
+        path: PlantsimPath,
+        callback: Callable[[pd.DataFrame], None] | None = None,
+        target: str | os.PathLike[str] | None = None,
+        file_format: Literal["csv", "parquet"] | None = None,
+        typed: bool = False,
+        interval: float = 0.0,
+    ) -> TableTail:
+        """
+        Create an incremental reader of an append-only table, see :class:`TableTail`.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param callback: Called with every non-empty batch of new rows.
+        :type callback: Callable[[pd.DataFrame], None], optional
+        :param target: File to append the new rows to.
+        :type target: str | os.PathLike[str], optional
+        :param file_format: ``csv`` or ``parquet``. Derived from the file suffix if not given.
+        :type file_format: Literal["csv", "parquet"], optional
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+        :type typed: bool, optional
+        :param interval: Minimum time in seconds between two polls from ``on_progress``.
+        :type interval: float, optional
+        :return: The tail reader.
+        :rtype: TableTail
+        """
+        return TableTail(
+            self,
+            path,
+            callback=callback,
+            target=target,
+            file_format=file_format,
+            typed=typed,
+            interval=interval,
+        )
+
+    def export_table(
+        self,
+        path: PlantsimPath,
+        target: str | os.PathLike[str],
+        file_format: Literal["csv", "parquet", "feather"] | None = None,
+        chunk_rows: int = 10_000,
+        typed: bool = True,
+        partition: Mapping[str, Any] | None = None,
+    ) -> int:
+        """
+        Stream a table into a CSV, Parquet or Feather file chunk by chunk, see
+        :meth:`iter_table`.
+
+        Parquet and Feather files are written from Arrow RecordBatches built straight from the
+        transferred text, so only about one copy of a chunk is held at a time.
+
+        Example::
+
+            plantsim.export_table(
+                PlantsimPath(".Models.Model.Results"),
+                "results",
+                partition={"job": job_id, "scenario": scenario},
+            )
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param target: Path of the file to write. With ``partition`` the root directory of a
+            Hive-style partitioned dataset, see :func:`pyplantsim.tables.partition_path`.
+        :type target: str | os.PathLike[str]
+        :param file_format: ``csv``, ``parquet`` or ``feather``. Derived from the file suffix if
+            not given, ``parquet`` with ``partition``.
+        :type file_format: Literal["csv", "parquet", "feather"], optional
+        :param chunk_rows: Number of rows per chunk.
+        :type chunk_rows: int, optional
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+            Only applies to CSV, Arrow columns are always typed.
+        :type typed: bool, optional
+        :param partition: Partition keys and values, e.g. job and scenario id. The file is
+            named after the table and written below ``key=value`` directories of the target.
+        :type partition: Mapping[str, Any], optional
+        :return: Number of written rows.
+        :rtype: int
+        """
+        if file_format is None:
+            suffix = Path(target).suffix.lower() if partition is None else ".parquet"
+            if suffix == ".parquet":
+                file_format = "parquet"
+            elif suffix in (".feather", ".arrow"):
+                file_format = "feather"
+            else:
+                file_format = "csv"
+
+        if partition is not None:
+            name = str(path).rsplit(".", 1)[-1]
+            target = partition_path(target, partition, f"{name}.{file_format}")
+
+        if file_format == "csv":
+            return write_chunks(
+                self.iter_table(path, chunk_rows=chunk_rows, typed=typed), target, file_format
+            )
+
+        def batches() -> Iterator[Any]:
+            header = self._table_header(path)
+            data_types = self.get_table_column_data_types(path)
+            y_dim = self.get_value(PlantsimPath(path, "yDim"))
+            # An empty table still writes a file with its schema
+            for first_row in range(1, max(y_dim, 1) + 1, chunk_rows):
+                last_row = min(first_row + chunk_rows - 1, y_dim)
+                yield self._read_arrow_range(path, first_row, last_row, header, data_types)
+
+        return write_batches(batches(), target, file_format)
+
     def get_table_column_data_type(self, table: PlantsimPath, column: int) -> str:
         """
         Get the data type of a table column.
@@ -640,6 +1628,27 @@ class Plantsim:
         simtalk = self._load_simtalk_script("get_table_column_data_type")
         return str(self.execute_sim_talk(simtalk, table, column))
 
+    def get_table_column_data_types(self, table: PlantsimPath) -> list[str]:
+        """
+        Get the data types of all columns of a table in a single call.
+
+        :param table: Table path.
+        :type table: PlantsimPath
+        :return: Data type of every column as string.
+        :rtype: list[str]
+        """
+
+        def query() -> list[str]:
+            simtalk = self._load_simtalk_script("get_table_column_data_types")
+            types = str(self.execute_sim_talk(simtalk, table))
+            return types.split(";") if types else []
+
+        if self._metadata_cache is None:
+            return query()
+
+        key = str(PlantsimPath(table, "dataTypes"))
+        return list(self._metadata_cache.get("value", key, query))
+
     def set_value(self, path: PlantsimPath, value: Any) -> None:
         """
         Set a value to a given attribute.
@@ -651,23 +1660,82 @@ class Plantsim:
         """
         self._instance.SetValue(str(path), value)
 
-    def set_table(self, path: PlantsimPath, df: pd.DataFrame) -> None:
+        # Writing a cell may grow the table, which invalidates its schema and snapshot
+        table = str(path).split("[", 1)[0]
+        if self._table_snapshots:
+            self._table_snapshots.pop(table, None)
+        if self._metadata_cache is not None:
+            self._metadata_cache.invalidate(table, kind="value")
+
+    def set_table(self, path: PlantsimPath, df: pd.DataFrame, diff: bool = False) -> None:
         """
         Set a Plant Simulation table based on a DataFrame.
 
+        In diff mode the written DataFrame is remembered per table. The next diff write only
+        sends the cells that changed since, in a single SimTalk call. It falls back to a full
+        write if shape, columns or index changed. Diff mode assumes that the table is only
+        changed through pyplantsim in between; writing single cells with :meth:`set_value`
+        or loading a model discards the remembered state.
+
         :param path: Path to the table.
         :type path: str
         :param df: DataFrame containing the values to write.
         :type df: pd.DataFrame
+        :param diff: Only write the cells that changed since the last diff write.
+        :type diff: bool, optional
+        """
+        key = str(path)
+        previous = self._table_snapshots.pop(key, None)
+
+        if diff and previous is not None and same_layout(previous, df):
+            cells = changed_cells(previous, df)
+            if cells:
+                simtalk = self._load_simtalk_script("set_table_cells")
+                self.execute_sim_talk(simtalk, path, self._encode_cells(cells))
+            logger.debug(f"Wrote {len(cells)} changed cells of {path}.")
+        else:
+            self._write_table(path, df)
+
+        if diff:
+            self._table_snapshots[key] = df.copy()
+
+    def _encode_cells(self, cells: list[tuple[int, int, Any]]) -> str:
+        """
+        Encode cells for set_table_cells.st.
+
+        :param cells: Column number, row number and value of every cell.
+        :type cells: list[tuple[int, int, Any]]
+        :return: The encoded cells.
+        :rtype: str
+        """
+        parts = []
+        for col, row, value in cells:
+            if isinstance(value, datetime) and self._datetime_format:
+                text = value.strftime(self._datetime_format)
+            elif isinstance(value, timedelta):
+                text = str(value.total_seconds())
+            else:
+                text = simtalk_value(value)
+            parts.append(f"{col}{CELL_SEPARATOR}{row}{CELL_SEPARATOR}{text}")
+        return ROW_SEPARATOR.join(parts)
+
+    def _write_table(self, path: PlantsimPath, df: pd.DataFrame) -> None:
+        """
+        Write all cells, the column names and the row index of a DataFrame to a table.
+
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param df: DataFrame containing the values to write.
+        :type df: pd.DataFrame
         """
         y_dim, x_dim = df.shape
 
-        col_index_active = self.get_value(PlantsimPath(path, "columnIndex"))
+        col_index_active = self._get_metadata_value(PlantsimPath(path, "columnIndex"))
         if col_index_active and df.columns is not None:
             for col, name in enumerate(df.columns, 1):
                 self.set_value(PlantsimPath(path, f"[{col},0]"), name)
 
-        row_index_active = self.get_value(PlantsimPath(path, "rowIndex"))
+        row_index_active = self._get_metadata_value(PlantsimPath(path, "rowIndex"))
         if row_index_active and df.index is not None:
             if df.index.name is not None and col_index_active:
                 self.set_value(PlantsimPath(path, "[0,0]"), df.index.name)
@@ -679,6 +1747,9 @@ class Plantsim:
                 value = df.iat[row - 1, col - 1]
                 self.set_value(PlantsimPath(path, f"[{col},{row}]"), value)
 
+        # Writing may have grown the table
+        self.invalidate_metadata_cache(path)
+
     def _is_simulation_running(self) -> bool:
         """
         Check if the simulation is currently running.
@@ -713,12 +1784,21 @@ class Plantsim:
 
         logger.info(f"Loading {filepath}.")
 
+        load_path = filepath
+        if self._model_cache:
+            with self._timed_phase("model_cache"):
+                load_path = self._model_cache.get(filepath)
+
         try:
-            self._instance.LoadModel(filepath, password if password else None)
+            with self._timed_phase("load_model"):
+                self._instance.LoadModel(load_path, password if password else None)
         except Exception as e:
             raise PlantsimException(e)
 
-        self._set_datetime_format()
+        self.invalidate_metadata_cache()
+
+        with self._timed_phase("get_model_language"):
+            self._set_datetime_format(filepath)
 
         self._model_loaded = True
         self._model_path = filepath
@@ -751,6 +1831,7 @@ class Plantsim:
             raise ErrorHandlerException("Could not create error handler.")
 
         self._error_handler = "basis.ErrorHandler"
+        self.invalidate_metadata_cache("basis.ErrorHandler")
 
     def remove_error_handler(self) -> None:
         """
@@ -768,8 +1849,233 @@ class Plantsim:
         if not response:
             raise ErrorHandlerException("Could not create error handler.")
 
+        self.invalidate_metadata_cache("basis.ErrorHandler")
         self._error_handler = None
 
+    def subscribe(
+        self,
+        paths: Sequence[PlantsimPath],
+        callback: Callable[[dict[str, Any]], None],
+        min_interval: float = 0.0,
+    ) -> Subscription:
+        """
+        Subscribe to changes of object attributes, e.g. buffer contents or machine states,
+        instead of polling them with :meth:`get_value`.
+
+        SimTalk observers are installed on the attributes that no other subscription observes
+        yet, which report every change through the SimTalk message channel. Only observable
+        attributes can be subscribed. Changes are coalesced and delivered in batches, see
+        :class:`Subscription`.
+
+        Example::
+
+            def on_change(changes: dict[str, Any]) -> None:
+                for path, value in changes.items():
+                    print(path, value)
+
+
+            subscription = plantsim.subscribe(
+                [PlantsimPath(".Models.Model.Buffer", "NumMU")], on_change, min_interval=0.5
+            )
+
+        :param paths: Absolute paths of the attributes.
+        :type paths: Sequence[PlantsimPath]
+        :param callback: Called with the latest value of every changed attribute by path.
+        :type callback: Callable[[dict[str, Any]], None]
+        :param min_interval: Minimum time in seconds between two deliveries.
+        :type min_interval: float, optional
+        :return: The subscription. Close it to stop observing.
+        :rtype: Subscription
+        :raises SubscriptionException: If the observers could not be installed.
+        """
+        attributes = [str(path) for path in paths]
+
+        observed = {path for other in self._subscriptions for path in other._paths}
+        new_attributes = [path for path in dict.fromkeys(attributes) if path not in observed]
+        if new_attributes:
+            simtalk = self._load_simtalk_script("install_observers")
+            response = self.execute_sim_talk(simtalk, self._observed_attributes(new_attributes))
+            if response is None or response < 0:
+                raise SubscriptionException("Could not install the attribute observers.")
+
+        subscription = Subscription(self, attributes, callback, min_interval)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Stop a subscription. Attributes that are still subscribed by another subscription stay
+        observed.
+
+        :param subscription: The subscription created by :meth:`subscribe`.
+        :type subscription: Subscription
+        """
+        if subscription not in self._subscriptions:
+            return
+        self._subscriptions.remove(subscription)
+        if not subscription.closed:
+            subscription.close()
+
+        still_observed = {path for other in self._subscriptions for path in other._paths}
+        attributes = [path for path in subscription._paths if path not in still_observed]
+        if attributes and self._model_loaded:
+            simtalk = self._load_simtalk_script("remove_observers")
+            self.execute_sim_talk(simtalk, self._observed_attributes(attributes))
+
+    def _observed_attributes(self, attributes: list[str]) -> str:
+        """
+        Format attribute paths for install_observers.st and remove_observers.st.
+
+        :param attributes: Absolute attribute paths.
+        :type attributes: list[str]
+        :return: Object paths and attribute names.
+        :rtype: str
+        """
+        return ROW_SEPARATOR.join(CELL_SEPARATOR.join(path.rsplit(".", 1)) for path in attributes)
+
+    def open_message_channel(
+        self,
+        batch_size: int = 1000,
+        window: float = 0.0,
+        capacity: int = 100_000,
+        policy: OverflowPolicy = "drop_oldest",
+    ) -> MessageChannel:
+        """
+        Install a batched message channel for models sending many messages, see
+        :class:`MessageChannel`. Models send messages with ``.PyplantsimMessages(msg)``.
+
+        :param batch_size: Number of messages the model buffers before firing them at once.
+        :type batch_size: int, optional
+        :param window: Simulated seconds after which the model fires its buffered messages
+            even if the batch is not full. Requires the EventController to be set. Disabled if
+            0.
+        :type window: float, optional
+        :param capacity: Maximum number of messages buffered in Python.
+        :type capacity: int, optional
+        :param policy: What to do with messages arriving while the Python buffer is full,
+            ``drop_oldest``, ``drop_newest`` or ``block``.
+        :type policy: Literal["drop_oldest", "drop_newest", "block"], optional
+        :return: The channel. Close it to take the remaining messages.
+        :rtype: MessageChannel
+        :raises ValueError: If the batch size is not positive.
+        :raises EventControllerNotSetException: If a window is given without EventController.
+        :raises MessageChannelException: If the channel could not be installed.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        if window > 0 and not self._event_controller:
+            raise EventControllerNotSetException("EventController needs to be set.")
+
+        channel = MessageChannel(self, capacity=capacity, policy=policy)
+        if self._message_channel is not None:
+            self._message_channel.close()
+
+        simtalk = self._load_simtalk_script("install_message_channel")
+        event_controller = str(self._event_controller) if window > 0 else ""
+        if not self.execute_sim_talk(simtalk, batch_size, window, event_controller):
+            raise MessageChannelException("Could not install the message channel.")
+
+        self._message_channel = channel
+        self.invalidate_metadata_cache("basis.PyplantsimMessages")
+        return channel
+
+    def _close_message_channel(self, channel: MessageChannel) -> None:
+        """
+        Stop routing batched messages to a channel.
+
+        :param channel: The closed channel.
+        :type channel: MessageChannel
+        """
+        if self._message_channel is channel:
+            self._message_channel = None
+
+    @property
+    def message_channel(self) -> MessageChannel | None:
+        """
+        The open batched message channel.
+
+        :return: The channel, None if none is open.
+        :rtype: MessageChannel | None
+        """
+        return self._message_channel
+
+    def start_trace(
+        self,
+        objects: Sequence[PlantsimPath],
+        target: str | os.PathLike[str],
+        file_format: Literal["parquet", "feather"] | None = None,
+        row_group_rows: int = 65_536,
+        batch_size: int = 1000,
+        compression: str = "zstd",
+    ) -> TraceCapture:
+        """
+        Start capturing the entries and exits of movable units at objects into a compressed
+        Parquet or Feather (Arrow IPC) file, see :class:`TraceCapture`. Requires pyarrow.
+
+        Example::
+
+            with plantsim.start_trace(stations, "trace.parquet"):
+                plantsim.run_simulation()
+
+        :param objects: Paths of the traced objects, e.g. the stations of a line.
+        :type objects: Sequence[PlantsimPath]
+        :param target: Path of the file to write.
+        :type target: str | os.PathLike[str]
+        :param file_format: ``parquet`` or ``feather``. Derived from the file suffix if not
+            given.
+        :type file_format: Literal["parquet", "feather"], optional
+        :param row_group_rows: Number of records per row group.
+        :type row_group_rows: int, optional
+        :param batch_size: Number of records the model buffers before firing them at once.
+        :type batch_size: int, optional
+        :param compression: Compression codec, e.g. ``zstd`` or ``lz4``.
+        :type compression: str, optional
+        :return: The capture. Close it to stop tracing and finish the file.
+        :rtype: TraceCapture
+        :raises EventControllerNotSetException: If the EventController is not set.
+        :raises TraceException: If the trace could not be installed.
+        """
+        if not self._event_controller:
+            raise EventControllerNotSetException("EventController needs to be set.")
+        if file_format is None:
+            suffix = Path(target).suffix.lower()
+            file_format = "feather" if suffix in (".feather", ".arrow") else "parquet"
+
+        if self._trace is not None:
+            self._trace.close()
+
+        paths = [str(obj) for obj in objects]
+        capture = TraceCapture(
+            self,
+            paths,
+            target,
+            file_format=file_format,
+            row_group_rows=row_group_rows,
+            compression=compression,
+        )
+
+        simtalk = self._load_simtalk_script("install_trace")
+        response = self.execute_sim_talk(
+            simtalk, ROW_SEPARATOR.join(paths), batch_size, str(self._event_controller)
+        )
+        if response is None or response < 0:
+            capture.close()
+            raise TraceException("Could not install the trace.")
+
+        self._trace = capture
+        self.invalidate_metadata_cache("basis.PyplantsimTrace")
+        return capture
+
+    def _close_trace(self, capture: TraceCapture) -> None:
+        """
+        Stop routing trace records to a capture.
+
+        :param capture: The closed capture.
+        :type capture: TraceCapture
+        """
+        if self._trace is capture:
+            self._trace = None
+
     def new_model(self, close_other: bool = False) -> None:
         """
         Create a new simulation model in the current instance.
@@ -787,6 +2093,7 @@ class Plantsim:
             raise PlantsimException(e)
 
         self._model_loaded = True
+        self.invalidate_metadata_cache()
 
     def open_console_log_file(self, filepath: str) -> None:
         """
@@ -803,6 +2110,50 @@ class Plantsim:
         """
         self._instance.OpenConsoleLogFile("")
 
+    def tail_console_log(
+        self,
+        filepath: str,
+        callback: Callable[[ConsoleRecord], None] | None = None,
+        capacity: int = 10_000,
+        levels: Iterable[str] | None = None,
+        match: str | re.Pattern[str] | None = None,
+        predicate: Callable[[ConsoleRecord], bool] | None = None,
+        poll_interval: float = 0.1,
+    ) -> ConsoleTailer:
+        """
+        Route the Console output to a file and follow it in a background thread, see
+        :class:`ConsoleTailer`. The routing stays open when the tailer is closed.
+
+        :param filepath: Path to the log file.
+        :type filepath: str
+        :param callback: Called from the background thread with every record passing the
+            filters.
+        :type callback: Callable[[ConsoleRecord], None], optional
+        :param capacity: Maximum number of queued records, 0 to not queue records.
+        :type capacity: int, optional
+        :param levels: Only pass records with one of these levels, e.g. ``["ERROR"]``.
+        :type levels: Iterable[str], optional
+        :param match: Only pass records whose message matches this regular expression.
+        :type match: str | re.Pattern[str], optional
+        :param predicate: Only pass records for which this returns True.
+        :type predicate: Callable[[ConsoleRecord], bool], optional
+        :param poll_interval: Time in seconds between two reads of the file.
+        :type poll_interval: float, optional
+        :return: The started tailer.
+        :rtype: ConsoleTailer
+        """
+        self.open_console_log_file(filepath)
+        tailer = ConsoleTailer(
+            filepath,
+            callback=callback,
+            capacity=capacity,
+            levels=levels,
+            match=match,
+            predicate=predicate,
+            poll_interval=poll_interval,
+        )
+        return tailer.start()
+
     def quit_after_time(self, time: int) -> None:
         """
         Quit the current instance after a specified time.
@@ -890,6 +2241,12 @@ class Plantsim:
 
         self._run_simulation_event_loop(on_progress=on_progress, cancel_event=cancel_event)
 
+        # Messages of the last, incomplete batch are still buffered in the model
+        if self._message_channel is not None:
+            self._message_channel.flush()
+        if self._trace is not None:
+            self._trace.flush()
+
         if self._simulation_error_event.is_set():
             if on_simulation_error and self._simulation_error_event.error is not None:
                 on_simulation_error(self, self._simulation_error_event.error)
@@ -928,7 +2285,7 @@ class Plantsim:
             and not self._simulation_error_event.is_set()
             and (cancel_event is None or not cancel_event.is_set())
         ):
-            pythoncom.PumpWaitingMessages()
+            self._backend.pump_waiting_messages()
             time.sleep(self._event_polling_interval)
 
             if on_progress:
@@ -979,11 +2336,11 @@ class Plantsim:
             raise EventControllerNotSetException("EventController needs to be set.")
 
         attribute_name = "StartDate"
-        if self._version < Version(PlantsimVersion.V_MJ_25_MI_4.value):
+        if self._legacy_event_controller:
             attribute_name = "Date"
 
         return self._str_to_datetime(
-            self.get_value(PlantsimPath(self._event_controller, attribute_name))
+            self._get_metadata_value(PlantsimPath(self._event_controller, attribute_name))
         )
 
     def get_model_language(self) -> int:
@@ -996,13 +2353,20 @@ class Plantsim:
         simtalk = self._load_simtalk_script("get_model_language")
         return int(self.execute_sim_talk(simtalk))
 
-    def _set_datetime_format(self) -> None:
+    def _set_datetime_format(self, filepath: str | None = None) -> None:
         """
         Set the datetime format based on the loaded model's language.
 
+        :param filepath: Path of the loaded model file. With the metadata cache enabled, the
+            language is cached per file and modification time.
+        :type filepath: str, optional
         :raises NotImplementedError: If language is not supported.
         """
-        language = self.get_model_language()
+        if self._metadata_cache is not None and filepath is not None:
+            key = f"{os.path.abspath(filepath)}|{os.stat(filepath).st_mtime_ns}"
+            language = self._metadata_cache.get("language", key, self.get_model_language)
+        else:
+            language = self.get_model_language()
 
         match language:
             case 0:  # German
@@ -1030,11 +2394,11 @@ class Plantsim:
             raise EventControllerNotSetException("EventController needs to be set.")
 
         attribute_name = "EndTime"
-        if self._version < Version(PlantsimVersion.V_MJ_25_MI_4.value):
+        if self._legacy_event_controller:
             attribute_name = "End"
 
         return timedelta(
-            seconds=self.get_value(PlantsimPath(self._event_controller, attribute_name))
+            seconds=self._get_metadata_value(PlantsimPath(self._event_controller, attribute_name))
         )
 
     def stop_simulation(self) -> None:
@@ -1077,8 +2441,14 @@ class Plantsim:
         if not self.model_loaded:
             raise ModelNotLoadedException("No model is loaded.")
 
-        simtalk = self._load_simtalk_script("exists_path")
-        return bool(self.execute_sim_talk(simtalk, path))
+        def query() -> bool:
+            simtalk = self._load_simtalk_script("exists_path")
+            return bool(self.execute_sim_talk(simtalk, path))
+
+        if self._metadata_cache is None:
+            return query()
+
+        return bool(self._metadata_cache.get("exists", str(path), query))
 
     def restart(self) -> None:
         """
@@ -1152,17 +2522,71 @@ class Plantsim:
         :rtype: List[CallCycle]
         :raises SimulationException: If the SimTalk script execution fails.
         """
+        raw = self._read_raw_call_cycles(max_num_cycles)
+        if raw is None:
+            return []
+
+        return [CallCycle.from_dict(cc) for cc in iter_call_cycle_dicts(raw)]
+
+    def get_call_cycle_table(self) -> CallCycleTable:
+        """
+        Run a full simulation with the SimTalk profiler enabled and return the resulting call
+        cycles in columnar form, see :meth:`get_call_cycles`.
+
+        :return: Call cycles recorded during the simulation run.
+        :rtype: CallCycleTable
+        :raises SimulationException: If the simulation encounters an error.
+        :raises Exception: If the EventController is not set.
+        """
+        result: CallCycleTable | None = None
+
+        def on_init(instance: Plantsim) -> None:
+            simtalk = self._load_simtalk_script("activate_profiler")
+            instance.execute_sim_talk(simtalk)
+
+        def on_endsim(_: Plantsim) -> None:
+            nonlocal result
+            result = self.read_call_cycle_table()
+
+        self.run_simulation(on_init=on_init, on_endsim=on_endsim)
+        return result if result is not None else CallCycleTable.from_dicts([])
+
+    def read_call_cycle_table(self, max_num_cycles: int | None = None) -> CallCycleTable:
+        """
+        Read the call cycles currently stored in the model's profiler in columnar form, see
+        :class:`CallCycleTable`.
+
+        The profiler output is decoded one call cycle at a time straight into the columns, so
+        no object is built per method or caller. Use this instead of :meth:`read_call_cycles`
+        for large models profiled over long runs.
+
+        :param max_num_cycles: Maximum number of call cycles to retrieve.
+            If ``None``, all available cycles are returned.
+        :type max_num_cycles: int, optional
+        :return: Call cycles from the profiler output.
+        :rtype: CallCycleTable
+        :raises SimulationException: If the SimTalk script execution fails.
+        """
+        raw = self._read_raw_call_cycles(max_num_cycles)
+        return CallCycleTable.from_json(raw or "")
+
+    def _read_raw_call_cycles(self, max_num_cycles: int | None) -> str | None:
+        """
+        Read the JSON output of the model's profiler.
+
+        :param max_num_cycles: Maximum number of call cycles to retrieve.
+            If ``None``, all available cycles are returned.
+        :type max_num_cycles: int | None
+        :return: The profiler output, None if there is none.
+        :rtype: str | None
+        """
         simtalk = self._load_simtalk_script("get_call_cycles")
+        raw: str | None
         if max_num_cycles:
             raw = self.execute_sim_talk(simtalk, max_num_cycles)
         else:
             raw = self.execute_sim_talk(simtalk)
-
-        if raw is None:
-            return []
-
-        data = json.loads(raw)
-        return [CallCycle.from_dict(cc) for cc in data.get("CallCycles", [])]
+        return raw
 
     @property
     def simulation_running(self) -> bool:
@@ -1204,6 +2628,39 @@ class Plantsim:
         """
         return self._network_path
 
+    @property
+    def metadata_cache(self) -> MetadataCache | None:
+        """
+        The metadata cache with its hit and miss counters, None if disabled.
+
+        :return: Metadata cache.
+        :rtype: MetadataCache | None
+        """
+        return self._metadata_cache
+
+    @property
+    def startup_timings(self) -> dict[str, float]:
+        """
+        Duration in seconds of the phases of :meth:`start` (``dispatch``,
+        ``start_event_thread``, ``set_visible``, ``set_license``, ``set_trust_models``,
+        ``set_suppress_start_of_3d``, ``set_show_message_box``) and of the last
+        :meth:`load_model` (``model_cache``, ``load_model``, ``get_model_language``).
+
+        :return: Phase durations by phase name.
+        :rtype: dict[str, float]
+        """
+        return dict(self._startup_timings)
+
+    @property
+    def backend(self) -> RemoteControlBackend:
+        """
+        Backend providing the RemoteControl object.
+
+        :return: The backend.
+        :rtype: RemoteControlBackend
+        """
+        return self._backend
+
     @property
     def visible(self) -> bool:
         """
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from collections import defaultdict
+import json
+import marshal
+import os
+from typing import Any
+from typing import Iterable
+
+from .call_cycle import CallCycle
+from .call_cycle import CallerEntry
+
+
+# Function key of a method in pstats files: (file name, line number, function name)
+PstatsKey = tuple[str, int, str]
+
+
+def _pstats_key(path: str) -> PstatsKey:
+    """
+    Build the pstats function key of a method, with its object path as file name.
+
+    :param path: Path of the method, e.g. ``.Models.Model.Init``.
+    :type path: str
+    :return: The function key.
+    :rtype: PstatsKey
+    """
+    return path, 0, path.rsplit(".", 1)[-1]
+
+
+def to_pstats(call_cycles: Iterable[CallCycle]) -> dict[PstatsKey, Any]:
+    """
+    Convert call cycles into the statistics dict of :class:`pstats.Stats`, with the caller
+    edges as call graph. Callers that were not profiled themselves, e.g. the EventController,
+    get an entry without time.
+
+    :param call_cycles: The call cycles.
+    :type call_cycles: Iterable[CallCycle]
+    :return: ``(primitive calls, calls, self time, cumulative time, callers)`` by function.
+    :rtype: dict[PstatsKey, Any]
+    """
+    stats: dict[PstatsKey, Any] = {}
+    callers: set[str] = set()
+
+    for cc in call_cycles:
+        m = cc.method
+        edges = {
+            _pstats_key(c.caller): (c.called, c.called, c.self_time, c.self_time + c.callees_time)
+            for c in cc.callers
+        }
+        callers.update(c.caller for c in cc.callers)
+        stats[_pstats_key(m.method)] = (
+            max(m.called - m.self_, 0),
+            m.called,
+            m.self_time,
+            m.self_time + m.callees_time,
+            edges,
+        )
+
+    for caller in callers:
+        stats.setdefault(_pstats_key(caller), (0, 0, 0.0, 0.0, {}))
+    return stats
+
+
+def write_pstats(call_cycles: Iterable[CallCycle], target: str | os.PathLike[str]) -> None:
+    """
+    Write call cycles to a file readable by :class:`pstats.Stats`, snakeviz and gprof2dot,
+    see :func:`to_pstats`.
+
+    :param call_cycles: The call cycles.
+    :type call_cycles: Iterable[CallCycle]
+    :param target: Path of the file to write, usually ending in ``.prof``.
+    :type target: str | os.PathLike[str]
+    """
+    with open(target, "wb") as f:
+        marshal.dump(to_pstats(call_cycles), f)
+
+
+def collapsed_stacks(
+    call_cycles: Iterable[CallCycle], max_depth: int = 64, min_fraction: float = 1e-4
+) -> dict[tuple[str, ...], float]:
+    """
+    Reconstruct call stacks with their self time from the caller edges.
+
+    The profiler records only single caller edges, not complete stacks. Stacks are built
+    downwards from the roots: callers that were not profiled themselves and methods with more
+    time than their caller edges account for. The callees time of a method in a
+    stack is split among its callees in proportion to their total time when called from that
+    method, like gprof does. Recursive calls, stacks deeper than ``max_depth`` and stacks with
+    less than ``min_fraction`` of the overall time end in a leaf holding their whole time, which
+    bounds the number of stacks of heavily shared methods.
+
+    :param call_cycles: The call cycles.
+    :type call_cycles: Iterable[CallCycle]
+    :param max_depth: Maximum stack depth.
+    :type max_depth: int
+    :param min_fraction: Minimum share of the overall time of an expanded stack.
+    :type min_fraction: float
+    :return: Self time in seconds by stack, from root to leaf.
+    :rtype: dict[tuple[str, ...], float]
+    """
+    call_cycles = list(call_cycles)
+    children: dict[str, list[tuple[str, CallerEntry]]] = defaultdict(list)
+    for cc in call_cycles:
+        for c in cc.callers:
+            children[c.caller].append((cc.method.method, c))
+
+    stacks: dict[tuple[str, ...], float] = defaultdict(float)
+    min_time = 0.0
+
+    def expand(stack: tuple[str, ...], self_time: float, callees_time: float) -> None:
+        stacks[stack] += self_time
+        edges = children.get(stack[-1], [])
+        edges_time = sum(c.self_time + c.callees_time for _, c in edges)
+        if callees_time <= 0 or edges_time <= 0:
+            stacks[stack] += callees_time
+            return
+
+        for method, c in edges:
+            total = c.self_time + c.callees_time
+            if total <= 0:
+                continue
+            share = callees_time * total / edges_time
+            child = stack + (method,)
+            if method in stack or len(child) >= max_depth or share < min_time:
+                stacks[child] += share
+            else:
+                expand(child, share * c.self_time / total, share * c.callees_time / total)
+
+    profiled = {cc.method.method for cc in call_cycles}
+    roots = []
+    for cc in call_cycles:
+        m = cc.method
+        total = m.self_time + m.callees_time
+        # Time not covered by the caller edges, e.g. without any caller
+        uncovered = total - sum(c.self_time + c.callees_time for c in cc.callers)
+        if uncovered > 1e-9 * total:
+            roots.append(
+                (m.method, uncovered * m.self_time / total, uncovered * m.callees_time / total)
+            )
+    roots.extend(
+        (caller, 0.0, sum(c.self_time + c.callees_time for _, c in edges))
+        for caller, edges in children.items()
+        if caller not in profiled
+    )
+
+    min_time = min_fraction * sum(self_time + callees_time for _, self_time, callees_time in roots)
+    for root, self_time, callees_time in roots:
+        expand((root,), self_time, callees_time)
+
+    return {stack: time for stack, time in stacks.items() if time > 0}
+
+
+def write_collapsed(
+    call_cycles: Iterable[CallCycle],
+    target: str | os.PathLike[str],
+    max_depth: int = 64,
+    min_fraction: float = 1e-4,
+) -> None:
+    """
+    Write call cycles as collapsed stacks for flamegraph.pl, inferno or speedscope, see
+    :func:`collapsed_stacks`. Every line holds the frames separated by ``;`` and the self
+    time in microseconds.
+
+    :param call_cycles: The call cycles.
+    :type call_cycles: Iterable[CallCycle]
+    :param target: Path of the file to write.
+    :type target: str | os.PathLike[str]
+    :param max_depth: Maximum stack depth.
+    :type max_depth: int
+    :param min_fraction: Minimum share of the overall time of an expanded stack.
+    :type min_fraction: float
+    """
+    with open(target, "w", encoding="utf-8") as f:
+        for stack, time in collapsed_stacks(call_cycles, max_depth, min_fraction).items():
+            weight = round(time * 1_000_000)
+            if weight > 0:
+                f.write(";".join(frame.replace(";", ":") for frame in stack) + f" {weight}\n")
+
+
+def to_speedscope(
+    call_cycles: Iterable[CallCycle],
+    name: str = "SimTalk",
+    max_depth: int = 64,
+    min_fraction: float = 1e-4,
+) -> dict[str, Any]:
+    """
+    Convert call cycles into a sampled profile in the speedscope file format, with the stacks
+    of :func:`collapsed_stacks` weighted by their self time.
+
+    :param call_cycles: The call cycles.
+    :type call_cycles: Iterable[CallCycle]
+    :param name: Name of the profile.
+    :type name: str
+    :param max_depth: Maximum stack depth.
+    :type max_depth: int
+    :param min_fraction: Minimum share of the overall time of an expanded stack.
+    :type min_fraction: float
+    :return: The speedscope document.
+    :rtype: dict[str, Any]
+    """
+    frames: dict[str, int] = {}
+    samples: list[list[int]] = []
+    weights: list[float] = []
+
+    for stack, time in collapsed_stacks(call_cycles, max_depth, min_fraction).items():
+        samples.append([frames.setdefault(frame, len(frames)) for frame in stack])
+        weights.append(time)
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": frame} for frame in frames]},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+        "name": name,
+        "exporter": "pyplantsim",
+    }
+
+
+def write_speedscope(
+    call_cycles: Iterable[CallCycle],
+    target: str | os.PathLike[str],
+    name: str = "SimTalk",
+    max_depth: int = 64,
+    min_fraction: float = 1e-4,
+) -> None:
+    """
+    Write call cycles to a speedscope JSON file, see :func:`to_speedscope`.
+
+    :param call_cycles: The call cycles.
+    :type call_cycles: Iterable[CallCycle]
+    :param target: Path of the file to write.
+    :type target: str | os.PathLike[str]
+    :param name: Name of the profile.
+    :type name: str
+    :param max_depth: Maximum stack depth.
+    :type max_depth: int
+    :param min_fraction: Minimum share of the overall time of an expanded stack.
+    :type min_fraction: float
+    """
+    with open(target, "w", encoding="utf-8") as f:
+        json.dump(to_speedscope(call_cycles, name, max_depth, min_fraction), f)
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .plantsim import Plantsim
+
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    Subscription to attribute changes pushed from the model, created by
+    :meth:`Plantsim.subscribe`.
+
+    The model reports every change of a subscribed attribute as a SimTalk message. Changes are
+    coalesced per attribute, so that only the latest value of every attribute changed since
+    the previous delivery is passed to the callback, at most once per ``min_interval``.
+    Changes arriving within the interval are delivered once it has passed, from a timer thread.
+
+    :param plantsim: The instance the attributes belong to.
+    :type plantsim: Plantsim
+    :param paths: Subscribed attribute paths.
+    :type paths: list[str]
+    :param callback: Called with the latest value of every changed attribute by path.
+    :type callback: Callable[[dict[str, Any]], None]
+    :param min_interval: Minimum time in seconds between two deliveries.
+    :type min_interval: float
+    """
+
+    def __init__(
+        self,
+        plantsim: Plantsim,
+        paths: list[str],
+        callback: Callable[[dict[str, Any]], None],
+        min_interval: float = 0.0,
+    ) -> None:
+        """
+        Initialize the subscription.
+
+        :param plantsim: The instance the attributes belong to.
+        :type plantsim: Plantsim
+        :param paths: Subscribed attribute paths.
+        :type paths: list[str]
+        :param callback: Called with the latest value of every changed attribute by path.
+        :type callback: Callable[[dict[str, Any]], None]
+        :param min_interval: Minimum time in seconds between two deliveries.
+        :type min_interval: float
+        """
+        self._plantsim = plantsim
+        self._paths = paths
+        self._callback = callback
+        self._min_interval = min_interval
+
+        self._lock = threading.Lock()
+        self._pending: dict[str, Any] = {}
+        self._last_delivery = 0.0
+        self._timer: threading.Timer | None = None
+        self._changes = 0
+        self._deliveries = 0
+        self._closed = False
+
+    def _on_change(self, path: str, value: Any) -> None:
+        """
+        Record a change reported by the model and deliver it if the interval has passed.
+
+        :param path: Path of the changed attribute.
+        :type path: str
+        :param value: The new value.
+        :type value: Any
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._pending[path] = value
+            self._changes += 1
+
+            wait = self._last_delivery + self._min_interval - time.perf_counter()
+            if wait > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(wait, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Deliver the pending changes now.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            changes, self._pending = self._pending, {}
+            self._last_delivery = time.perf_counter()
+            self._deliveries += 1
+
+        try:
+            self._callback(changes)
+        except Exception:
+            logger.exception("Subscription callback failed.")
+
+    def close(self) -> None:
+        """
+        Deliver the pending changes and stop observing the attributes.
+        """
+        if self._closed:
+            return
+        self.flush()
+        with self._lock:
+            self._closed = True
+        self._plantsim.unsubscribe(self)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def paths(self) -> list[str]:
+        """
+        Subscribed attribute paths.
+
+        :return: Attribute paths.
+        :rtype: list[str]
+        """
+        return list(self._paths)
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the subscription was closed.
+
+        :return: True if closed.
+        :rtype: bool
+        """
+        return self._closed
+
+    @property
+    def changes(self) -> int:
+        """
+        Number of changes reported by the model.
+
+        :return: Number of changes.
+        :rtype: int
+        """
+        return self._changes
+
+    @property
+    def deliveries(self) -> int:
+        """
+        Number of callback invocations.
+
+        :return: Number of deliveries.
+        :rtype: int
+        """
+        return self._deliveries
+
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the subscription.
+
+        :return: String representation.
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"paths={len(self._paths)}, "
+            f"changes={self._changes}, "
+            f"deliveries={self._deliveries}, "
+            f"closed={self._closed})"
+        )
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Callable
+from typing import Literal
+from typing import TYPE_CHECKING
+
+from plantsimpath import PlantsimPath
+
+from .tables import ChunkWriter
+from .tables import TableLayout
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .plantsim import Plantsim
+
+
+logger = logging.getLogger(__name__)
+
+
+class TableTail:
+    """
+    Incremental reader of an append-only table, e.g. an event log filled during a run.
+
+    Every :meth:`poll` reads only the rows appended since the previous poll, with a single
+    SimTalk call, and passes them to the callback and/or appends them to a file. A table that
+    got shorter (e.g. cleared on reset) is read again from its first row.
+
+    COM objects may only be used from the thread owning the instance, so polling is driven
+    from that thread, typically by passing :meth:`on_progress` to
+    :meth:`Plantsim.run_simulation`::
+
+        tail = plantsim.tail_table(PlantsimPath(".Models.Model.EventLog"), callback=handle)
+        plantsim.run_simulation(on_progress=tail.on_progress)
+        tail.poll()  # Rows written after the last progress update
+
+    :param plantsim: The instance to read from.
+    :type plantsim: Plantsim
+    :param path: Path to the table.
+    :type path: PlantsimPath
+    :param callback: Called with every non-empty batch of new rows.
+    :type callback: Callable[[pd.DataFrame], None] | None
+    :param target: File to append the new rows to.
+    :type target: str | os.PathLike[str] | None
+    :param file_format: ``csv`` or ``parquet``. Derived from the file suffix if not given.
+    :type file_format: Literal["csv", "parquet"] | None
+    :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+    :type typed: bool
+    :param interval: Minimum time in seconds between two polls triggered by
+        :meth:`on_progress`.
+    :type interval: float
+    """
+
+    def __init__(
+        self,
+        plantsim: Plantsim,
+        path: PlantsimPath,
+        callback: Callable[[pd.DataFrame], None] | None = None,
+        target: str | os.PathLike[str] | None = None,
+        file_format: Literal["csv", "parquet"] | None = None,
+        typed: bool = False,
+        interval: float = 0.0,
+    ) -> None:
+        """
+        Initialize the tail, starting at the first row of the table.
+
+        :param plantsim: The instance to read from.
+        :type plantsim: Plantsim
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param callback: Called with every non-empty batch of new rows.
+        :type callback: Callable[[pd.DataFrame], None] | None
+        :param target: File to append the new rows to.
+        :type target: str | os.PathLike[str] | None
+        :param file_format: ``csv`` or ``parquet``. Derived from the file suffix if not given.
+        :type file_format: Literal["csv", "parquet"] | None
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+        :type typed: bool
+        :param interval: Minimum time in seconds between two polls triggered by
+            :meth:`on_progress`.
+        :type interval: float
+        """
+        self._plantsim = plantsim
+        self._path = path
+        self._callback = callback
+        self._typed = typed
+        self._interval = interval
+        self._last_row = 0
+        self._last_poll = 0.0
+        self._header: TableLayout | None = None
+        self._data_types: list[str] = []
+
+        self._writer: ChunkWriter | None = None
+        if target is not None:
+            if file_format is None:
+                file_format = "parquet" if Path(target).suffix.lower() == ".parquet" else "csv"
+            self._writer = ChunkWriter(target, file_format)
+
+    def poll(self) -> pd.DataFrame | None:
+        """
+        Read the rows appended since the last poll.
+
+        :return: The new rows or None if there are none.
+        :rtype: pd.DataFrame | None
+        """
+        self._last_poll = time.perf_counter()
+
+        y_dim = self._plantsim.get_value(PlantsimPath(self._path, "yDim"))
+        if y_dim < self._last_row:
+            logger.info(f"{self._path} got shorter, reading it again from the first row.")
+            self._last_row = 0
+        if y_dim == self._last_row:
+            return None
+
+        if self._header is None:
+            self._header = self._plantsim._table_header(self._path)
+            self._data_types = self._plantsim.get_table_column_data_types(self._path)
+
+        df = self._plantsim._read_table_range(
+            self._path,
+            self._last_row + 1,
+            y_dim,
+            self._header,
+            self._data_types,
+            typed=self._typed,
+        )
+        self._last_row = y_dim
+
+        if self._writer is not None:
+            self._writer.write(df)
+        if self._callback is not None:
+            self._callback(df)
+        return df
+
+    def on_progress(self, instance: Plantsim, progress: float) -> None:
+        """
+        Progress callback for :meth:`Plantsim.run_simulation` polling the table, at most once
+        per ``interval``.
+
+        :param instance: The simulating instance.
+        :type instance: Plantsim
+        :param progress: Progress of the run in percent.
+        :type progress: float
+        """
+        if time.perf_counter() - self._last_poll >= self._interval:
+            self.poll()
+
+    def reset(self) -> None:
+        """
+        Read the table from its first row again with the next poll and re-read its layout.
+        """
+        self._last_row = 0
+        self._header = None
+
+    def close(self) -> None:
+        """
+        Finish the output file.
+        """
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self) -> "TableTail":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def last_row(self) -> int:
+        """
+        Number of the last row read.
+
+        :return: Row number, 0 if nothing has been read.
+        :rtype: int
+        """
+        return self._last_row
+
+    @property
+    def rows_written(self) -> int:
+        """
+        Number of rows appended to the output file.
+
+        :return: Number of rows.
+        :rtype: int
+        """
+        return self._writer.rows if self._writer is not None else 0
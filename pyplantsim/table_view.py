@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any
+from typing import Iterator
+from typing import TYPE_CHECKING
+
+from plantsimpath import PlantsimPath
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .plantsim import Plantsim
+
+
+class TableView:
+    """
+    Lazy, read-only view of a Plant Simulation table, e.g. for inspecting huge tables
+    interactively without reading them completely.
+
+    Shape and column names are read when the view is created. Rows are read in pages of
+    ``page_rows`` rows, each with a single SimTalk call, when they are first accessed. Pages are
+    kept in a least recently used cache limited by ``max_pages`` and ``max_bytes``.
+
+    Rows are addressed by position starting at 0, like :attr:`pandas.DataFrame.iloc`::
+
+        view = plantsim.table_view(PlantsimPath(".Models.Model.EventLog"))
+        view.shape  # (1000000, 8)
+        view[-10:]  # Last ten rows as DataFrame
+        view[42]  # Row 42 as Series
+
+    The view does not notice changes of the table. Call :meth:`refresh` after the table
+    changed.
+
+    :param plantsim: The instance to read from.
+    :type plantsim: Plantsim
+    :param path: Path to the table.
+    :type path: PlantsimPath
+    :param page_rows: Number of rows read per page.
+    :type page_rows: int
+    :param max_pages: Maximum number of cached pages.
+    :type max_pages: int
+    :param max_bytes: Maximum memory usage of the cached pages. Unlimited if None.
+    :type max_bytes: int | None
+    :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+    :type typed: bool
+    """
+
+    def __init__(
+        self,
+        plantsim: Plantsim,
+        path: PlantsimPath,
+        page_rows: int = 1000,
+        max_pages: int = 16,
+        max_bytes: int | None = None,
+        typed: bool = False,
+    ) -> None:
+        """
+        Initialize the view and read the table layout.
+
+        :param plantsim: The instance to read from.
+        :type plantsim: Plantsim
+        :param path: Path to the table.
+        :type path: PlantsimPath
+        :param page_rows: Number of rows read per page.
+        :type page_rows: int
+        :param max_pages: Maximum number of cached pages.
+        :type max_pages: int
+        :param max_bytes: Maximum memory usage of the cached pages. Unlimited if None.
+        :type max_bytes: int | None
+        :param typed: Give the columns the dtypes matching their Plant Simulation data types.
+        :type typed: bool
+        :raises ValueError: If page_rows or max_pages is not positive.
+        """
+        if page_rows < 1:
+            raise ValueError("page_rows must be at least 1.")
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1.")
+
+        self._plantsim = plantsim
+        self._path = path
+        self._page_rows = page_rows
+        self._max_pages = max_pages
+        self._max_bytes = max_bytes
+        self._typed = typed
+
+        self._pages: OrderedDict[int, pd.DataFrame] = OrderedDict()
+        self._page_bytes: dict[int, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Read the shape and layout of the table again and drop all cached pages.
+        """
+        self._y_dim: int = self._plantsim.get_value(PlantsimPath(self._path, "yDim"))
+        self._header = self._plantsim._table_header(self._path)
+        self._data_types = self._plantsim.get_table_column_data_types(self._path)
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached pages.
+        """
+        self._pages.clear()
+        self._page_bytes.clear()
+
+    def _page(self, number: int) -> pd.DataFrame:
+        """
+        Get a page from the cache, reading it on a miss.
+
+        :param number: Page number, starting at 0.
+        :type number: int
+        :return: The rows of the page.
+        :rtype: pd.DataFrame
+        """
+        page = self._pages.get(number)
+        if page is not None:
+            self._hits += 1
+            self._pages.move_to_end(number)
+            return page
+
+        self._misses += 1
+        first_row = number * self._page_rows + 1
+        last_row = min(first_row + self._page_rows - 1, self._y_dim)
+        page = self._plantsim._read_table_range(
+            self._path, first_row, last_row, self._header, self._data_types, typed=self._typed
+        )
+
+        self._pages[number] = page
+        self._page_bytes[number] = int(page.memory_usage(deep=True).sum())
+        self._evict(keep=number)
+        return page
+
+    def _evict(self, keep: int) -> None:
+        """
+        Drop least recently used pages until the cache fits its limits.
+
+        :param keep: Page that must not be dropped.
+        :type keep: int
+        """
+        while len(self._pages) > 1 and (
+            len(self._pages) > self._max_pages
+            or (self._max_bytes is not None and self.cached_bytes > self._max_bytes)
+        ):
+            number = next(iter(self._pages))
+            if number == keep:
+                break
+            del self._pages[number]
+            del self._page_bytes[number]
+
+    def to_pandas(self, start: int = 0, stop: int | None = None) -> pd.DataFrame:
+        """
+        Get a range of rows as DataFrame, reading only the pages it touches.
+
+        :param start: Position of the first row, starting at 0.
+        :type start: int
+        :param stop: Position after the last row. Up to the end of the table if None.
+        :type stop: int | None
+        :return: The rows.
+        :rtype: pd.DataFrame
+        """
+        import pandas as pd
+
+        start, stop, _ = slice(start, stop).indices(self._y_dim)
+        if start >= stop:
+            return self._empty()
+
+        frames = []
+        for number in range(start // self._page_rows, (stop - 1) // self._page_rows + 1):
+            offset = number * self._page_rows
+            frames.append(self._page(number).iloc[max(start - offset, 0) : stop - offset])
+        return frames[0] if len(frames) == 1 else pd.concat(frames)
+
+    def _empty(self) -> pd.DataFrame:
+        """
+        Build an empty DataFrame with the columns of the table.
+
+        :return: The empty DataFrame.
+        :rtype: pd.DataFrame
+        """
+        return self._plantsim._cells_frame(
+            [],
+            self._data_types,
+            self._header.columns,
+            [],
+            self._header.index_name,
+            self._typed,
+            False,
+        )
+
+    def iter_pages(self) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the table page by page.
+
+        :return: Iterator over the pages.
+        :rtype: Iterator[pd.DataFrame]
+        """
+        for number in range(-(-self._y_dim // self._page_rows)):
+            yield self._page(number)
+
+    def __iter__(self) -> Iterator[pd.Series]:
+        """
+        Iterate over the rows of the table.
+
+        :return: Iterator over the rows.
+        :rtype: Iterator[pd.Series]
+        """
+        for page in self.iter_pages():
+            for _, row in page.iterrows():
+                yield row
+
+    def __getitem__(self, key: int | slice) -> Any:
+        """
+        Get a row by position or a range of rows.
+
+        :param key: Row position, negative counting from the end, or slice of positions.
+        :type key: int | slice
+        :return: The row as Series or the rows as DataFrame.
+        :rtype: pd.Series | pd.DataFrame
+        :raises IndexError: If the row position is outside of the table.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._y_dim)
+            if step < 0:
+                return self.to_pandas(stop + 1, start + 1).iloc[::step]
+            return self.to_pandas(start, stop).iloc[::step]
+
+        position = key + self._y_dim if key < 0 else key
+        if not 0 <= position < self._y_dim:
+            raise IndexError(f"Row {key} is outside of the table.")
+        return self._page(position // self._page_rows).iloc[position % self._page_rows]
+
+    def __len__(self) -> int:
+        """
+        Number of rows.
+
+        :return: Number of rows.
+        :rtype: int
+        """
+        return self._y_dim
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        Number of rows and columns.
+
+        :return: Shape of the table.
+        :rtype: tuple[int, int]
+        """
+        return self._y_dim, self._header.x_dim
+
+    @property
+    def columns(self) -> list[Any] | None:
+        """
+        Column names.
+
+        :return: Column names, None without column index.
+        :rtype: list[Any] | None
+        """
+        return self._header.columns
+
+    @property
+    def data_types(self) -> list[str]:
+        """
+        Plant Simulation data types of the columns.
+
+        :return: Data type of every column.
+        :rtype: list[str]
+        """
+        return list(self._data_types)
+
+    @property
+    def cached_pages(self) -> int:
+        """
+        Number of cached pages.
+
+        :return: Number of pages.
+        :rtype: int
+        """
+        return len(self._pages)
+
+    @property
+    def cached_bytes(self) -> int:
+        """
+        Memory usage of the cached pages.
+
+        :return: Size in bytes.
+        :rtype: int
+        """
+        return sum(self._page_bytes.values())
+
+    @property
+    def hits(self) -> int:
+        """
+        Number of page accesses served from the cache.
+
+        :return: Number of hits.
+        :rtype: int
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        Number of page accesses that had to read the page.
+
+        :return: Number of misses.
+        :rtype: int
+        """
+        return self._misses
+
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the view.
+
+        :return: String representation.
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"path={str(self._path)!r}, "
+            f"shape={self.shape}, "
+            f"cached_pages={len(self._pages)})"
+        )
@@ -0,0 +1,715 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from typing import Iterable
+from typing import Literal
+from typing import Mapping
+from typing import NamedTuple
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Plant Simulation data types that are transferred as floating point numbers
+REAL_TYPES = frozenset({"real", "length", "weight", "speed", "acceleration"})
+
+# Plant Simulation data types transferred by the fixed-width numeric fast path
+NUMERIC_TYPES = REAL_TYPES | {"integer"}
+
+# Plant Simulation data types holding points in time
+DATETIME_TYPES = frozenset({"date", "datetime"})
+
+# Separators of the bulk row transfer, see get_table_rows.st
+CELL_SEPARATOR = chr(31)
+ROW_SEPARATOR = chr(30)
+
+# Separator of the tables of a multi-table transfer, see get_tables.st
+TABLE_SEPARATOR = chr(29)
+
+# Comparison operators supported by the row filter of get_table_rows_where.st
+WHERE_OPERATORS = ("=", "!=", "<", "<=", ">", ">=")
+
+# Aggregations supported by aggregate_table.st
+AGGREGATIONS = ("count", "sum", "mean", "min", "max")
+
+# Strings are stored as categoricals if at most this share of the values is unique
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _to_datetime(values: list[Any], datetime_format: str | None) -> pd.Series:
+    """
+    Parse date or datetime strings in the model format.
+
+    :param values: Cell values.
+    :type values: list[Any]
+    :param datetime_format: Datetime format of the model language.
+    :type datetime_format: str | None
+    :return: The parsed values.
+    :rtype: pd.Series
+    """
+    import pandas as pd
+
+    series = pd.Series(values, dtype=object)
+    if datetime_format is None:
+        return pd.to_datetime(series)
+
+    # Dates are transferred without the time part
+    for fmt in (datetime_format, datetime_format.split(" ", 1)[0]):
+        try:
+            return pd.to_datetime(series, format=fmt)
+        except ValueError:
+            continue
+    return pd.to_datetime(series, format="mixed", dayfirst=datetime_format.startswith("%d"))
+
+
+def typed_series(
+    values: list[Any],
+    data_type: str,
+    datetime_format: str | None = None,
+    downcast: bool = False,
+) -> pd.Series:
+    """
+    Convert the values of a table column to a Series with the matching dtype.
+
+    Integers become ``int64`` (nullable ``Int64`` with empty cells), reals ``float64``,
+    booleans ``bool``, dates ``datetime64``, times (transferred as seconds) ``timedelta64`` and
+    strings with many repetitions ``category``. Other types keep the ``object`` dtype.
+
+    :param values: Cell values of the column.
+    :type values: list[Any]
+    :param data_type: Plant Simulation data type of the column.
+    :type data_type: str
+    :param datetime_format: Datetime format of the model language.
+    :type datetime_format: str | None
+    :param downcast: Downcast numeric columns to the smallest fitting dtype.
+    :type downcast: bool
+    :return: The typed column.
+    :rtype: pd.Series
+    """
+    import pandas as pd
+
+    has_missing = any(value is None for value in values)
+
+    if data_type == "integer":
+        series = pd.Series(values, dtype="Int64" if has_missing else "int64")
+        return pd.to_numeric(series, downcast="integer") if downcast else series
+
+    if data_type in REAL_TYPES:
+        series = pd.Series(values, dtype="float64")
+        return pd.to_numeric(series, downcast="float") if downcast else series
+
+    if data_type == "boolean":
+        return pd.Series(values, dtype="boolean" if has_missing else "bool")
+
+    if data_type == "time":
+        return pd.to_timedelta(pd.Series(values, dtype="float64"), unit="s")
+
+    if data_type in DATETIME_TYPES:
+        return _to_datetime(values, datetime_format)
+
+    if data_type == "string":
+        unique = len(set(values))
+        if values and unique <= len(values) * CATEGORY_MAX_UNIQUE_RATIO:
+            return pd.Series(values, dtype="category")
+        return pd.Series(values)
+
+    return pd.Series(values, dtype=object)
+
+
+def typed_frame(
+    rows: list[list[Any]],
+    data_types: list[str],
+    columns: list[Any] | None = None,
+    index: list[Any] | None = None,
+    datetime_format: str | None = None,
+    downcast: bool = False,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame with typed columns from the rows of a table.
+
+    :param rows: Cell values by row.
+    :type rows: list[list[Any]]
+    :param data_types: Plant Simulation data type of every column.
+    :type data_types: list[str]
+    :param columns: Column names. Numbered from 0 if not given.
+    :type columns: list[Any] | None
+    :param index: Row index. Numbered from 0 if not given.
+    :type index: list[Any] | None
+    :param datetime_format: Datetime format of the model language.
+    :type datetime_format: str | None
+    :param downcast: Downcast numeric columns to the smallest fitting dtype.
+    :type downcast: bool
+    :return: The typed DataFrame.
+    :rtype: pd.DataFrame
+    """
+    import pandas as pd
+
+    names = columns if columns is not None else list(range(len(data_types)))
+    cells_by_column = list(zip(*rows)) if rows else [() for _ in data_types]
+
+    data = {
+        i: typed_series(list(cells), data_type, datetime_format, downcast)
+        for i, (cells, data_type) in enumerate(zip(cells_by_column, data_types))
+    }
+    df = pd.DataFrame(data)
+    df.columns = pd.Index(names)
+    if index is not None:
+        df.index = pd.Index(index)
+    return df
+
+
+def parse_rows(text: str) -> list[list[str]]:
+    """
+    Split the result of a bulk row transfer into rows of cell texts.
+
+    :param text: Rows separated by :data:`ROW_SEPARATOR`, cells by :data:`CELL_SEPARATOR`.
+    :type text: str
+    :return: Cell texts by row.
+    :rtype: list[list[str]]
+    """
+    if not text:
+        return []
+    return [row.split(CELL_SEPARATOR) for row in text.split(ROW_SEPARATOR)]
+
+
+def numeric_frame(
+    text: str,
+    data_types: list[str],
+    columns: list[Any] | None = None,
+    with_index: bool = False,
+    typed: bool = True,
+    downcast: bool = False,
+    index_type: str | None = None,
+) -> pd.DataFrame:
+    """
+    Decode the fixed-width column blocks of an all-numeric table, see get_table_numeric.st.
+
+    Every column is a single block of equally wide cells, so it is read with
+    :func:`numpy.frombuffer` straight from the transferred buffer and converted in one
+    vectorized step, without splitting it into one string per cell. Columns with empty cells
+    fall back to converting cell by cell.
+
+    :param text: Column widths, optional row index and column blocks, separated by
+        :data:`ROW_SEPARATOR`.
+    :type text: str
+    :param data_types: Plant Simulation data type of every column, all in :data:`NUMERIC_TYPES`.
+    :type data_types: list[str]
+    :param columns: Column names. Numbered from 0 if not given.
+    :type columns: list[Any] | None
+    :param with_index: Whether the transfer contains the row index.
+    :type with_index: bool
+    :param typed: Keep nullable dtypes for columns with empty cells instead of letting pandas
+        infer the dtype.
+    :type typed: bool
+    :param downcast: Downcast numeric columns to the smallest fitting dtype.
+    :type downcast: bool
+    :param index_type: Data type of the row index, see :func:`parse_index`.
+    :type index_type: str | None
+    :return: The table.
+    :rtype: pd.DataFrame
+    """
+    import numpy as np
+    import pandas as pd
+
+    sections = text.split(ROW_SEPARATOR, 2 if with_index else 1)
+    widths = [int(width) for width in sections[0].split(";")] if sections[0] else []
+    index: list[Any] | None = None
+    if with_index:
+        index = parse_index(sections[1].split(CELL_SEPARATOR) if sections[1] else [], index_type)
+    buffer = sections[-1].encode("ascii")
+    y_dim = len(buffer) // sum(widths) if widths else 0
+
+    data = {}
+    offset = 0
+    for i, (width, data_type) in enumerate(zip(widths, data_types)):
+        cells = np.frombuffer(buffer, dtype=f"S{width}", count=y_dim, offset=offset)
+        offset += width * y_dim
+        try:
+            values = cells.astype(np.int64 if data_type == "integer" else np.float64)
+        except ValueError:
+            parsed = [parse_cell(cell.decode().strip(), data_type) for cell in cells]
+            data[i] = (
+                typed_series(parsed, data_type, downcast=downcast) if typed else pd.Series(parsed)
+            )
+            continue
+        series = pd.Series(values)
+        if downcast:
+            series = pd.to_numeric(
+                series, downcast="integer" if data_type == "integer" else "float"
+            )
+        data[i] = series
+
+    df = pd.DataFrame(data, index=pd.RangeIndex(y_dim))
+    df.columns = pd.Index(columns if columns is not None else range(len(widths)))
+    if index is not None:
+        df.index = pd.Index(index)
+    return df
+
+
+def column_number(column: str | int, x_dim: int, headers: list[Any] | None) -> int:
+    """
+    Resolve a column given by name or number to its Plant Simulation column number.
+
+    :param column: Column name or number, starting at 1.
+    :type column: str | int
+    :param x_dim: Number of columns of the table.
+    :type x_dim: int
+    :param headers: Column names of the table, None without column index.
+    :type headers: list[Any] | None
+    :return: Column number.
+    :rtype: int
+    :raises ValueError: If the column does not exist.
+    """
+    if isinstance(column, int):
+        if not 1 <= column <= x_dim:
+            raise ValueError(f"Column {column} is outside of the table.")
+        return column
+    if headers is None or column not in headers:
+        raise ValueError(f"Unknown column: {column!r}")
+    return headers.index(column) + 1
+
+
+def same_layout(old: pd.DataFrame, new: pd.DataFrame) -> bool:
+    """
+    Check whether two DataFrames have the same shape, columns and index.
+
+    :param old: The previously written DataFrame.
+    :type old: pd.DataFrame
+    :param new: The DataFrame to write.
+    :type new: pd.DataFrame
+    :return: True if only cell values may differ.
+    :rtype: bool
+    """
+    return (
+        old.shape == new.shape
+        and old.columns.equals(new.columns)
+        and old.index.equals(new.index)
+        and old.index.name == new.index.name
+    )
+
+
+def changed_cells(old: pd.DataFrame, new: pd.DataFrame) -> list[tuple[int, int, Any]]:
+    """
+    Find the cells that differ between two DataFrames of the same layout.
+
+    :param old: The previously written DataFrame.
+    :type old: pd.DataFrame
+    :param new: The DataFrame to write.
+    :type new: pd.DataFrame
+    :return: Column number, row number (both starting at 1) and new value of every changed
+        cell.
+    :rtype: list[tuple[int, int, Any]]
+    """
+    import numpy as np
+    import pandas as pd
+
+    old_values = old.to_numpy(dtype=object)
+    new_values = new.to_numpy(dtype=object)
+
+    old_missing = pd.isna(old)
+    new_missing = pd.isna(new)
+    changed = (old_values != new_values) & ~(old_missing.to_numpy() & new_missing.to_numpy())
+
+    rows, cols = np.nonzero(changed)
+    return [
+        (int(col) + 1, int(row) + 1, new_values[row, col])
+        for row, col in zip(rows.tolist(), cols.tolist())
+    ]
+
+
+def simtalk_value(value: Any) -> str:
+    """
+    Format a Python value the way SimTalk's ``to_str`` formats it.
+
+    :param value: The value.
+    :type value: Any
+    :return: The formatted value.
+    :rtype: str
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class TableLayout(NamedTuple):
+    """
+    Layout of a Plant Simulation table.
+
+    :ivar x_dim: Number of columns.
+    :vartype x_dim: int
+    :ivar row_index: Whether the row index is active.
+    :vartype row_index: bool
+    :ivar columns: Column names, None without column index.
+    :vartype columns: list[Any] | None
+    :ivar index_name: Name of the row index, the content of cell ``[0,0]``.
+    :vartype index_name: Any
+    :ivar index_type: Data type of the row index, None without row index.
+    :vartype index_type: str | None
+    """
+
+    x_dim: int
+    row_index: bool
+    columns: list[Any] | None
+    index_name: Any
+    index_type: str | None
+
+
+def parse_index(texts: Iterable[str], data_type: str | None) -> list[Any]:
+    """
+    Convert the transferred row index texts back into the values of the row index, so they
+    match the index read cell by cell.
+
+    :param texts: Row index texts.
+    :type texts: Iterable[str]
+    :param data_type: Data type of the row index, see :attr:`TableLayout.index_type`. Strings
+        if None.
+    :type data_type: str | None
+    :return: The row index values.
+    :rtype: list[Any]
+    """
+    return [parse_cell(text, data_type or "string") for text in texts]
+
+
+def parse_cell(text: str, data_type: str) -> Any:
+    """
+    Convert the text of a transferred cell back into a Python value.
+
+    :param text: Cell text.
+    :type text: str
+    :param data_type: Plant Simulation data type of the column.
+    :type data_type: str
+    :return: The cell value. Empty cells of non-string columns are None.
+    :rtype: Any
+    """
+    if data_type == "string":
+        return text
+    if text == "":
+        return None
+    if data_type == "integer":
+        return int(text)
+    if data_type in REAL_TYPES or data_type == "time":
+        return float(text)
+    if data_type == "boolean":
+        return text.lower() == "true"
+    return text
+
+
+def import_pyarrow() -> tuple[Any, Any]:
+    """
+    Import pyarrow and its Parquet module.
+
+    :return: The ``pyarrow`` and ``pyarrow.parquet`` modules.
+    :rtype: tuple[Any, Any]
+    :raises ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Arrow and Parquet support requires pyarrow. Install it with "
+            "'pip install pyplantsim[arrow]'."
+        ) from e
+    return pa, pq
+
+
+def decategorize(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace categorical columns by their values.
+
+    The categories of a chunk depend on its content, so categorical chunks do not share an
+    Arrow schema. Parquet dictionary-encodes repeated values anyway.
+
+    :param df: The DataFrame.
+    :type df: pd.DataFrame
+    :return: The DataFrame without categorical columns.
+    :rtype: pd.DataFrame
+    """
+    import pandas as pd
+
+    categorical = [
+        i for i, dtype in enumerate(df.dtypes) if isinstance(dtype, pd.CategoricalDtype)
+    ]
+    if not categorical:
+        return df
+
+    df = df.copy()
+    for i in categorical:
+        column = df.iloc[:, i]
+        df.isetitem(i, column.astype(column.cat.categories.dtype).to_numpy())
+    return df
+
+
+class ChunkWriter:
+    """
+    Writes DataFrame chunks one after another into a single CSV or Parquet file.
+
+    :param target: Path of the file to write.
+    :type target: str | os.PathLike[str]
+    :param file_format: File format, ``csv`` or ``parquet``. Parquet requires pyarrow.
+    :type file_format: Literal["csv", "parquet"]
+    """
+
+    def __init__(
+        self, target: str | os.PathLike[str], file_format: Literal["csv", "parquet"]
+    ) -> None:
+        """
+        Initialize the writer. The file is created with the first chunk.
+
+        :param target: Path of the file to write.
+        :type target: str | os.PathLike[str]
+        :param file_format: File format, ``csv`` or ``parquet``. Parquet requires pyarrow.
+        :type file_format: Literal["csv", "parquet"]
+        :raises ValueError: If the file format is unknown.
+        """
+        if file_format not in ("csv", "parquet"):
+            raise ValueError(f"Unknown file format: {file_format}")
+
+        self._target = target
+        self._file_format = file_format
+        self._writer: Any = None
+        self._started = False
+        self._rows = 0
+
+        if file_format == "parquet":
+            self._pa, self._pq = import_pyarrow()
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """
+        Append a chunk to the file. All chunks need the same columns.
+
+        :param chunk: The chunk to write.
+        :type chunk: pd.DataFrame
+        """
+        if self._file_format == "csv":
+            chunk.to_csv(
+                self._target, mode="a" if self._started else "w", header=not self._started
+            )
+        else:
+            # All chunks are converted with the schema of the first one, so that columns with
+            # missing values in some chunks only still end up in the same file
+            table = self._pa.Table.from_pandas(
+                decategorize(chunk),
+                schema=self._writer.schema if self._writer is not None else None,
+                preserve_index=True,
+            )
+            if self._writer is None:
+                self._writer = self._pq.ParquetWriter(self._target, table.schema)
+            self._writer.write_table(table)
+        self._started = True
+        self._rows += len(chunk)
+
+    def close(self) -> None:
+        """
+        Finish the file.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "ChunkWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def rows(self) -> int:
+        """
+        Number of written rows.
+
+        :return: Number of rows.
+        :rtype: int
+        """
+        return self._rows
+
+
+def write_chunks(
+    chunks: Iterable[pd.DataFrame],
+    target: str | os.PathLike[str],
+    file_format: Literal["csv", "parquet"],
+) -> int:
+    """
+    Stream DataFrame chunks into a single CSV or Parquet file.
+
+    :param chunks: The chunks to write. All need the same columns.
+    :type chunks: Iterable[pd.DataFrame]
+    :param target: Path of the file to write.
+    :type target: str | os.PathLike[str]
+    :param file_format: File format, ``csv`` or ``parquet``. Parquet requires pyarrow.
+    :type file_format: Literal["csv", "parquet"]
+    :return: Number of written rows.
+    :rtype: int
+    :raises ValueError: If the file format is unknown.
+    """
+    with ChunkWriter(target, file_format) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+    return writer.rows
+
+
+def arrow_column(cells: list[str], data_type: str, datetime_format: str | None = None) -> Any:
+    """
+    Convert the transferred cell texts of a table column to an Arrow array of the matching type.
+
+    Integers become ``int64``, reals ``float64``, booleans ``bool``, times (transferred as
+    seconds) ``duration[ms]`` and dates ``timestamp``. The conversions run vectorized on a
+    string array. Empty cells of non-string columns are null. Other types stay strings.
+
+    :param cells: Cell texts of the column.
+    :type cells: list[str]
+    :param data_type: Plant Simulation data type of the column.
+    :type data_type: str
+    :param datetime_format: Datetime format of the model language.
+    :type datetime_format: str | None
+    :return: The column.
+    :rtype: pyarrow.Array
+    """
+    pa = import_pyarrow()[0]
+    import pyarrow.compute as pc
+
+    strings = pa.array(cells, type=pa.string())
+    if data_type == "string":
+        return strings
+
+    if data_type in DATETIME_TYPES:
+        # Arrow's strptime does not support fractional seconds, so use the pandas parser
+        return pa.array(_to_datetime([cell or None for cell in cells], datetime_format))
+
+    strings = pc.if_else(pc.equal(strings, ""), pa.scalar(None, pa.string()), strings)
+    if data_type == "integer":
+        return pc.cast(strings, pa.int64())
+    if data_type in REAL_TYPES:
+        return pc.cast(strings, pa.float64())
+    if data_type == "boolean":
+        return pc.equal(pc.utf8_lower(strings), "true")
+    if data_type == "time":
+        milliseconds = pc.round(pc.multiply(pc.cast(strings, pa.float64()), 1000))
+        return pc.cast(pc.cast(milliseconds, pa.int64()), pa.duration("ms"))
+    return strings
+
+
+def arrow_batch(
+    text: str,
+    num_rows: int,
+    data_types: list[str],
+    columns: list[Any] | None = None,
+    index_name: Any = None,
+    with_index: bool = False,
+    datetime_format: str | None = None,
+    index_type: str | None = None,
+) -> Any:
+    """
+    Build an Arrow RecordBatch from a column by column transfer, see get_table_columns.st.
+
+    The transfer is sliced and converted one column at a time, so besides the transferred text
+    only a single column is held as Python strings at any time.
+
+    :param text: Columns separated by :data:`ROW_SEPARATOR`, cells by :data:`CELL_SEPARATOR`.
+    :type text: str
+    :param num_rows: Number of transferred rows.
+    :type num_rows: int
+    :param data_types: Plant Simulation data type of every column.
+    :type data_types: list[str]
+    :param columns: Column names. Numbered from 0 if not given.
+    :type columns: list[Any] | None
+    :param index_name: Name of the row index column, ``index`` if not given.
+    :type index_name: Any
+    :param with_index: Whether the first transferred column is the row index. It becomes the
+        first column of the batch.
+    :type with_index: bool
+    :param datetime_format: Datetime format of the model language.
+    :type datetime_format: str | None
+    :param index_type: Data type of the row index. Strings if None.
+    :type index_type: str | None
+    :return: The batch.
+    :rtype: pyarrow.RecordBatch
+    """
+    pa = import_pyarrow()[0]
+
+    names = [str(name) for name in (columns if columns is not None else range(len(data_types)))]
+    types = list(data_types)
+    if with_index:
+        names.insert(0, str(index_name) if index_name else "index")
+        types.insert(0, index_type or "string")
+
+    arrays = []
+    start = 0
+    for data_type in types:
+        end = text.find(ROW_SEPARATOR, start)
+        if end == -1:
+            end = len(text)
+        cells = text[start:end].split(CELL_SEPARATOR) if num_rows else []
+        arrays.append(arrow_column(cells, data_type, datetime_format))
+        start = end + 1
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def partition_path(
+    target: str | os.PathLike[str], partition: Mapping[str, Any], file_name: str
+) -> Path:
+    """
+    Build the path of a file in a Hive-style partitioned dataset, e.g.
+    ``target/job=3/scenario=base/file_name``. The directories are created.
+
+    :param target: Root directory of the dataset.
+    :type target: str | os.PathLike[str]
+    :param partition: Partition keys and values, in directory order.
+    :type partition: Mapping[str, Any]
+    :param file_name: Name of the file within the partition.
+    :type file_name: str
+    :return: Path of the file.
+    :rtype: Path
+    """
+    directory = Path(target).joinpath(*(f"{key}={value}" for key, value in partition.items()))
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / file_name
+
+
+def write_batches(
+    batches: Iterable[Any],
+    target: str | os.PathLike[str],
+    file_format: Literal["parquet", "feather"],
+) -> int:
+    """
+    Stream Arrow RecordBatches into a single Parquet or Feather (Arrow IPC) file.
+
+    :param batches: The batches to write. All need the same schema.
+    :type batches: Iterable[pyarrow.RecordBatch]
+    :param target: Path of the file to write.
+    :type target: str | os.PathLike[str]
+    :param file_format: File format, ``parquet`` or ``feather``.
+    :type file_format: Literal["parquet", "feather"]
+    :return: Number of written rows.
+    :rtype: int
+    :raises ValueError: If the file format is unknown or there are no batches.
+    """
+    if file_format not in ("parquet", "feather"):
+        raise ValueError(f"Unknown file format: {file_format}")
+
+    pa, pq = import_pyarrow()
+
+    writer: Any = None
+    rows = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                if file_format == "parquet":
+                    writer = pq.ParquetWriter(target, batch.schema)
+                else:
+                    writer = pa.ipc.new_file(target, batch.schema)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        raise ValueError("There are no batches to write.")
+    return rows
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import threading
+from typing import Any
+from typing import Literal
+from typing import Sequence
+from typing import TYPE_CHECKING
+
+from plantsimpath import PlantsimPath
+
+from .tables import CELL_SEPARATOR
+from .tables import import_pyarrow
+from .tables import ROW_SEPARATOR
+
+
+if TYPE_CHECKING:
+    from .plantsim import Plantsim
+
+
+# First character of a trace payload fired by install_trace.st
+TRACE_PREFIX = chr(3)
+
+
+@dataclass
+class TraceSpec:
+    """
+    Trace to capture for every job run by an instance handler, into one file per job.
+
+    :ivar objects: Paths of the traced objects.
+    :vartype objects: Sequence[PlantsimPath]
+    :ivar directory: Directory the trace files are written to, named ``trace-<job_id>``.
+    :vartype directory: str | os.PathLike[str]
+    :ivar file_format: ``parquet`` or ``feather`` (Arrow IPC).
+    :vartype file_format: Literal["parquet", "feather"]
+    :ivar row_group_rows: Number of records per row group.
+    :vartype row_group_rows: int
+    """
+
+    objects: Sequence[PlantsimPath]
+    directory: str | os.PathLike[str]
+    file_format: Literal["parquet", "feather"] = "parquet"
+    row_group_rows: int = 65_536
+
+    def target(self, job_id: str) -> Path:
+        """
+        Path of the trace file of a job. The directory is created.
+
+        :param job_id: Id of the job.
+        :type job_id: str
+        :return: Path of the trace file.
+        :rtype: Path
+        """
+        directory = Path(self.directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"trace-{job_id}.{self.file_format}"
+
+
+class TraceCapture:
+    """
+    Capture of the movable unit flow through objects into a compressed columnar file, created
+    by :meth:`Plantsim.start_trace`.
+
+    The model records every entry and exit of a traced object and fires the records in
+    batches. They are collected column by column and written in row groups of
+    ``row_group_rows`` records, so at most one row group is held in memory. Every record holds
+    the simulation time in seconds (``time``), the object path (``object``), ``entry`` or
+    ``exit`` (``event``) and the number of MUs on the object afterwards (``contents``).
+
+    :param plantsim: The instance the objects belong to.
+    :type plantsim: Plantsim
+    :param objects: Paths of the traced objects.
+    :type objects: list[str]
+    :param target: Path of the file to write.
+    :type target: str | os.PathLike[str]
+    :param file_format: ``parquet`` or ``feather`` (Arrow IPC).
+    :type file_format: Literal["parquet", "feather"]
+    :param row_group_rows: Number of records per row group.
+    :type row_group_rows: int
+    :param compression: Compression codec, e.g. ``zstd`` or ``lz4``.
+    :type compression: str
+    """
+
+    def __init__(
+        self,
+        plantsim: Plantsim,
+        objects: list[str],
+        target: str | os.PathLike[str],
+        file_format: Literal["parquet", "feather"] = "parquet",
+        row_group_rows: int = 65_536,
+        compression: str = "zstd",
+    ) -> None:
+        """
+        Initialize the capture and create the file.
+
+        :param plantsim: The instance the objects belong to.
+        :type plantsim: Plantsim
+        :param objects: Paths of the traced objects.
+        :type objects: list[str]
+        :param target: Path of the file to write.
+        :type target: str | os.PathLike[str]
+        :param file_format: ``parquet`` or ``feather`` (Arrow IPC).
+        :type file_format: Literal["parquet", "feather"]
+        :param row_group_rows: Number of records per row group.
+        :type row_group_rows: int
+        :param compression: Compression codec, e.g. ``zstd`` or ``lz4``.
+        :type compression: str
+        :raises ValueError: If the file format is unknown or row_group_rows is not positive.
+        """
+        if file_format not in ("parquet", "feather"):
+            raise ValueError(f"Unknown file format: {file_format}")
+        if row_group_rows < 1:
+            raise ValueError("row_group_rows must be at least 1.")
+
+        self._pa, pq = import_pyarrow()
+        self._plantsim = plantsim
+        self._objects = objects
+        self._target = target
+        self._row_group_rows = row_group_rows
+
+        self._schema = self._pa.schema(
+            [
+                ("time", self._pa.float64()),
+                ("object", self._pa.string()),
+                ("event", self._pa.string()),
+                ("contents", self._pa.int32()),
+            ]
+        )
+        self._writer: Any
+        if file_format == "parquet":
+            self._writer = pq.ParquetWriter(target, self._schema, compression=compression)
+        else:
+            options = self._pa.ipc.IpcWriteOptions(compression=compression)
+            self._writer = self._pa.ipc.new_file(target, self._schema, options=options)
+
+        self._lock = threading.Lock()
+        self._columns: tuple[list[Any], ...] = ([], [], [], [])
+        self._records = 0
+        self._row_groups = 0
+        self._closed = False
+
+    def _put_payload(self, payload: str) -> None:
+        """
+        Add the records of a payload fired by the model and write full row groups.
+
+        :param payload: Records separated by :data:`ROW_SEPARATOR`.
+        :type payload: str
+        """
+        if not payload:
+            return
+        times, objects, events, contents = self._columns
+
+        with self._lock:
+            if self._closed:
+                return
+            for record in payload.split(ROW_SEPARATOR):
+                time, obj, event, count = record.split(CELL_SEPARATOR)
+                times.append(float(time))
+                objects.append(obj)
+                events.append(event)
+                contents.append(int(count))
+            self._records += payload.count(ROW_SEPARATOR) + 1
+
+            while len(times) >= self._row_group_rows:
+                self._write_row_group(self._row_group_rows)
+
+    def _write_row_group(self, rows: int) -> None:
+        """
+        Write the first rows of the collected records as one row group and remove them.
+
+        :param rows: Number of records to write.
+        :type rows: int
+        """
+        arrays = [
+            self._pa.array(column[:rows], type=field.type)
+            for column, field in zip(self._columns, self._schema)
+        ]
+        for column in self._columns:
+            del column[:rows]
+
+        self._writer.write_batch(self._pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+        self._row_groups += 1
+
+    def _take_model_buffer(self, stop: bool) -> None:
+        """
+        Take the records still buffered in the model.
+
+        :param stop: Stop observing the traced objects.
+        :type stop: bool
+        """
+        simtalk = self._plantsim._load_simtalk_script("flush_trace")
+        payload = self._plantsim.execute_sim_talk(simtalk, ROW_SEPARATOR.join(self._objects), stop)
+        self._put_payload(str(payload or ""))
+
+    def flush(self) -> None:
+        """
+        Take the records still buffered in the model, e.g. after a run. They are written with
+        the next full row group or on close.
+        """
+        self._take_model_buffer(stop=False)
+
+    def close(self) -> None:
+        """
+        Stop tracing, write the remaining records and finish the file.
+        """
+        if self._closed:
+            return
+        try:
+            if self._plantsim.model_loaded:
+                self._take_model_buffer(stop=True)
+        finally:
+            # The file is finished even if the model could not be asked for its records
+            with self._lock:
+                try:
+                    if self._columns[0]:
+                        self._write_row_group(len(self._columns[0]))
+                finally:
+                    self._writer.close()
+                    self._closed = True
+            self._plantsim._close_trace(self)
+
+    def __enter__(self) -> "TraceCapture":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def target(self) -> str | os.PathLike[str]:
+        """
+        Path of the trace file.
+
+        :return: Path of the file.
+        :rtype: str | os.PathLike[str]
+        """
+        return self._target
+
+    @property
+    def records(self) -> int:
+        """
+        Number of captured records.
+
+        :return: Number of records.
+        :rtype: int
+        """
+        return self._records
+
+    @property
+    def row_groups(self) -> int:
+        """
+        Number of written row groups.
+
+        :return: Number of row groups.
+        :rtype: int
+        """
+        return self._row_groups
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the capture was closed.
+
+        :return: True if closed.
+        :rtype: bool
+        """
+        return self._closed
+
+    def __repr__(self) -> str:
+        """
+        Return the string representation of the capture.
+
+        :return: String representation.
+        :rtype: str
+        """
+        return (
+            f"{self.__class__.__name__}("
+            f"target={str(self._target)!r}, "
+            f"objects={len(self._objects)}, "
+            f"records={self._records}, "
+            f"row_groups={self._row_groups})"
+        )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+from typing import Iterator
+
+from plantsimpath import PlantsimPath
+import pytest
+
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeBackend
+from pyplantsim.backends import FakeModel
+
+
+NETWORK = PlantsimPath(".Models.Model")
+
+
+@pytest.fixture
+def make_plantsim(tmp_path: Path) -> Iterator[Callable[[FakeModel], Plantsim]]:
+    model_file = tmp_path / "test.spp"
+    model_file.touch()
+    instances: list[Plantsim] = []
+
+    def factory(model: FakeModel) -> Plantsim:
+        instance = Plantsim(
+            backend=FakeBackend(model_factory=lambda _: model), event_polling_interval=0.001
+        )
+        instance.load_model(str(model_file))
+        instance.set_network(NETWORK, set_event_controller=True)
+        instances.append(instance)
+        return instance
+
+    yield factory
+
+    for instance in instances:
+        instance.stop()
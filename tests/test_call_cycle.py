@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from typing import Literal
+
+import pytest
+
+from pyplantsim.call_cycle import CallCycle
+from pyplantsim.call_cycle import CallCycleMethod
+from pyplantsim.call_cycle import CallCycleTable
+from pyplantsim.call_cycle import CallerEntry
+from pyplantsim.call_cycle import HotSpotKey
+
+
+pd = pytest.importorskip("pandas")
+
+# The EventController, which is not profiled, calls Init, which calls Log
+CALL_CYCLES = [
+    CallCycle(
+        CallCycleMethod(".Models.Model.Init", 2, 0, 0.5, 1.0),
+        [CallerEntry(".Models.Model.EventController", 2, 0.5, 1.0)],
+    ),
+    CallCycle(
+        CallCycleMethod(".Models.Model.Log", 4, 0, 1.0, 0.0),
+        [CallerEntry(".Models.Model.Init", 4, 1.0, 0.0)],
+    ),
+]
+
+
+def to_json(call_cycles: list[CallCycle]) -> str:
+    return json.dumps(
+        {
+            "CallCycles": [
+                {
+                    "Method": {
+                        "Method": cc.method.method,
+                        "Called": cc.method.called,
+                        "Self": cc.method.self_,
+                        "SelfTime": cc.method.self_time,
+                        "CalleesTime": cc.method.callees_time,
+                    },
+                    "Callers": [
+                        {
+                            "Caller": c.caller,
+                            "Called": c.called,
+                            "SelfTime": c.self_time,
+                            "CalleesTime": c.callees_time,
+                        }
+                        for c in cc.callers
+                    ],
+                }
+                for cc in call_cycles
+            ]
+        }
+    )
+
+
+def test_from_json_matches_from_call_cycles() -> None:
+    expected = CallCycleTable.from_call_cycles(CALL_CYCLES)
+    table = CallCycleTable.from_json(to_json(CALL_CYCLES))
+
+    pd.testing.assert_frame_equal(table.methods, expected.methods)
+    pd.testing.assert_frame_equal(table.callers, expected.callers)
+    assert list(table.methods.columns) == CallCycleTable.METHOD_COLUMNS
+    assert list(table.callers.columns) == CallCycleTable.CALLER_COLUMNS
+
+
+def test_from_json_without_call_cycles() -> None:
+    table = CallCycleTable.from_json("{}")
+
+    assert len(table) == 0
+
+
+@pytest.mark.parametrize(
+    ("by", "methods"),
+    [
+        ("self_time", [".Models.Model.Log", ".Models.Model.Init"]),
+        ("total_time", [".Models.Model.Init", ".Models.Model.Log"]),
+        ("called", [".Models.Model.Log", ".Models.Model.Init"]),
+    ],
+)
+def test_hot_spots(by: HotSpotKey, methods: list[str]) -> None:
+    ranked = CallCycleTable.from_call_cycles(CALL_CYCLES).hot_spots(by, n=None)
+
+    assert list(ranked["method"]) == methods
+    assert ranked["share"].sum() == pytest.approx(1.0)
+
+
+def test_hot_spots_rejects_unknown_ranking() -> None:
+    with pytest.raises(ValueError):
+        CallCycleTable.from_call_cycles(CALL_CYCLES).hot_spots("calls")  # type: ignore[arg-type]
+
+
+def test_callers_of() -> None:
+    callers = CallCycleTable.from_call_cycles(CALL_CYCLES).callers_of(".Models.Model.Log")
+
+    assert list(callers["caller"]) == [".Models.Model.Init"]
+    assert list(callers["called"]) == [4]
+
+
+@pytest.mark.parametrize(("how", "factor"), [("sum", 1.0), ("mean", 0.5)])
+def test_aggregate_counts_missing_methods_as_zero(
+    how: Literal["sum", "mean"], factor: float
+) -> None:
+    tables = [
+        CallCycleTable.from_call_cycles(CALL_CYCLES),
+        CallCycleTable.from_call_cycles(CALL_CYCLES[1:]),
+    ]
+
+    aggregated = CallCycleTable.aggregate(tables, how=how)
+    methods = aggregated.methods.set_index(aggregated.methods["method"].astype(str))
+
+    assert aggregated.runs == 2
+    assert methods.loc[".Models.Model.Init", "called"] == pytest.approx(2 * factor)
+    assert methods.loc[".Models.Model.Log", "self_time"] == pytest.approx(2.0 * factor)
+    assert len(aggregated.callers) == 2
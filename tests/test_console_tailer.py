@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+from pyplantsim import ConsoleRecord
+from pyplantsim import ConsoleTailer
+
+
+LINES = [
+    "2024-05-03 10:15:00 ERROR .Models.Model.Station: Failure",
+    "2024-05-03 10:15:01 Warning: .Models.Model.Buffer: Buffer full",
+    "plain text",
+]
+
+
+def append(path: Path, text: str) -> None:
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def test_parse_splits_the_line() -> None:
+    record = ConsoleRecord.parse(LINES[0])
+
+    assert record.timestamp == datetime(2024, 5, 3, 10, 15)
+    assert record.level == "ERROR"
+    assert record.source == ".Models.Model.Station"
+    assert record.message == "Failure"
+
+
+def test_parse_keeps_unmatched_line() -> None:
+    assert ConsoleRecord.parse(LINES[2]) == ConsoleRecord(line="plain text", message="plain text")
+
+
+def test_poll_waits_for_the_end_of_a_line(tmp_path: Path) -> None:
+    log = tmp_path / "console.log"
+    tailer = ConsoleTailer(log)
+
+    assert tailer.poll() == 0
+    append(log, LINES[0] + "\r\n" + LINES[2][:5])
+    assert tailer.poll() == 1
+    append(log, LINES[2][5:] + "\n")
+    assert tailer.poll() == 1
+
+    assert [record.line for record in tailer.drain()] == [LINES[0], LINES[2]]
+    assert tailer.offset == log.stat().st_size
+
+
+def test_truncated_file_is_read_again(tmp_path: Path) -> None:
+    log = tmp_path / "console.log"
+    append(log, "\n".join(LINES) + "\n")
+    tailer = ConsoleTailer(log)
+    tailer.poll()
+
+    log.write_text(LINES[2] + "\n", encoding="utf-8")
+
+    assert tailer.poll() == 1
+    assert [record.line for record in tailer.drain()] == LINES + [LINES[2]]
+
+
+def test_filters(tmp_path: Path) -> None:
+    log = tmp_path / "console.log"
+    append(log, "\n".join(LINES) + "\n")
+    tailers = {
+        "levels": ConsoleTailer(log, levels=["warning"]),
+        "match": ConsoleTailer(log, match="^Fail"),
+        "predicate": ConsoleTailer(log, predicate=lambda record: record.source is None),
+    }
+
+    passed = {}
+    for name, tailer in tailers.items():
+        tailer.poll()
+        passed[name] = [record.line for record in tailer.drain()]
+
+    assert passed == {"levels": [LINES[1]], "match": [LINES[0]], "predicate": [LINES[2]]}
+    assert all(tailer.lines == 3 for tailer in tailers.values())
+
+
+def test_close_reads_the_unterminated_last_line(tmp_path: Path) -> None:
+    log = tmp_path / "console.log"
+    append(log, LINES[0] + "\n")
+    received: list[ConsoleRecord] = []
+
+    with ConsoleTailer(log, callback=received.append, from_start=False, poll_interval=0.01):
+        append(log, LINES[1] + "\n" + LINES[2])
+
+    assert [record.line for record in received] == LINES[1:]
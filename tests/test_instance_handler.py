@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeBackend
+from pyplantsim.backends import FakeModel
+from pyplantsim.instance_handler import FixedInstanceHandler
+from pyplantsim.instance_handler import SimulationJob
+
+
+def fail() -> None:
+    raise RuntimeError("failed")
+
+
+def shutdown_in_time(handler: FixedInstanceHandler, timeout: float = 10.0) -> bool:
+    """
+    Shut the handler down in a helper thread, so a hanging shutdown fails the test.
+    """
+    thread = threading.Thread(target=handler.shutdown, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+@pytest.mark.parametrize(
+    "failing",
+    [
+        {"prepare": fail},
+        {"worker_init": lambda instance: fail()},
+    ],
+    ids=["prepare", "worker_init"],
+)
+def test_failed_initialization_finishes_jobs_as_failed(failing: dict[str, Any]) -> None:
+    ran: list[Plantsim] = []
+    backend = FakeBackend(model_factory=lambda _: FakeModel(simulation_duration=0.0))
+    handler = FixedInstanceHandler(
+        2, backend=backend, event_polling_interval=0.001, **failing
+    ).initialize()
+
+    for _ in range(3):
+        handler.queue_job(SimulationJob(on_init=ran.append))
+
+    assert shutdown_in_time(handler)
+    assert ran == []
+    assert handler.metrics_snapshot().jobs_failed == 3
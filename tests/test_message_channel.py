@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable
+
+import pytest
+
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeModel
+from pyplantsim.message_channel import OverflowPolicy
+
+
+def send(plantsim: Plantsim, messages: list[str]) -> None:
+    for msg in messages:
+        plantsim._instance.send_channel_message(msg)
+
+
+@pytest.mark.parametrize(
+    "policy,kept",
+    [("drop_oldest", ["3", "4", "5", "6", "7"]), ("drop_newest", ["0", "1", "2", "3", "4"])],
+)
+def test_drop_policies(
+    make_plantsim: Callable[[FakeModel], Plantsim], policy: OverflowPolicy, kept: list[str]
+) -> None:
+    plantsim = make_plantsim(FakeModel())
+    channel = plantsim.open_message_channel(batch_size=1, capacity=5, policy=policy)
+
+    send(plantsim, [str(i) for i in range(8)])
+
+    assert channel.drain() == kept
+    assert (channel.received, channel.dropped) == (8, 3)
+
+
+def test_block_does_not_wait_on_the_opening_thread(
+    make_plantsim: Callable[[FakeModel], Plantsim],
+) -> None:
+    plantsim = make_plantsim(FakeModel())
+    channel = plantsim.open_message_channel(batch_size=1, capacity=5, policy="block")
+
+    send(plantsim, [str(i) for i in range(8)])
+
+    assert channel.drain() == ["0", "1", "2", "3", "4"]
+    assert channel.dropped == 3
+
+
+def test_block_waits_for_a_consumer_thread(
+    make_plantsim: Callable[[FakeModel], Plantsim],
+) -> None:
+    plantsim = make_plantsim(FakeModel())
+    channel = plantsim.open_message_channel(batch_size=2, capacity=3, policy="block")
+    messages = [str(i) for i in range(200)]
+    received: list[str] = []
+
+    consumer = threading.Thread(target=lambda: received.extend(channel))
+    consumer.start()
+    producer = threading.Thread(target=send, args=(plantsim, messages))
+    producer.start()
+    producer.join(10)
+    channel.close()
+    consumer.join(10)
+
+    assert not producer.is_alive() and not consumer.is_alive()
+    assert received == messages
+    assert channel.dropped == 0
+
+
+def test_close_with_a_full_blocking_channel_does_not_hang(
+    make_plantsim: Callable[[FakeModel], Plantsim],
+) -> None:
+    plantsim = make_plantsim(FakeModel())
+    channel = plantsim.open_message_channel(batch_size=4, capacity=4, policy="block")
+    # The last two messages stay in the model until the channel is flushed
+    send(plantsim, [str(i) for i in range(6)])
+
+    channel.close()
+
+    assert channel.closed
+    assert channel.drain() == ["0", "1", "2", "3"]
+    assert (channel.received, channel.dropped) == (6, 2)
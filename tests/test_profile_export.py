@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import pstats
+
+import pytest
+
+from pyplantsim import write_collapsed
+from pyplantsim import write_pstats
+from pyplantsim import write_speedscope
+from pyplantsim.call_cycle import CallCycleTable
+
+from .test_call_cycle import CALL_CYCLES
+
+
+def test_pstats_round_trip(tmp_path: Path) -> None:
+    target = tmp_path / "profile.prof"
+
+    write_pstats(CALL_CYCLES, target)
+    stats = pstats.Stats(str(target))
+
+    assert stats.total_tt == pytest.approx(1.5)  # type: ignore[attr-defined]
+    entries = stats.stats  # type: ignore[attr-defined]
+    init = (".Models.Model.Init", 0, "Init")
+    log = (".Models.Model.Log", 0, "Log")
+    assert entries[init][:4] == (2, 2, 0.5, 1.5)
+    assert entries[log][:4] == (4, 4, 1.0, 1.0)
+    assert init in entries[log][4]
+
+
+def test_collapsed_round_trip(tmp_path: Path) -> None:
+    target = tmp_path / "profile.folded"
+
+    write_collapsed(CALL_CYCLES, target)
+    lines = dict(line.rsplit(" ", 1) for line in target.read_text().splitlines())
+
+    assert lines == {
+        ".Models.Model.EventController;.Models.Model.Init": "500000",
+        ".Models.Model.EventController;.Models.Model.Init;.Models.Model.Log": "1000000",
+    }
+
+
+def test_speedscope_round_trip(tmp_path: Path) -> None:
+    target = tmp_path / "profile.speedscope.json"
+
+    write_speedscope(CALL_CYCLES, target, name="run")
+    document = json.loads(target.read_text())
+
+    frames = [frame["name"] for frame in document["shared"]["frames"]]
+    profile = document["profiles"][0]
+    stacks = {
+        tuple(frames[i] for i in sample): weight
+        for sample, weight in zip(profile["samples"], profile["weights"])
+    }
+    assert profile["name"] == "run"
+    assert profile["endValue"] == pytest.approx(1.5)
+    assert stacks == {
+        (".Models.Model.EventController", ".Models.Model.Init"): pytest.approx(0.5),
+        (
+            ".Models.Model.EventController",
+            ".Models.Model.Init",
+            ".Models.Model.Log",
+        ): pytest.approx(1.0),
+    }
+
+
+def test_call_cycle_table_round_trip() -> None:
+    table = CallCycleTable.from_call_cycles(CALL_CYCLES)
+
+    assert table.to_call_cycles() == CALL_CYCLES
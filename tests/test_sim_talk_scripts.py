@@ -0,0 +1,144 @@
+"""
+Structural checks of the bundled SimTalk scripts.
+
+The fake backend matches scripts by their source text and never interprets them, so these
+checks are the only guard against scripts that Plant Simulation would fail to compile. Methods
+embedded as string literals, e.g. the installed error handler, are checked the same way.
+"""
+
+from __future__ import annotations
+
+import importlib.resources
+import re
+
+import pytest
+
+
+SCRIPTS = sorted(
+    entry.name
+    for entry in importlib.resources.files("pyplantsim.sim_talk_scripts").iterdir()
+    if entry.name.endswith(".st")
+)
+
+TYPES = {
+    "any",
+    "boolean",
+    "date",
+    "datetime",
+    "integer",
+    "json",
+    "length",
+    "object",
+    "real",
+    "string",
+    "table",
+    "time",
+}
+
+DECLARATION = re.compile(r"\b(?:var|param|byref)\s+(\w+)\s*:\s*(\w+)(\S*)")
+
+# Block keywords: opened by, closed by
+BLOCKS = {"if": "end", "while": "end", "switch": "end", "for": "next", "repeat": "until"}
+# Keywords continuing a block: allowed inside
+CONTINUATIONS = {"elseif": {"if"}, "else": {"if", "switch"}, "case": {"switch"}}
+
+
+def read_script(name: str) -> str:
+    return (importlib.resources.files("pyplantsim.sim_talk_scripts") / name).read_text(
+        encoding="utf-8"
+    )
+
+
+def split_source(source: str) -> tuple[str, list[str]]:
+    """
+    Separate the code from its comments and string literals.
+
+    :return: The code with every string literal replaced by ``""`` and without comments, and
+        the unescaped string literals.
+    """
+    code: list[str] = []
+    strings: list[str] = []
+    i = 0
+    while i < len(source):
+        if source.startswith("//", i):
+            end = source.find("\n", i)
+            i = len(source) if end < 0 else end
+        elif source[i] == '"':
+            literal: list[str] = []
+            i += 1
+            while i < len(source) and source[i] != '"':
+                if source[i] == "\\" and i + 1 < len(source):
+                    i += 1
+                literal.append(source[i])
+                i += 1
+            assert i < len(source), "Unterminated string literal"
+            strings.append("".join(literal))
+            code.append('""')
+            i += 1
+        else:
+            code.append(source[i])
+            i += 1
+    return "".join(code), strings
+
+
+def check_program(source: str) -> None:
+    """
+    Check the declarations, brackets and blocks of a SimTalk method.
+    """
+    code, strings = split_source(source)
+
+    for name, data_type, suffix in DECLARATION.findall(code):
+        assert data_type in TYPES, f"{name}: unknown data type {data_type!r}"
+        assert suffix in ("", "[]", ",", ")"), f"{name}: invalid declaration {data_type}{suffix}"
+
+    for opening, closing in ("()", "[]"):
+        assert code.count(opening) == code.count(closing), f"Unbalanced {opening}{closing}"
+
+    lines = [line.strip() for line in code.splitlines() if line.strip()]
+    for i, line in enumerate(lines):
+        if line.startswith(("param", "->")):
+            assert i == 0, "The signature must be the first line"
+
+    stack: list[tuple[str, int]] = []
+    for number, line in enumerate(code.splitlines(), 1):
+        keyword = line.split(maxsplit=1)[0] if line.strip() else ""
+        if keyword in BLOCKS:
+            stack.append((keyword, number))
+        elif keyword in CONTINUATIONS:
+            assert stack and stack[-1][0] in CONTINUATIONS[keyword], f"Stray {keyword} in {number}"
+        elif keyword in ("end", "next", "until"):
+            assert stack, f"{keyword} in line {number} closes no block"
+            block, opened = stack.pop()
+            assert BLOCKS[block] == keyword, f"{block} of line {opened} closed by {keyword}"
+    assert not stack, f"Unclosed blocks: {stack}"
+
+    for literal in strings:
+        if "\n" in literal:
+            check_program(literal)
+
+
+@pytest.mark.parametrize("name", SCRIPTS)
+def test_script_structure(name: str) -> None:
+    check_program(read_script(name))
+
+
+@pytest.mark.parametrize("name", SCRIPTS)
+def test_script_returns_its_result(name: str) -> None:
+    code, _ = split_source(read_script(name))
+    if re.search(r"^\s*(?:param\b.*)?->", code, re.MULTILINE):
+        assert re.search(r"^\s*return\b", code, re.MULTILINE), "No return statement"
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "var x: list[integer]",
+        "if a\n\tb := 1\n",
+        "for var i := 1 to 2\n\tb := 1\nend",
+        'var s: string := "a\\"b',
+        "x := max(1, 2",
+    ],
+)
+def test_invalid_scripts_are_detected(source: str) -> None:
+    with pytest.raises(AssertionError):
+        check_program(source)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Any
+from typing import Callable
+
+from plantsimpath import PlantsimPath
+import pytest
+
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeModel
+
+
+BUFFER = PlantsimPath(".Models.Model.Buffer", "NumMU")
+STATION = PlantsimPath(".Models.Model.Station", "NumMU")
+
+
+@pytest.fixture
+def plantsim(make_plantsim: Callable[[FakeModel], Plantsim]) -> Plantsim:
+    return make_plantsim(FakeModel(values={str(BUFFER): 0, str(STATION): 0}))
+
+
+def observed_calls(plantsim: Plantsim, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """
+    Record the attributes passed to every install_observers.st call.
+    """
+    source = plantsim._load_simtalk_script("install_observers")
+    execute = plantsim.execute_sim_talk
+    calls: list[str] = []
+
+    def recording(code: str, *parameters: Any) -> Any:
+        if code == source:
+            calls.append(parameters[0])
+        return execute(code, *parameters)
+
+    monkeypatch.setattr(plantsim, "execute_sim_talk", recording)
+    return calls
+
+
+def test_subscribe_observes_every_attribute_once(
+    plantsim: Plantsim, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = observed_calls(plantsim, monkeypatch)
+    first: list[dict[str, Any]] = []
+    second: list[dict[str, Any]] = []
+
+    plantsim.subscribe([BUFFER], first.append)
+    plantsim.subscribe([BUFFER, STATION], second.append)
+    plantsim.subscribe([STATION], second.append)
+    plantsim.set_value(BUFFER, 1)
+
+    assert len(calls) == 2
+    assert first == [{str(BUFFER): 1}]
+    assert second == [{str(BUFFER): 1}]
+
+
+def test_unsubscribe_keeps_shared_attributes_observed(plantsim: Plantsim) -> None:
+    received: list[dict[str, Any]] = []
+    first = plantsim.subscribe([BUFFER], received.append)
+    plantsim.subscribe([BUFFER], received.append)
+
+    first.close()
+    plantsim.set_value(BUFFER, 1)
+
+    assert received == [{str(BUFFER): 1}]
+
+
+def test_close_model_closes_subscriptions(plantsim: Plantsim) -> None:
+    received: list[dict[str, Any]] = []
+    subscription = plantsim.subscribe([BUFFER], received.append, min_interval=60)
+    plantsim.set_value(BUFFER, 1)
+    plantsim.set_value(BUFFER, 2)
+
+    plantsim.close_model()
+
+    assert subscription.closed
+    assert subscription._timer is None
+    assert received == [{str(BUFFER): 1}, {str(BUFFER): 2}]
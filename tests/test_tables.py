@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+import pandas as pd
+from plantsimpath import PlantsimPath
+import pytest
+
+from pyplantsim import Plantsim
+from pyplantsim.backends import FakeModel
+from pyplantsim.backends import FakeTable
+
+
+TABLE = PlantsimPath(".Models.Model.Table")
+
+# Cell values of a column per Plant Simulation data type, times in seconds
+VALUES: dict[str, list[Any]] = {
+    "integer": [3, 1, 2],
+    "real": [1.5, 0.25, 2.0],
+    "length": [1.5, 0.25, 2.0],
+    "weight": [1.5, 0.25, 2.0],
+    "speed": [1.5, 0.25, 2.0],
+    "acceleration": [1.5, 0.25, 2.0],
+    "time": [60.0, 1.5, 3600.0],
+    "boolean": [True, False, True],
+    "string": ["b", "a", "c"],
+}
+# A where clause matching all rows per data type
+MATCH_ALL: dict[str, tuple[str, Any]] = {
+    "integer": (">=", 1),
+    "real": (">=", 0.25),
+    "length": (">=", 0.25),
+    "weight": (">=", 0.25),
+    "speed": (">=", 0.25),
+    "acceleration": (">=", 0.25),
+    "time": (">=", 1.5),
+    "boolean": ("!=", "none"),
+    "string": ("!=", "none"),
+}
+# Dtype of typed reads per data type, strings depend on the pandas version
+DTYPES = {
+    "integer": "int64",
+    "real": "float64",
+    "length": "float64",
+    "weight": "float64",
+    "speed": "float64",
+    "acceleration": "float64",
+    "time": "timedelta64[ns]",
+    "boolean": "bool",
+}
+
+
+def make_table(data_type: str, index: list[Any] | None = None) -> FakeTable:
+    values = VALUES[data_type]
+    return FakeTable(
+        [[i, value] for i, value in enumerate(values, 1)],
+        columns=["id", "value"],
+        index=index,
+        index_name="key" if index is not None else None,
+        data_types=["integer", data_type],
+    )
+
+
+@pytest.mark.parametrize("data_type", list(VALUES))
+def test_typed_read_uses_the_data_types(
+    make_plantsim: Callable[[FakeModel], Plantsim], data_type: str
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(data_type)}))
+
+    df = plantsim.get_table(TABLE, typed=True)
+
+    assert plantsim.get_table_column_data_types(TABLE) == ["integer", data_type]
+    assert str(df["id"].dtype) == "int64"
+    if data_type == "string":
+        assert pd.api.types.is_string_dtype(df["value"])
+    else:
+        assert str(df["value"].dtype) == DTYPES[data_type]
+    expected = VALUES[data_type]
+    if data_type == "time":
+        expected = [pd.Timedelta(seconds=seconds) for seconds in expected]
+    assert df["value"].tolist() == expected
+
+
+def test_typed_read_repeats_strings_as_categories(
+    make_plantsim: Callable[[FakeModel], Plantsim],
+) -> None:
+    table = FakeTable([["a"], ["b"], ["a"], ["a"]], columns=["value"], data_types=["string"])
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): table}))
+
+    df = plantsim.get_table(TABLE, typed=True)
+
+    assert str(df["value"].dtype) == "category"
+    assert df["value"].tolist() == ["a", "b", "a", "a"]
+
+
+@pytest.mark.parametrize("data_type", list(VALUES))
+def test_iter_table_matches_get_table(
+    make_plantsim: Callable[[FakeModel], Plantsim], data_type: str
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(data_type)}))
+
+    chunks = list(plantsim.iter_table(TABLE, chunk_rows=2, typed=True))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks).reset_index(drop=True),
+        plantsim.get_table(TABLE, typed=True),
+        check_categorical=False,
+    )
+
+
+@pytest.mark.parametrize("index", [[10, 20, 30], [0.5, 1.5, 2.5], ["x", "y", "z"]])
+def test_row_index_keeps_its_data_type(
+    make_plantsim: Callable[[FakeModel], Plantsim], index: list[Any]
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table("string", index)}))
+
+    df = pd.concat(plantsim.iter_table(TABLE, chunk_rows=2))
+
+    assert df.index.tolist() == plantsim.get_table(TABLE).index.tolist() == index
+    assert df.index.name == "key"
+
+
+def test_iter_table_validates_on_call(
+    make_plantsim: Callable[[FakeModel], Plantsim], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table("string")}))
+
+    def missing_pyarrow() -> None:
+        raise ImportError("pyarrow")
+
+    monkeypatch.setattr("pyplantsim.plantsim.import_pyarrow", missing_pyarrow)
+
+    with pytest.raises(ValueError):
+        plantsim.iter_table(TABLE, chunk_rows=0)
+    with pytest.raises(ImportError):
+        plantsim.iter_table(TABLE, batch_format="arrow")
+
+
+@pytest.mark.parametrize("data_type", list(VALUES))
+def test_selection_matches_get_table(
+    make_plantsim: Callable[[FakeModel], Plantsim], data_type: str
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(data_type)}))
+    expected = plantsim.get_table(TABLE, typed=True)
+    op, value = MATCH_ALL[data_type]
+
+    selections = {
+        "columns": plantsim.get_table(TABLE, typed=True, columns=["id", "value"]),
+        "where": plantsim.get_table(TABLE, typed=True, where=("value", op, value)),
+    }
+
+    for name, df in selections.items():
+        pd.testing.assert_frame_equal(
+            df.reset_index(drop=True), expected, check_categorical=False, obj=name
+        )
+
+
+@pytest.mark.parametrize("index", [[10, 20, 30], ["x", "y", "z"]])
+def test_selection_keeps_the_row_index(
+    make_plantsim: Callable[[FakeModel], Plantsim], index: list[Any]
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table("string", index)}))
+
+    df = plantsim.get_table(TABLE, columns=["value"], where=("value", "!=", "a"))
+
+    assert df.index.tolist() == [index[0], index[2]]
+    assert df.index.name == "key"
+
+
+def test_columns_keep_the_requested_order(
+    make_plantsim: Callable[[FakeModel], Plantsim],
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table("string")}))
+
+    df = plantsim.get_table(TABLE, columns=["value", "id", "value", 1])
+
+    assert df.columns.tolist() == ["value", "id"]
+    assert df["value"].tolist() == VALUES["string"]
+    assert df["id"].tolist() == [1, 2, 3]
+
+
+@pytest.mark.parametrize("data_type", ["integer", "real", "length", "time"])
+def test_where_compares_numbers(
+    make_plantsim: Callable[[FakeModel], Plantsim], data_type: str
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(data_type)}))
+    # 10 sorts before 2 as a string
+    threshold = 10 if data_type == "integer" else 10.0
+
+    df = plantsim.get_table(TABLE, where=("value", "<", threshold))
+
+    assert df["value"].tolist() == [v for v in VALUES[data_type] if v < threshold]
+
+
+def test_aggregate_table_groups_in_order_of_appearance(
+    make_plantsim: Callable[[FakeModel], Plantsim],
+) -> None:
+    table = FakeTable(
+        [["b", 1.0], ["a", 2.0], ["b", 3.0], ["c", 4.0]],
+        columns=["group", "value"],
+        data_types=["string", "length"],
+    )
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): table}))
+
+    df = plantsim.aggregate_table(TABLE, {"value": ["count", "sum", "max"]}, group_by="group")
+
+    assert df.index.tolist() == ["b", "a", "c"]
+    assert df[("value", "count")].tolist() == [2, 1, 1]
+    assert df[("value", "sum")].tolist() == [4.0, 2.0, 4.0]
+    assert df[("value", "max")].tolist() == [3.0, 2.0, 4.0]
+
+
+def test_aggregate_table_rejects_non_numeric_columns(
+    make_plantsim: Callable[[FakeModel], Plantsim],
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table("string")}))
+
+    with pytest.raises(ValueError, match="'value'"):
+        plantsim.aggregate_table(TABLE, {"value": "sum"})
+
+
+def test_tail_reads_only_appended_rows(
+    make_plantsim: Callable[[FakeModel], Plantsim], tmp_path: Path
+) -> None:
+    table = make_table("integer")
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): table}))
+    batches: list[pd.DataFrame] = []
+    target = tmp_path / "tail.csv"
+
+    with plantsim.tail_table(TABLE, callback=batches.append, target=target) as tail:
+        tail.poll()
+        assert tail.poll() is None
+        plantsim.set_value(PlantsimPath(TABLE, "[1,4]"), 4)
+        plantsim.set_value(PlantsimPath(TABLE, "[2,4]"), 5)
+        tail.poll()
+
+    assert [batch["id"].tolist() for batch in batches] == [[1, 2, 3], [4]]
+    assert pd.read_csv(target)["value"].tolist() == [3, 1, 2, 5]
+
+
+def test_tail_rereads_a_shortened_table(make_plantsim: Callable[[FakeModel], Plantsim]) -> None:
+    table = make_table("integer")
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): table}))
+    tail = plantsim.tail_table(TABLE)
+    tail.poll()
+
+    del table.rows[1:]
+    del table.index[1:]
+    df = tail.poll()
+
+    assert df is not None and df["id"].tolist() == [1]
+
+
+@pytest.mark.parametrize("data_type", ["integer", "real", "length", "weight", "time"])
+def test_diff_write_keeps_numbers(
+    make_plantsim: Callable[[FakeModel], Plantsim], data_type: str
+) -> None:
+    table = make_table(data_type)
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): table}))
+    df = plantsim.get_table(TABLE)
+    plantsim.set_table(TABLE, df, diff=True)
+
+    changed = df.copy()
+    changed.iloc[0, 1] = 7
+    plantsim.set_table(TABLE, changed, diff=True)
+
+    assert table.rows[0][1] == 7
+    assert isinstance(table.rows[0][1], int if data_type == "integer" else float)
+    assert plantsim.get_table(TABLE).equals(changed)
+
+
+@pytest.mark.parametrize("data_type", ["integer", "real", "length", "speed"])
+@pytest.mark.parametrize("index", [None, [10, 20, 30]])
+def test_fixed_width_matches_default(
+    make_plantsim: Callable[[FakeModel], Plantsim], data_type: str, index: list[Any] | None
+) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(data_type, index)}))
+
+    expected = plantsim.get_table(TABLE, typed=True)
+    df = plantsim.get_table(TABLE, typed=True, fixed_width=True)
+
+    pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+    if index is not None:
+        assert df.index.tolist() == index
+
+
+@pytest.mark.parametrize("data_type", list(VALUES))
+def test_get_tables_matches_get_table(
+    make_plantsim: Callable[[FakeModel], Plantsim], data_type: str
+) -> None:
+    other = PlantsimPath(".Models.Model.Other")
+    tables = {
+        str(TABLE): make_table(data_type),
+        str(other): make_table("integer", index=["x", "y", "z"]),
+    }
+    plantsim = make_plantsim(FakeModel(tables=tables))
+
+    frames = plantsim.get_tables([TABLE, other], typed=True)
+
+    assert list(frames) == [str(TABLE), str(other)]
+    for path in (TABLE, other):
+        pd.testing.assert_frame_equal(
+            frames[str(path)],
+            plantsim.get_table(path, typed=True),
+            check_categorical=False,
+            obj=str(path),
+        )
+
+
+@pytest.mark.parametrize("data_type", ["integer", "real", "length", "boolean", "string"])
+def test_arrow_matches_get_table(
+    make_plantsim: Callable[[FakeModel], Plantsim], data_type: str
+) -> None:
+    pa = pytest.importorskip("pyarrow")
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(data_type)}))
+
+    table = plantsim.get_table_arrow(TABLE)
+    batches = list(plantsim.iter_table(TABLE, chunk_rows=2, batch_format="arrow"))
+
+    assert table.column_names == ["id", "value"]
+    assert table.column("value").to_pylist() == VALUES[data_type]
+    assert pa.Table.from_batches(batches).equals(table)
+
+
+def test_arrow_index_has_the_index_data_type(
+    make_plantsim: Callable[[FakeModel], Plantsim],
+) -> None:
+    pytest.importorskip("pyarrow")
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table("real", [10, 20, 30])}))
+
+    table = plantsim.get_table_arrow(TABLE)
+
+    assert str(table.schema.field("key").type) == "int64"
+    assert table.column("key").to_pylist() == [10, 20, 30]
+
+
+@pytest.mark.parametrize("data_type", list(VALUES))
+def test_table_view_matches_get_table(
+    make_plantsim: Callable[[FakeModel], Plantsim], data_type: str
+) -> None:
+    index = ["x", "y", "z"]
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table(data_type, index)}))
+    expected = plantsim.get_table(TABLE, typed=True)
+
+    view = plantsim.table_view(TABLE, page_rows=2, typed=True)
+
+    assert view.shape == (3, 2)
+    pd.testing.assert_frame_equal(view[0:3], expected, check_categorical=False)
+    pd.testing.assert_frame_equal(view[::-1], expected[::-1], check_categorical=False)
+    assert view[-1].name == "z"
+
+
+def test_table_view_caches_pages(make_plantsim: Callable[[FakeModel], Plantsim]) -> None:
+    plantsim = make_plantsim(FakeModel(tables={str(TABLE): make_table("integer")}))
+    view = plantsim.table_view(TABLE, page_rows=1, max_pages=2)
+
+    view[0], view[1], view[0], view[2]
+
+    assert (view.hits, view.misses, view.cached_pages) == (1, 3, 2)
+    with pytest.raises(IndexError):
+        view[3]
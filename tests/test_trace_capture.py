@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+from plantsimpath import PlantsimPath
+import pytest
+
+from pyplantsim import Plantsim
+from pyplantsim import TraceSpec
+from pyplantsim.backends import FakeBackend
+from pyplantsim.backends import FakeModel
+from pyplantsim.instance_handler import FixedInstanceHandler
+from pyplantsim.instance_handler import SimulationJob
+from pyplantsim.trace_capture import TraceCapture
+
+from .test_instance_handler import shutdown_in_time
+
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+STATION = PlantsimPath(".Models.Model.Station")
+
+
+def make_model() -> FakeModel:
+    return FakeModel(values={str(PlantsimPath(STATION, "NumMU")): 0})
+
+
+def move_units(plantsim: Plantsim, count: int) -> None:
+    for i in range(count):
+        plantsim._instance._write(str(PlantsimPath(STATION, "NumMU")), (i + 1) % 2)
+
+
+def test_close_writes_every_record(
+    make_plantsim: Callable[[FakeModel], Plantsim], tmp_path: Path
+) -> None:
+    plantsim = make_plantsim(make_model())
+    target = tmp_path / "trace.parquet"
+
+    with plantsim.start_trace([STATION], target, batch_size=4):
+        move_units(plantsim, 10)
+
+    assert pq.read_table(target).num_rows == 10
+
+
+def test_stop_finishes_open_trace(tmp_path: Path) -> None:
+    model_file = tmp_path / "test.spp"
+    model_file.touch()
+    target = tmp_path / "trace.parquet"
+    model = make_model()
+
+    with Plantsim(
+        backend=FakeBackend(model_factory=lambda _: model), event_polling_interval=0.001
+    ) as plantsim:
+        plantsim.load_model(str(model_file))
+        plantsim.set_network(PlantsimPath(".Models.Model"), set_event_controller=True)
+        plantsim.start_trace([STATION], target, batch_size=4)
+        move_units(plantsim, 6)
+
+    assert pq.read_table(target).num_rows == 6
+
+
+def test_failing_trace_close_still_finishes_job(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def fail_close(self: TraceCapture) -> None:
+        raise RuntimeError("failed")
+
+    monkeypatch.setattr(TraceCapture, "close", fail_close)
+    model_file = tmp_path / "test.spp"
+    model_file.touch()
+
+    def on_init(instance: Plantsim) -> None:
+        instance.load_model(str(model_file))
+        instance.set_network(PlantsimPath(".Models.Model"), set_event_controller=True)
+
+    model = make_model()
+    model.simulation_duration = 0.0
+    handler = FixedInstanceHandler(
+        1, backend=FakeBackend(model_factory=lambda _: model), event_polling_interval=0.001
+    ).initialize()
+    handler.queue_job(
+        SimulationJob(on_init=on_init, trace=TraceSpec([STATION], tmp_path / "traces"))
+    )
+
+    assert shutdown_in_time(handler)
+    assert handler.metrics_snapshot().jobs_failed == 1